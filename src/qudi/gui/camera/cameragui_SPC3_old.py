@@ -371,6 +371,9 @@ class CameraGui(GuiBase):
         self._continuous_acq_settings = None
         self._viewer_dialog = None
         self._snap_frames = None  # Store in-memory snap frames
+        # Latest live frame not yet drawn (see _update_frame)
+        self._pending_frame = None
+        self._paint_pending = False
 
     def on_activate(self):
         """Initializes all needed UI files and establishes the connectors."""
@@ -999,8 +1002,22 @@ class CameraGui(GuiBase):
         self.sigStartStopVideoToggled.emit(checked)
 
     def _update_frame(self, frame_data):
-        """ """
-        self._mw.image_widget.set_image(frame_data)
+        """Queue *frame_data* for display; only the newest queued frame is drawn.
+
+        Frames that arrive while a repaint is pending replace the pending one,
+        so a burst of queued frames costs one set_image call instead of one each.
+        """
+        self._pending_frame = frame_data
+        if not self._paint_pending:
+            self._paint_pending = True
+            QtCore.QTimer.singleShot(0, self._paint_frame)
+
+    def _paint_frame(self):
+        """Draw the frame stored by _update_frame."""
+        self._paint_pending = False
+        frame, self._pending_frame = self._pending_frame, None
+        if frame is not None and self._mw is not None:
+            self._mw.image_widget.set_image(frame)
 
     def _capture_background_clicked(self):
         """Handle capture background button click"""
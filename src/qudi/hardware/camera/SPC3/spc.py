@@ -28,10 +28,18 @@
 
 import os
 import sys
+import mmap
+import time
+import struct
 import platform
+import warnings
+import threading
 import numpy as np
 from ctypes import *
 import matplotlib.pyplot as plt
+from functools import cache
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 assert sys.version_info.major >= 3
 
@@ -40,6 +48,237 @@ SPC3_H = c_void_p
 # return type
 SPC3Return = c_int
 
+# ctypes prototypes of the SDK functions as (name, argtypes, restype), bound once per SPC3 instance
+_SPC3_BINDINGS = [
+    ('SPC3_Constr', [POINTER(SPC3_H), c_int, c_char_p], SPC3Return),
+    ('SPC3_Destr', [SPC3_H], SPC3Return),
+    ('SPC3_Set_Camera_Par', [SPC3_H, c_uint16, c_uint32, c_uint16, c_uint16, c_int, c_int, c_int], SPC3Return),
+    ('SPC3_Set_Camera_Par_SubArray', [SPC3_H, c_uint16, c_uint32, c_uint16, c_int, c_uint16], SPC3Return),
+    ('SPC3_Set_DeadTime', [SPC3_H, c_uint16], SPC3Return),
+    ('SPC3_Set_DeadTime_Correction', [SPC3_H, c_int], SPC3Return),
+    ('SPC3_Set_Advanced_Mode', [SPC3_H, c_int], SPC3Return),
+    ('SPC3_Set_Background_Img', [SPC3_H,
+                                 np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags='C_CONTIGUOUS')], SPC3Return),
+    ('SPC3_Set_Background_Subtraction', [SPC3_H, c_int], SPC3Return),
+    ('SPC3_Set_Gate_Mode', [SPC3_H, c_uint16, c_int], SPC3Return),
+    ('SPC3_Set_Gate_Values', [SPC3_H, c_int16, c_int16], SPC3Return),
+    ('SPC3_Set_DualGate', [SPC3_H, c_int, c_int, c_int, c_int, c_int], SPC3Return),
+    ('SPC3_Set_TripleGate', [SPC3_H, c_int, c_int, c_int, c_int, c_int, c_int, c_int], SPC3Return),
+    ('SPC3_Set_Coarse_Gate_Values', [SPC3_H, c_uint16, c_uint16, c_uint16], SPC3Return),
+    ('SPC3_Set_Trigger_Out_State', [SPC3_H, c_int], SPC3Return),
+    ('SPC3_Set_Sync_In_State', [SPC3_H, c_int, c_int], SPC3Return),
+    ('SPC3_Set_Live_Mode_ON', [SPC3_H], SPC3Return),
+    ('SPC3_Set_Live_Mode_OFF', [SPC3_H], SPC3Return),
+    ('SPC3_Set_FLIM_Par', [SPC3_H, c_uint16, c_uint16, c_int16, c_uint16, POINTER(c_int)], SPC3Return),
+    ('SPC3_Set_FLIM_State', [SPC3_H, c_int], SPC3Return),
+    ('SPC3_Apply_settings', [SPC3_H], SPC3Return),
+    ('SPC3_Get_Live_Img', [SPC3_H, np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags='C_CONTIGUOUS')], SPC3Return),
+    ('SPC3_Prepare_Snap', [SPC3_H], SPC3Return),
+    ('SPC3_Get_Snap', [SPC3_H], SPC3Return),
+    ('SPC3_Get_Image_Buffer', [SPC3_H, POINTER(c_void_p), POINTER(c_int)], SPC3Return),
+    ('SPC3_Get_Img_Position', [SPC3_H,
+                               np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags='C_CONTIGUOUS'),
+                               c_uint32,
+                               c_uint16], SPC3Return),
+    ('SPC3_Start_ContAcq', [SPC3_H, c_char_p], SPC3Return),
+    ('SPC3_Get_Memory', [SPC3_H, POINTER(c_double)], SPC3Return),
+    ('SPC3_Stop_ContAcq', [SPC3_H], SPC3Return),
+    ('SPC3_Start_ContAcq_in_Memory', [SPC3_H], SPC3Return),
+    ('SPC3_Get_Memory_Buffer', [SPC3_H, POINTER(c_double), POINTER(c_void_p)], SPC3Return),
+    ('SPC3_Stop_ContAcq_in_Memory', [SPC3_H], SPC3Return),
+    ('SPC3_Get_DeadTime', [SPC3_H, c_uint16, POINTER(c_uint16)], SPC3Return),
+    ('SPC3_Get_GateWidth', [SPC3_H, c_uint16, c_int16, POINTER(c_double)], SPC3Return),
+    ('SPC3_Get_GateShift', [SPC3_H, c_uint16, c_int16, POINTER(c_int16)], SPC3Return),
+    ('SPC3_Is16Bit', [SPC3_H, POINTER(c_short)], SPC3Return),
+    ('SPC3_IsTriggered', [SPC3_H, POINTER(c_short)], SPC3Return),
+    ('SPC3_GetVersion', [SPC3_H, POINTER(c_double), POINTER(c_double), c_char_p], SPC3Return),
+    ('SPC3_GetSerial', [SPC3_H, c_char_p, c_char_p], SPC3Return),
+    ('SPC3_Save_Img_Disk', [SPC3_H, c_uint32, c_uint32, c_char_p, c_int], SPC3Return),
+    ('SPC3_Save_Averaged_Img_Disk', [SPC3_H, c_uint16, c_char_p, c_int, c_short], SPC3Return),
+    ('SPC3_Save_FLIM_Disk', [SPC3_H, c_char_p, c_int], SPC3Return),
+    ('SPC3_ReadSPC3FileFormatImage', [c_char_p,
+                                      c_uint32,
+                                      c_uint16,
+                                      np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags='C_CONTIGUOUS'),
+                                      c_char_p], SPC3Return),
+    ('SPC3_Average_Img', [SPC3_H,
+                          np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags='C_CONTIGUOUS'),
+                          c_uint16], SPC3Return),
+    ('SPC3_StDev_Img', [SPC3_H,
+                        np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags='C_CONTIGUOUS'),
+                        c_uint16], SPC3Return),
+    ('SPC3_Set_Correlation_Mode', [SPC3_H, c_int, c_int, c_int], SPC3Return),
+    ('SPC3_Correlation_Img', [SPC3_H, c_uint16], SPC3Return),
+    ('SPC3_Save_Correlation_Img', [SPC3_H, c_char_p], SPC3Return),
+]
+
+# layout of the 8 byte signature and 1024 byte metadata header of .spc3/.hrm data files (see SPC3.SaveImgDisk()),
+# decoded in a single unpack call. Unused ranges are skipped as padding, _SPC3_HEADER_FIELDS names the decoded values.
+_SPC3_HEADER_STRUCT = struct.Struct('<8s10s32sHB20s35x'
+                                    'BBBBHHBBHBBIBBHBBHH72x'
+                                    'BHHIH9x'
+                                    'BhBBBHHH'
+                                    'BHHBHHBHH53x'
+                                    'BHHH717x')
+_SPC3_HEADER_FIELDS = ('signature', 'camera_id', 'SN', 'FW_VER', 'custom_ver', 'date_time', 'N_rows', 'N_cols',
+                       'bit_x_pix', 'N_counters', 'HwIntTime', 'SummedFrames', 'DeadTimeCorrectionON', 'GateDuty_C1',
+                       'HoldOff', 'BKGsubON', 'C1_2_signed', 'N_frames', 'ImgAveraged', 'Caveraged', 'N_ave',
+                       'GateDuty_C2', 'GateDuty_C3', 'Frames_x_syncIn', 'N_pix', 'FLIM_ON', 'FLIM_shift_pct',
+                       'FLIM_steps', 'FLIM_frameLen', 'FLIM_binWidth', 'MultiGate_mode', 'MultiGate_start_pos',
+                       'MultiGate_widthC1', 'MultiGate_widthC2', 'MultiGate_widthC3', 'MultiGate_gapC1_2',
+                       'MultiGate_gapC2_3', 'MultiGate_binWidth', 'CoarseGate_C1_ON', 'CoarseGate_C1_startPos',
+                       'CoarseGate_C1_stopPos', 'CoarseGate_C2_ON', 'CoarseGate_C2_startPos', 'CoarseGate_C2_stopPos',
+                       'CoarseGate_C3_ON', 'CoarseGate_C3_startPos', 'CoarseGate_C3_stopPos', 'PDE_ON', 'PDE_startWave',
+                       'PDE_stopWave', 'PDE_step')
+assert _SPC3_HEADER_STRUCT.size == 8 + 1024
+assert len(_SPC3_HEADER_FIELDS) == len(_SPC3_HEADER_STRUCT.unpack(bytes(_SPC3_HEADER_STRUCT.size)))
+
+
+@dataclass
+class SPC3FileHeader:
+    """Decoded metadata header of .spc3/.hrm data files. Times and wavelengths are in SI units."""
+    camera_id: str = ''
+    SN: str = ''
+    FW_VER: float = 0.0
+    custom_ver: str = 'A'
+    date_time: str = ''
+    N_rows: int = 0
+    N_cols: int = 0
+    bit_x_pix: int = 0
+    N_counters: int = 0
+    HwIntTime: float = 0.0
+    SummedFrames: int = 0
+    DeadTimeCorrectionON: bool = False
+    GateDuty_C1: int = 0
+    HoldOff: float = 0.0
+    BKGsubON: bool = False
+    C1_2_signed: bool = False
+    N_frames: int = 0
+    ImgAveraged: bool = False
+    Caveraged: int = 0
+    N_ave: int = 0
+    GateDuty_C2: int = 0
+    GateDuty_C3: int = 0
+    Frames_x_syncIn: int = 0
+    N_pix: int = 0
+    FLIM_ON: bool = False
+    FLIM_shift_pct: int = 0
+    FLIM_steps: int = 0
+    FLIM_frameLen: float = 0.0
+    FLIM_binWidth: float = 0.0
+    MultiGate_mode: int = 0
+    MultiGate_start_pos: int = 0
+    MultiGate_widthC1: int = 0
+    MultiGate_widthC2: int = 0
+    MultiGate_widthC3: int = 0
+    MultiGate_gapC1_2: int = 0
+    MultiGate_gapC2_3: int = 0
+    MultiGate_binWidth: float = 0.0
+    CoarseGate_C1_ON: bool = False
+    CoarseGate_C1_startPos: float = 0.0
+    CoarseGate_C1_stopPos: float = 0.0
+    CoarseGate_C2_ON: bool = False
+    CoarseGate_C2_startPos: float = 0.0
+    CoarseGate_C2_stopPos: float = 0.0
+    CoarseGate_C3_ON: bool = False
+    CoarseGate_C3_startPos: float = 0.0
+    CoarseGate_C3_stopPos: float = 0.0
+    PDE_ON: bool = False
+    PDE_startWave: float = 0.0
+    PDE_stopWave: float = 0.0
+    PDE_step: float = 0.0
+
+
+def _decode_spc3_header(buf):
+    """Decode the signature and metadata header at the start of buf into a SPC3FileHeader."""
+    h = dict(zip(_SPC3_HEADER_FIELDS, _SPC3_HEADER_STRUCT.unpack_from(buf)))
+
+    header = SPC3FileHeader()
+
+    header.camera_id = h['camera_id'].split(b'\0', 1)[0].decode('utf-8')
+
+    header.SN = h['SN'].split(b'\0', 1)[0].decode('utf-8')
+
+    header.FW_VER = h['FW_VER'] / 100
+    header.custom_ver = chr(h['custom_ver'] + ord('A'))  # 0 = A, 1 = B, etc
+    header.date_time = h['date_time'].split(b'\0', 1)[0].decode('utf-8')
+
+    header.N_rows = h['N_rows']
+    header.N_cols = h['N_cols']
+    header.bit_x_pix = h['bit_x_pix']
+    header.N_counters = h['N_counters']
+    header.HwIntTime = h['HwIntTime'] * 10e-9
+    header.SummedFrames = h['SummedFrames']
+    header.DeadTimeCorrectionON = h['DeadTimeCorrectionON'] != 0
+    header.GateDuty_C1 = h['GateDuty_C1']
+    header.HoldOff = h['HoldOff'] * 1e-9
+    header.BKGsubON = h['BKGsubON'] != 0
+    header.C1_2_signed = h['C1_2_signed'] != 0
+    header.N_frames = h['N_frames']
+    header.ImgAveraged = h['ImgAveraged'] != 0
+    header.Caveraged = h['Caveraged']
+    header.N_ave = h['N_ave']
+    header.GateDuty_C2 = h['GateDuty_C2']
+    header.GateDuty_C3 = h['GateDuty_C3']
+    header.Frames_x_syncIn = h['Frames_x_syncIn']
+    header.N_pix = h['N_pix']
+
+    header.FLIM_ON = h['FLIM_ON'] != 0
+    header.FLIM_shift_pct = h['FLIM_shift_pct']
+    header.FLIM_steps = h['FLIM_steps']
+    header.FLIM_frameLen = h['FLIM_frameLen'] * 10e-9
+    header.FLIM_binWidth = h['FLIM_binWidth'] * 1e-15
+
+    header.MultiGate_mode = h['MultiGate_mode']
+    header.MultiGate_start_pos = h['MultiGate_start_pos']
+    header.MultiGate_widthC1 = h['MultiGate_widthC1']
+    header.MultiGate_widthC2 = h['MultiGate_widthC2']
+    header.MultiGate_widthC3 = h['MultiGate_widthC3']
+    header.MultiGate_gapC1_2 = h['MultiGate_gapC1_2']
+    header.MultiGate_gapC2_3 = h['MultiGate_gapC2_3']
+    header.MultiGate_binWidth = h['MultiGate_binWidth'] * 1e-15
+
+    header.CoarseGate_C1_ON = h['CoarseGate_C1_ON'] != 0
+    header.CoarseGate_C1_startPos = h['CoarseGate_C1_startPos'] * 10e-9
+    header.CoarseGate_C1_stopPos = h['CoarseGate_C1_stopPos'] * 10e-9
+    header.CoarseGate_C2_ON = h['CoarseGate_C2_ON'] != 0
+    header.CoarseGate_C2_startPos = h['CoarseGate_C2_startPos'] * 10e-9
+    header.CoarseGate_C2_stopPos = h['CoarseGate_C2_stopPos'] * 10e-9
+    header.CoarseGate_C3_ON = h['CoarseGate_C3_ON'] != 0
+    header.CoarseGate_C3_startPos = h['CoarseGate_C3_startPos'] * 10e-9
+    header.CoarseGate_C3_stopPos = h['CoarseGate_C3_stopPos'] * 10e-9
+
+    header.PDE_ON = h['PDE_ON'] != 0
+    header.PDE_startWave = h['PDE_startWave'] * 1e-9
+    header.PDE_stopWave = h['PDE_stopWave'] * 1e-9
+    header.PDE_step = h['PDE_step'] * 1e-9
+
+    return header
+
+
+@cache
+def _make_buffer_to_frames(num_pixels, num_counters, row_size):
+    """Return a function converting flat buffers to frames like SPC3.BufferToFrames(), specialised for a fixed geometry.
+    All shape arithmetic is done here once, so the returned function is a bare reshape and transpose. Geometries which
+    need padding fall back to SPC3.BufferToFrames(). The few geometries of the camera are cached, so switching between
+    settings does not build new functions.
+    """
+    if num_pixels == 0 or num_pixels % row_size != 0:
+        return lambda data: SPC3.BufferToFrames(data, num_pixels, num_counters)
+    shape = (-1, num_counters, num_pixels // row_size, row_size)
+    return lambda data: data.reshape(shape).transpose(1, 0, 3, 2)
+
+
+@cache
+def _make_buffer_to_frame(num_pixels, row_size):
+    """Return a function converting the first image in a flat single-counter buffer to a 2-d (cols, rows) frame.
+    Unlike _make_buffer_to_frames(), no frame and counter dimensions are created just to be indexed away again.
+    """
+    if num_pixels == 0 or num_pixels % row_size != 0:
+        return lambda data: SPC3.BufferToFrames(data[:num_pixels], num_pixels, 1)[0][0]
+    shape = (num_pixels // row_size, row_size)
+    return lambda data: data[:num_pixels].reshape(shape).T
+
 
 class SPC3Error(Exception):
     _err_dict = {
@@ -61,9 +300,8 @@ class SPC3Error(Exception):
         - 18: 'SPC3_MEMORY_FULL'}
 
     def __init__(self, ec):
-        if ec in self._err_dict.keys():
-            message = self._err_dict[ec]
-        else:
+        message = self._err_dict.get(ec)
+        if message is None:
             message = 'UNEXPECTED ERROR (error code is {})'.format(str(ec))
         super().__init__(message)
 
@@ -120,8 +358,19 @@ class SPC3(object):
         else:
             raise NotImplementedError('Unsupported platform')
 
+        # held by the SDK calls that use the snap buffer, so they never run during a background save (see
+        # SaveImgDiskAsync()). Other calls cannot race the save worker and do not take it.
+        self._snap_buf_lock = threading.RLock()
+        self._bind_functions()
+
         self.c_handle = SPC3_H()
 
+        # reusable buffer for file names passed to the SDK (max. 1024 characters plus terminating null)
+        self._fname_buf = create_string_buffer(1025)
+        self._last_encoded = (None, None)  # (filename, encoded filename) of the last _encode() call
+        # single worker thread for background saves, so they are written one after the other
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='SPC3_save')
+
         # SDK constructor
         self.Constr(mode, Device_ID)
 
@@ -132,9 +381,26 @@ class SPC3(object):
         self.row_size = 32  # number of rows in the output data
         self._data_is_signed = False  # true if output data is signed
         self._num_pixels = 0
+        self._strict_checks = False  # if True, cross-check the data depth reported by the SDK on every readout
 
         self._num_rows = 64
 
+        # buffer sizes, fixed by the settings and recomputed by ApplySettings()
+        self._live_buf_count = self.row_size * self._num_rows * self._num_counters  # elements
+        self._snap_buf_count = 0  # elements
+        self._snap_buf_bytes = 0
+
+        # reusable output buffers of AverageImg(), StDevImg() and ReadHermesFileFormatImage()
+        self._avg_buf = np.empty(self.row_size * self._num_rows, dtype=np.float64)
+        self._stdev_buf = np.empty(self.row_size * self._num_rows, dtype=np.float64)
+        self._read_img_buf = np.empty(self.row_size * self._num_rows, dtype=np.uint16)
+        self._read_header_buf = (c_char * 1024)()
+
+        # buffer-to-frames conversions specialised for the current geometry, rebuilt by ApplySettings()
+        self._to_frames = _make_buffer_to_frames(self._num_pixels, self._num_counters, self.row_size)
+        self._to_counter_frames = _make_buffer_to_frames(self._num_pixels, 1, self.row_size)
+        self._to_single_frame = _make_buffer_to_frame(self._num_pixels, self.row_size)
+
     @property
     def num_pixels(self):
         return self._num_pixels
@@ -146,10 +412,30 @@ class SPC3(object):
     def __del__(self):
         self.Destr()
 
+    def _bind_functions(self):
+        """Configure the ctypes prototypes of all SDK functions once and store them as self._fn_<name>."""
+        for name, argtypes, restype in _SPC3_BINDINGS:
+            f = getattr(self.dll, name)
+            f.argtypes = argtypes
+            f.restype = restype
+            setattr(self, '_fn_' + name, f)
+
     def _checkError(self, ec):
-        if ec != 0:
+        if ec:
             raise SPC3Error(ec)
 
+    def _encode(self, filename):
+        """Return filename as UTF-8 bytes for the SDK. Bytes are passed through, and the encoding of the last
+        filename is reused, so repeated saves to the same file do not allocate a new bytes object per call.
+        """
+        if isinstance(filename, (bytes, bytearray)):
+            return filename
+        last, encoded = self._last_encoded
+        if filename is not last and filename != last:
+            encoded = filename.encode('utf-8')
+            self._last_encoded = (filename, encoded)
+        return encoded
+
     def Constr(self, mode, Device_ID):
         """Constr - Constructor.
         It allocates a memory block to contain all the information and buffers required by the Hermes. If multiple devices are connected to the computer,
@@ -165,11 +451,8 @@ class SPC3(object):
             FIRMWARE_NOT_COMPATIBLE The SDK and Firmware versions are not compatible
             NOT_EN_MEMORY There is not enough memory to run the camera
         """
-        f = self.dll.SPC3_Constr
-        f.argtypes = [POINTER(SPC3_H), c_int, c_char_p]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesConstr(Hermes_H* Hermes_in, CameraMode m, char* Device_ID);
-        ec = f(byref(self.c_handle), mode, Device_ID.encode('utf-8'))
+        ec = self._fn_SPC3_Constr(byref(self.c_handle), mode, Device_ID.encode('utf-8'))
         self._checkError(ec)
         return
 
@@ -183,11 +466,10 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
         """
-        f = self.dll.SPC3_Destr
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
+        # pending background saves still need the handle
+        self._io_pool.shutdown(wait=True)
         #  DllSDKExport HermesReturn HermesDestr(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        ec = self._fn_SPC3_Destr(self.c_handle)
         self._checkError(ec)
         return
 
@@ -212,11 +494,9 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             OUT_OF_BOUND Exposure, NFrames and NIntegFrames must be all greater than zero and smaller than 65535
         """
-        f = self.dll.SPC3_Set_Camera_Par
-        f.argtypes = [SPC3_H, c_uint16, c_uint32, c_uint16, c_uint16, c_int, c_int, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetCameraPar(Hermes_H Hermes, uint16_t Exposure, uint32_t NFrames, uint16_t NIntegFrames, uint16_t NCounters, State Force8bit, State Half_array, State Signed_data);
-        ec = f(self.c_handle, Exposure, NFrames, NIntegFrames, NCounters, Force8bit, Half_array, Signed_data)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Set_Camera_Par(self.c_handle, Exposure, NFrames, NIntegFrames, NCounters, Force8bit, Half_array, Signed_data)
         self._checkError(ec)
 
         # keep record of settings
@@ -258,11 +538,9 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             OUT_OF_BOUND Exposure, NFrames, NIntegFrames or NPixels out of bound.
         """
-        f = self.dll.SPC3_Set_Camera_Par_SubArray
-        f.argtypes = [SPC3_H, c_uint16, c_uint32, c_uint16, c_int, c_uint16]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetCameraParSubArray(Hermes_H Hermes, uint16_t Exposure, uint32_t NFrames, uint16_t NIntegFrames, State Force8bit, uint16_t Npixels);
-        ec = f(self.c_handle, Exposure, NFrames, NIntegFrames, Force8bit, Npixels)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Set_Camera_Par_SubArray(self.c_handle, Exposure, NFrames, NIntegFrames, Force8bit, Npixels)
         self._checkError(ec)
 
         # keep record of settings
@@ -287,11 +565,8 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             INVALID_OP Unable to change the dead-time when the live-mode is ON
         """
-        f = self.dll.SPC3_Set_DeadTime
-        f.argtypes = [SPC3_H, c_uint16]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetDeadTime(Hermes_H Hermes, uint16_t Val);
-        ec = f(self.c_handle, Val)
+        ec = self._fn_SPC3_Set_DeadTime(self.c_handle, Val)
         self._checkError(ec)
         return
 
@@ -304,11 +579,8 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
         """
-        f = self.dll.SPC3_Set_DeadTime_Correction
-        f.argtypes = [SPC3_H, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetDeadTimeCorrection(Hermes_H Hermes, State s);
-        ec = f(self.c_handle, s)
+        ec = self._fn_SPC3_Set_DeadTime_Correction(self.c_handle, s)
         self._checkError(ec)
         return
 
@@ -321,11 +593,8 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
         """
-        f = self.dll.SPC3_Set_Advanced_Mode
-        f.argtypes = [SPC3_H, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetAdvancedMode(Hermes_H Hermes, State s);
-        ec = f(self.c_handle, s)
+        ec = self._fn_SPC3_Set_Advanced_Mode(self.c_handle, s)
         self._checkError(ec)
         return
 
@@ -339,13 +608,9 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H or Img point to an empty memory location
             INVALID_OP Unable to set the background image when the live-mode is ON
         """
-        f = self.dll.SPC3_Set_Background_Img
-        f.argtypes = [SPC3_H,
-                      np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags='C_CONTIGUOUS')]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetBackgroundImg(Hermes_H Hermes, uint16_t* Img);
         data = Img.flatten().astype(np.uint16)
-        ec = f(self.c_handle, data)
+        ec = self._fn_SPC3_Set_Background_Img(self.c_handle, data)
         self._checkError(ec)
         return
 
@@ -358,11 +623,8 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
         """
-        f = self.dll.SPC3_Set_Background_Subtraction
-        f.argtypes = [SPC3_H, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetBackgroundSubtraction(Hermes_H Hermes, State s);
-        ec = f(self.c_handle, s)
+        ec = self._fn_SPC3_Set_Background_Subtraction(self.c_handle, s)
         self._checkError(ec)
         return
 
@@ -377,11 +639,8 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             INVALID_OP Only counter 1 can be set to Pulsed mode, for fast gating also counter 2 and 3 refers to HermesSetDualGate() and HermesSetTripleGate() functions.
         """
-        f = self.dll.SPC3_Set_Gate_Mode
-        f.argtypes = [SPC3_H, c_uint16, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetGateMode(Hermes_H Hermes, uint16_t counter, GateMode Mode);
-        ec = f(self.c_handle, counter, Mode)
+        ec = self._fn_SPC3_Set_Gate_Mode(self.c_handle, counter, Mode)
         self._checkError(ec)
         return
 
@@ -397,11 +656,8 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             OUT_OF_BOUND Shift or length are outside the valid values
         """
-        f = self.dll.SPC3_Set_Gate_Values
-        f.argtypes = [SPC3_H, c_int16, c_int16]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetGateValues(Hermes_H Hermes, int16_t Shift, int16_t Length);
-        ec = f(self.c_handle, Shift, Length)
+        ec = self._fn_SPC3_Set_Gate_Values(self.c_handle, Shift, Length)
         self._checkError(ec)
         return
 
@@ -421,11 +677,8 @@ class SPC3(object):
             INVALID_OP This mode is not compatible with FLIM mode.
             OUT_OF_RANGE Parameters are out of bound. Please note that the function not only checks if the single parameters are acceptable, but also checks if the combination of parameters would result in an invalid gate
         """
-        f = self.dll.SPC3_Set_DualGate
-        f.argtypes = [SPC3_H, c_int, c_int, c_int, c_int, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetDualGate(Hermes_H Hermes, State DualGate_State, int StartShift, int FirstGateWidth, int SecondGateWidth, int Gap);
-        ec = f(self.c_handle, DualGate_State, StartShift, FirstGateWidth, SecondGateWidth, Gap)
+        ec = self._fn_SPC3_Set_DualGate(self.c_handle, DualGate_State, StartShift, FirstGateWidth, SecondGateWidth, Gap)
         self._checkError(ec)
         return
 
@@ -448,11 +701,8 @@ class SPC3(object):
             INVALID_OP This mode is not compatible with FLIM mode.
             OUT_OF_RANGE Parameters are out of bound. Please note that the function not only checks if the single parameters are acceptable, but also checks if the combination of parameters would result in an invalid gate
         """
-        f = self.dll.SPC3_Set_TripleGate
-        f.argtypes = [SPC3_H, c_int, c_int, c_int, c_int, c_int, c_int, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetTripleGate(Hermes_H Hermes, State TripleGate_State, int StartShift, int FirstGateWidth, int SecondGateWidth, int ThirdGateWidth, int Gap1, int Gap2);
-        ec = f(self.c_handle, TripleGate_State, StartShift, FirstGateWidth, SecondGateWidth, ThirdGateWidth, Gap1, Gap2)
+        ec = self._fn_SPC3_Set_TripleGate(self.c_handle, TripleGate_State, StartShift, FirstGateWidth, SecondGateWidth, ThirdGateWidth, Gap1, Gap2)
         self._checkError(ec)
         return
 
@@ -470,11 +720,8 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             OUT_OF_BOUND Start or Stop are outside the valid values
         """
-        f = self.dll.SPC3_Set_Coarse_Gate_Values
-        f.argtypes = [SPC3_H, c_uint16, c_uint16, c_uint16]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetCoarseGateValues(Hermes_H Hermes, uint16_t Counter, uint16_t Start, uint16_t Stop);
-        ec = f(self.c_handle, Counter, Start, Stop)
+        ec = self._fn_SPC3_Set_Coarse_Gate_Values(self.c_handle, Counter, Start, Stop)
         self._checkError(ec)
         return
 
@@ -486,11 +733,8 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
         """
-        f = self.dll.SPC3_Set_Trigger_Out_State
-        f.argtypes = [SPC3_H, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetTriggerOutState(Hermes_H Hermes, TriggerMode Mode);
-        ec = f(self.c_handle, Mode)
+        ec = self._fn_SPC3_Set_Trigger_Out_State(self.c_handle, Mode)
         self._checkError(ec)
         return
 
@@ -504,11 +748,8 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
         """
-        f = self.dll.SPC3_Set_Sync_In_State
-        f.argtypes = [SPC3_H, c_int, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetSyncInState(Hermes_H Hermes, State s, int frames);
-        ec = f(self.c_handle, s, frames)
+        ec = self._fn_SPC3_Set_Sync_In_State(self.c_handle, s, frames)
         self._checkError(ec)
         return
 
@@ -525,11 +766,8 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             INVALID_OP The live mode has been already started
         """
-        f = self.dll.SPC3_Set_Live_Mode_ON
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesLiveSetModeON(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        ec = self._fn_SPC3_Set_Live_Mode_ON(self.c_handle)
         self._checkError(ec)
         return
 
@@ -543,11 +781,8 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             INVALID_OP The live mode is already inactive
         """
-        f = self.dll.SPC3_Set_Live_Mode_OFF
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesLiveSetModeOFF(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        ec = self._fn_SPC3_Set_Live_Mode_OFF(self.c_handle)
         self._checkError(ec)
         return
 
@@ -570,12 +805,9 @@ class SPC3(object):
             OUT_OF_BOUND Parameters are out of bound. Please note that the function not only checks if the single parameters are acceptable, but also checks if the combination of parameters would result in an invalid gate
 
         """
-        f = self.dll.SPC3_Set_FLIM_Par
-        f.argtypes = [SPC3_H, c_uint16, c_uint16, c_int16, c_uint16, POINTER(c_int)]
-        f.restype = SPC3Return
         FLIM_frame_time = c_int(0)
         #  DllSDKExport HermesReturn HermesSetFlimPar(Hermes_H Hermes, uint16_t FLIM_steps, uint16_t FLIM_shift, int16_t FLIM_start, uint16_t Length, int* FLIM_frame_time);
-        ec = f(self.c_handle, FLIM_steps, FLIM_shift, FLIM_start, Length, byref(FLIM_frame_time))
+        ec = self._fn_SPC3_Set_FLIM_Par(self.c_handle, FLIM_steps, FLIM_shift, FLIM_start, Length, byref(FLIM_frame_time))
         self._checkError(ec)
 
         # keep record of settings
@@ -593,11 +825,8 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location.
             INVALID_OP Exposure time is lower than 1040.
         """
-        f = self.dll.SPC3_Set_FLIM_State
-        f.argtypes = [SPC3_H, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetFlimState(Hermes_H Hermes, State FLIM_State);
-        ec = f(self.c_handle, FLIM_State)
+        ec = self._fn_SPC3_Set_FLIM_State(self.c_handle, FLIM_State)
         self._checkError(ec)
         return
 
@@ -611,11 +840,9 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
         """
-        f = self.dll.SPC3_Apply_settings
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesApplySettings(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Apply_settings(self.c_handle)
         self._checkError(ec)
 
         # record data depth here
@@ -625,6 +852,13 @@ class SPC3(object):
         else:
             self._data_bits = 8
 
+        # the buffer geometry is constant until the next ApplySettings()
+        self._live_buf_count = self.row_size * self._num_rows * self._num_counters
+        self._snap_buf_count = (self._snap_num_frames or 0) * self._num_pixels * self._num_counters
+        self._snap_buf_bytes = self._snap_buf_count * self._data_bits // 8
+        self._to_frames = _make_buffer_to_frames(self._num_pixels, self._num_counters, self.row_size)
+        self._to_counter_frames = _make_buffer_to_frames(self._num_pixels, 1, self.row_size)
+        self._to_single_frame = _make_buffer_to_frame(self._num_pixels, self.row_size)
         return
 
     def LiveGetImg(self):
@@ -639,18 +873,15 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H or Img point to an empty memory location
             INVALID_OP The live-mode has not been started yet
         """
-        f = self.dll.SPC3_Get_Live_Img
-        f.argtypes = [SPC3_H,
-                      np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags='C_CONTIGUOUS')
-                      ]
-        f.restype = SPC3Return
 
-        data = np.zeros(self.row_size * self._num_rows * self._num_counters, dtype=np.uint16)
+        # the SDK always writes uint16_t pixels here, even when _data_bits == 8, so the buffer can not be narrowed
+        data = np.empty(self._live_buf_count, dtype=np.uint16)
+        data[self._num_pixels * self._num_counters:] = 0  # the SDK only writes the active pixels, no-op for full frames
         #  DllSDKExport HermesReturn HermesLiveGetImg(Hermes_H Hermes, uint16_t* Img);
-        ec = f(self.c_handle, data)
+        ec = self._fn_SPC3_Get_Live_Img(self.c_handle, data)
         self._checkError(ec)
 
-        frames = self.BufferToFrames(data, self._num_pixels, self._num_counters)
+        frames = self._to_frames(data)
         return frames[0]  # we always have data of only frame [0] for all counters
 
     def SnapPrepare(self):
@@ -666,11 +897,9 @@ class SPC3(object):
             INVALID_OP Unable to acquire images when the live mode is ON. Use instead HermesLiveGetImg().
             INVALID_OP When the background subtraction, dead-time correction or normal acquisition mode are enabled,
         """
-        f = self.dll.SPC3_Prepare_Snap
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSnapPrepare(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Prepare_Snap(self.c_handle)
         self._checkError(ec)
         return
 
@@ -689,11 +918,9 @@ class SPC3(object):
             INVALID_OP Unable to acquire images when the live mode is ON. Use instead HermesLiveGetImg().
             INVALID_OP When the background subtraction, dead-time correction or normal acquisition mode are enabled,
         """
-        f = self.dll.SPC3_Get_Snap
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSnapAcquire(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Get_Snap(self.c_handle)
         self._checkError(ec)
         return
 
@@ -705,58 +932,77 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H or BUFFER_H point to an empty memory location
         """
-        size = self._snap_num_frames * self._data_bits // 8 * self._num_pixels * self._num_counters
-        buf = POINTER(c_uint8)()
+        buf = c_void_p()
         DataDepth = c_int(0)
 
-        f = self.dll.SPC3_Get_Image_Buffer
-        f.argtypes = [SPC3_H,
-                      POINTER(POINTER(c_uint8)),
-                      POINTER(c_int)]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSnapGetImageBuffer(Hermes_H Hermes, BUFFER_H* buffer, int* DataDepth);
-        ec = f(self.c_handle,
-               byref(buf),
-               byref(DataDepth))
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Get_Image_Buffer(self.c_handle,
+                                                byref(buf),
+                                                byref(DataDepth))
         self._checkError(ec)
 
-        # if required, cast the buffer pointer from uint8_t* to uint16_t*
-        assert self._data_bits == DataDepth.value
-        if DataDepth.value == 16:
-            buf = cast(buf, POINTER(c_uint16))
-            count = size // 2
-        else:
-            count = size
-        data = np.ctypeslib.as_array(buf, shape=(count,))  # automatically deduces dtype from c_types POINTER(c_xyz)
+        # the data depth is recorded by ApplySettings(), only cross-check it on request
+        if self._strict_checks and self._data_bits != DataDepth.value:
+            raise ValueError('SDK reports {} bit data, expected {} bit'.format(DataDepth.value, self._data_bits))
+
+        # wrap the SDK buffer without copying, reading the pixels as uint16 if required
+        if not buf.value:
+            raise SPC3Error(-10)  # NULL_POINTER
+        raw = (c_uint8 * self._snap_buf_bytes).from_address(buf.value)
+        data = np.frombuffer(raw, dtype=np.uint16 if self._data_bits == 16 else np.uint8)
 
-        frames = self.BufferToFrames(data, self._num_pixels, self._num_counters)
+        frames = self._to_frames(data)
         return frames
 
-    def SnapGetImgPosition(self, Position, counter):
+    def SnapGetAllImages(self, counter=None):
+        """SnapGetAllImages - Gets all images acquired in Snap mode with a single SDK call.
+        Prefer this over calling SnapGetImgPosition() for every position: the whole snap buffer is fetched once
+        and sliced per position, instead of one DLL call and one output allocation per image.
+
+        Parameters:
+            counter: Desired counter. Accepted values: 1 ... Number of used counters. None returns all counters.
+        Returns:
+            Frames with shape (counters, frames, cols, rows), or (frames, cols, rows) if counter is given.
+        Error codes:
+            NULL_POINTER The provided Hermes_H or BUFFER_H point to an empty memory location
+        """
+        frames = self.SnapGetImageBuffer()
+        if counter is None:
+            return frames
+        return frames[counter - 1]
+
+    def SnapGetImgPosition(self, Position, counter, out=None):
         """SnapGetImgPosition - Export an acquired image to an user allocated memory array.
         Once a set of images have been acquired by HermesSnapAcquire(), a single image can be exported from the SDK image buffer.
+        To read out all acquired images use SnapGetAllImages(), which needs a single SDK call for the whole snap.
 
         Parameters:
             Img: Pointer to the output image array. The size of the array must be at least 4kB.
             Position: Index of the image to save.  Accepted values: 1 ... Number of acquired images
             counter: Number of the desired counter. Accepted values: 1 ... Number of used counters
+            out: Optional preallocated 1-d uint16 array of row_size * num_rows elements, reused for reading several
+                images. The SDK writes the image directly into it and the returned image is a view of it. Its unused
+                tail beyond the active pixels is left untouched.
+        Returns:
+            The image as uint16 array. The SDK always exports 16-bit pixels here (8-bit data is zero-extended),
+            so the buffer matches the uint16_t* of the C signature instead of a 4x larger float64 array.
         Error codes:
             NULL_POINTER The provided Hermes_H or Img point to an empty memory location
             OUT_OF_BOUND Parameters are out of bound.
         """
-        data = np.zeros(self.row_size * self._num_rows, dtype=np.float64)
-
-        f = self.dll.SPC3_Get_Img_Position
-        f.argtypes = [SPC3_H,
-                      np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags='C_CONTIGUOUS'),
-                      c_uint32,
-                      c_uint16]
-        f.restype = SPC3Return
+        if out is None:
+            data = np.empty(self.row_size * self._num_rows, dtype=np.uint16)
+            data[self._num_pixels:] = 0  # the SDK only writes the active pixels, no-op for full frames
+        else:
+            data = out
+
         #  DllSDKExport HermesReturn HermesSnapGetImgPosition(Hermes_H Hermes, uint16_t* Img, uint32_t Position, uint16_t counter);
-        ec = f(self.c_handle, data, Position, counter)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Get_Img_Position(self.c_handle, data, Position, counter)
         self._checkError(ec)
 
-        frames = self.BufferToFrames(data, self._num_pixels, 1)  # expect data of just one counter!
+        frames = self._to_counter_frames(data)  # expect data of just one counter!
         return frames[0]  # strip away dimension of frame index
 
     def ContAcqToFileStart(self, filename):
@@ -770,11 +1016,13 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H or BUFFER_H point to an empty memory location
             UNABLE_CREATE_FILE It was not possible to create the output file.
         """
-        f = self.dll.SPC3_Start_ContAcq
-        f.argtypes = [SPC3_H, c_char_p]
-        f.restype = SPC3Return
+        fname = self._encode(filename)
+        if len(fname) > 1024:
+            raise ValueError('The file name must not exceed 1024 characters')
+        memmove(self._fname_buf, fname, len(fname))
+        self._fname_buf[len(fname)] = b'\0'
         #  DllSDKExport HermesReturn HermesContAcqToFileStart(Hermes_H Hermes, char* filename);
-        ec = f(self.c_handle, filename.encode('utf-8'))
+        ec = self._fn_SPC3_Start_ContAcq(self.c_handle, self._fname_buf)
         self._checkError(ec)
         return
 
@@ -796,12 +1044,9 @@ class SPC3(object):
             COMMUNICATION_ERROR Communication error during data download.
             Hermes_MEMORY_FULL Camera internal memory got full during data download. Data loss occurred. Reduce frame-rate or optimize your software to reduce dead-time between subsequent calling of the function.
         """
-        f = self.dll.SPC3_Get_Memory
-        f.argtypes = [SPC3_H, POINTER(c_double)]
-        f.restype = SPC3Return
         total_bytes = c_double(0)
         #  DllSDKExport HermesReturn HermesContAcqToFileGetMemory(Hermes_H Hermes, double* total_bytes);
-        ec = f(self.c_handle, byref(total_bytes))
+        ec = self._fn_SPC3_Get_Memory(self.c_handle, byref(total_bytes))
         self._checkError(ec)
         return int(total_bytes.value)
 
@@ -815,11 +1060,8 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H or BUFFER_H point to an empty memory location
             UNABLE_CREATE_FILE It was not possible to access the output file.
         """
-        f = self.dll.SPC3_Stop_ContAcq
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesContAcqToFileStop(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        ec = self._fn_SPC3_Stop_ContAcq(self.c_handle)
         self._checkError(ec)
         return
 
@@ -832,11 +1074,8 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H or BUFFER_H point to an empty memory location
         """
-        f = self.dll.SPC3_Start_ContAcq_in_Memory
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesContAcqToMemoryStart(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        ec = self._fn_SPC3_Start_ContAcq_in_Memory(self.c_handle)
         self._checkError(ec)
         return
 
@@ -851,28 +1090,74 @@ class SPC3(object):
             Hermes_MEMORY_FULL Camera internal memory got full during data download. Data loss occurred. Reduce frame-rate or optimize your software to reduce deadtime between subsequent calling of the function.
         """
 
-        buf = POINTER(c_uint8)()
+        buf = c_void_p()
         total_bytes = c_double()
 
-        f = self.dll.SPC3_Get_Memory_Buffer
-        f.argtypes = [SPC3_H,
-                      POINTER(c_double),
-                      POINTER(POINTER(c_uint8))]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesContAcqToMemoryGetBuffer(Hermes_H Hermes, double* total_bytes, BUFFER_H* buffer);
-        ec = f(self.c_handle, byref(total_bytes), byref(buf))
+        ec = self._fn_SPC3_Get_Memory_Buffer(self.c_handle, byref(total_bytes), byref(buf))
         self._checkError(ec)
 
+        dtype = np.uint16 if self._data_bits == 16 else np.uint8
         size = int(total_bytes.value)
-        if self._data_bits == 16:
-            buf = cast(buf, POINTER(c_uint16))
-            count = size // 2
-        else:
-            count = size
-        data = np.ctypeslib.as_array(buf, shape=(count,))  # automatically deduces dtype from c_types POINTER(c_xyz)
+        if size == 0 or not buf.value:
+            return np.empty(0, dtype=dtype)
+        data = np.frombuffer((c_uint8 * size).from_address(buf.value), dtype=dtype)
 
         return data
 
+    def ContAcqStreamToMemmap(self, path, max_bytes, timeout=60.0, poll_ms=10):
+        """ContAcqStreamToMemmap - Download a continuous acquisition straight into a disk-backed memory map.
+        The data of every SPC3_Get_Memory_Buffer call is copied from the SDK buffer directly into a preallocated
+        numpy.memmap, without creating intermediate numpy arrays. The OS page cache takes care of writing the data
+        to disk. ContAcqToMemoryStart() must be called before and ContAcqToMemoryStop() after this function.
+
+        Parameters:
+            path: Full path of the output file. The file is created or overwritten.
+            max_bytes: Number of bytes to download. The function returns once this amount was received.
+                Bytes of the last transfer beyond max_bytes are dropped with a warning.
+            timeout: Maximum time in seconds for the whole download. None waits indefinitely.
+            poll_ms: Waiting time in milliseconds before polling again when no new data was available.
+        Returns:
+            Raw data as uint8 numpy.memmap of length max_bytes.
+        Raises:
+            TimeoutError if fewer than max_bytes were received within timeout. The data received so far
+            is flushed to path.
+        Error codes:
+            NULL_POINTER The provided Hermes_H or BUFFER_H point to an empty memory location
+            INVALID_OP Continues acquisition was not yet started. Use HermesContAcqToMemoryStart() before calling this function.
+            COMMUNICATION_ERROR Communication error during data download.
+            Hermes_MEMORY_FULL Camera internal memory got full during data download. Data loss occurred.
+        """
+
+        mm = np.memmap(path, dtype=np.uint8, mode='w+', shape=(max_bytes,))
+        dst = mm.ctypes.data
+        buf = c_void_p()
+        total_bytes = c_double()
+        offset = 0
+        poll_s = poll_ms / 1000
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while offset < max_bytes:
+            #  DllSDKExport HermesReturn HermesContAcqToMemoryGetBuffer(Hermes_H Hermes, double* total_bytes, BUFFER_H* buffer);
+            ec = self._fn_SPC3_Get_Memory_Buffer(self.c_handle, byref(total_bytes), byref(buf))
+            self._checkError(ec)
+            received = int(total_bytes.value)
+            n = min(received, max_bytes - offset)
+            if n > 0 and buf.value:
+                memmove(dst + offset, buf.value, n)
+                offset += n
+                if received > n:
+                    warnings.warn('ContAcqStreamToMemmap: {} bytes beyond max_bytes={} dropped'.format(
+                        received - n, max_bytes))
+            else:
+                # nothing new in the SDK buffer: back off instead of spinning
+                time.sleep(poll_s)
+            if offset < max_bytes and deadline is not None and time.monotonic() > deadline:
+                mm.flush()
+                raise TimeoutError('ContAcqStreamToMemmap: received {} of {} bytes within {} s'.format(
+                    offset, max_bytes, timeout))
+        mm.flush()
+        return mm
+
     def ContAcqToMemoryStop(self):
         """ContAcqToMemoryStop - Stop the continuous acquisition of data. This function must be called at the end of the continuous acquisition. \b WARNING If not called, camera may have unexpected behavior if other functions are called.
 
@@ -882,11 +1167,8 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H point to an empty memory location
         """
-        f = self.dll.SPC3_Stop_ContAcq_in_Memory
-        f.argtypes = [SPC3_H]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesContAcqToMemoryStop(Hermes_H Hermes);
-        ec = f(self.c_handle)
+        ec = self._fn_SPC3_Stop_ContAcq_in_Memory(self.c_handle)
         self._checkError(ec)
         return
 
@@ -903,13 +1185,10 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H or ReturnVal point to an empty memory location
         """
-        f = self.dll.SPC3_Get_DeadTime
-        f.argtypes = [SPC3_H, c_uint16, POINTER(c_uint16)]
-        f.restype = SPC3Return
 
         ReturnVal = c_uint16(0)
         #  DllSDKExport HermesReturn HermesGetDeadTime(Hermes_H Hermes, uint16_t Val, uint16_t* ReturnVal);
-        ec = f(self.c_handle, Val, byref(ReturnVal))
+        ec = self._fn_SPC3_Get_DeadTime(self.c_handle, Val, byref(ReturnVal))
         self._checkError(ec)
         return ReturnVal.value
 
@@ -927,12 +1206,9 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H or ReturnVal point to an empty memory location
         """
-        f = self.dll.SPC3_Get_GateWidth
-        f.argtypes = [SPC3_H, c_uint16, c_int16, POINTER(c_double)]
-        f.restype = SPC3Return
         ReturnVal = c_double(0)
         #  DllSDKExport HermesReturn HermesGetGateWidth(Hermes_H Hermes, uint16_t counter, int16_t Val, double* ReturnVal);
-        ec = f(self.c_handle, counter, Val, byref(ReturnVal))
+        ec = self._fn_SPC3_Get_GateWidth(self.c_handle, counter, Val, byref(ReturnVal))
         self._checkError(ec)
         return ReturnVal.value
 
@@ -948,13 +1224,10 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H or ReturnVal point to an empty memory location
         """
-        f = self.dll.SPC3_Get_GateShift
-        f.argtypes = [SPC3_H, c_uint16, c_int16, POINTER(c_int16)]
-        f.restype = SPC3Return
 
-        ReturnVal = c_uint16(0)
+        ReturnVal = c_int16(0)
         #  DllSDKExport HermesReturn HermesGetGateShift(Hermes_H Hermes, uint16_t counter, int16_t Val, int16_t* ReturnVal);
-        ec = f(self.c_handle, counter, Val, byref(ReturnVal))
+        ec = self._fn_SPC3_Get_GateShift(self.c_handle, counter, Val, byref(ReturnVal))
         self._checkError(ec)
         return ReturnVal.value
 
@@ -972,13 +1245,10 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H or is16bit pointers point to an empty memory location
         """
-        f = self.dll.SPC3_Is16Bit
-        f.argtypes = [SPC3_H, POINTER(c_short)]
-        f.restype = SPC3Return
 
         is16bit = c_short(0)
         #  DllSDKExport HermesReturn HermesIs16Bit(Hermes_H Hermes, short* is16bit);
-        ec = f(self.c_handle, byref(is16bit))
+        ec = self._fn_SPC3_Is16Bit(self.c_handle, byref(is16bit))
         self._checkError(ec)
         return bool(is16bit.value)
 
@@ -993,15 +1263,31 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided Hermes_H or is Triggered pointers point to an empty memory location
         """
-        f = self.dll.SPC3_IsTriggered
-        f.argtypes = [SPC3_H, POINTER(c_short)]
-        f.restype = SPC3Return
 
         isTriggered = c_short(0)
         #  DllSDKExport HermesReturn HermesIsTriggered(Hermes_H Hermes, short* isTriggered);
-        ec = f(self.c_handle, byref(isTriggered))
+        ec = self._fn_SPC3_IsTriggered(self.c_handle, byref(isTriggered))
         self._checkError(ec)
-        return bool(c_short.value)
+        return bool(isTriggered.value)
+
+    def WaitForTrigger(self, timeout, poll_ms=10):
+        """WaitForTrigger - Poll IsTriggered() until an external sync pulse was detected or the timeout expired.
+        Use this before SnapAcquire() when the camera waits for an external sync, so that the blocking download
+        only starts once the acquisition is actually running.
+
+        Parameters:
+            timeout: Maximum waiting time in seconds. None waits indefinitely.
+            poll_ms: Polling interval in milliseconds.
+        Returns:
+            True if a sync pulse was detected, False if the timeout expired.
+        """
+        poll_s = poll_ms / 1000
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.IsTriggered():
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(poll_s)
+        return True
 
     def GetVersion(self):
         """GetVersion - Get the SDK and camera firmware version
@@ -1015,15 +1301,12 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided handle or pointers point to an empty memory location
         """
-        f = self.dll.SPC3_GetVersion
-        f.argtypes = [SPC3_H, POINTER(c_double), POINTER(c_double), c_char_p]
-        f.restype = SPC3Return
 
         Firmware_Version = c_double(0)
         Software_Version = c_double(0)
         Custom_version = c_char(0)
         #  DllSDKExport HermesReturn HermesGetVersion(Hermes_H Hermes, double* Firmware_Version, double* Software_Version, char* Custom_version);
-        ec = f(self.c_handle, byref(Firmware_Version), byref(Software_Version), byref(Custom_version))
+        ec = self._fn_SPC3_GetVersion(self.c_handle, byref(Firmware_Version), byref(Software_Version), byref(Custom_version))
         self._checkError(ec)
         return Firmware_Version.value, Software_Version.value, Custom_version.value.decode('utf-8')
 
@@ -1038,14 +1321,11 @@ class SPC3(object):
         Error codes:
             NULL_POINTER The provided handle or pointers point to an empty memory location.
         """
-        f = self.dll.SPC3_GetSerial
-        f.argtypes = [SPC3_H, c_char_p, c_char_p]
-        f.restype = SPC3Return
 
         Camera_ID = create_string_buffer(11)
         Camera_serial = create_string_buffer(33)
         #  DllSDKExport HermesReturn HermesGetSerial(Hermes_H Hermes, char* Camera_ID, char* Camera_serial);
-        ec = f(self.c_handle, Camera_ID, Camera_serial)
+        ec = self._fn_SPC3_GetSerial(self.c_handle, Camera_ID, Camera_serial)
         self._checkError(ec)
         return Camera_ID.value.decode('utf-8'), Camera_serial.value.decode('utf-8')
 
@@ -1159,14 +1439,27 @@ class SPC3(object):
             INVALID_OP No images were acquired or the selected range of images is not valid
             UNABLE_CREATE_FILE Unable to create the output file
         """
-        f = self.dll.SPC3_Save_Img_Disk
-        f.argtypes = [SPC3_H, c_uint32, c_uint32, c_char_p, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSaveImgDisk(Hermes_H Hermes, uint32_t Start_Img, uint32_t End_Img, char* filename, OutFileFormat mode);
-        ec = f(self.c_handle, Start_Img, End_Img, filename.encode('utf-8'), mode)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Save_Img_Disk(self.c_handle, Start_Img, End_Img, self._encode(filename), mode)
         self._checkError(ec)
         return
 
+    def SaveImgDiskAsync(self, Start_Img, End_Img, filename, mode):
+        """SaveImgDiskAsync - Save the selected images on the hard disk in a background thread.
+        Same as SaveImgDisk(), but returns immediately. The GIL is released during the SDK call, so Python code can go on
+        with e.g. processing of the previous data while the file is written. Calls which use the snap buffer (settings,
+        snap acquisition and readout, saving and averaging) wait for the save to finish. Background saves are executed one after
+        the other in the order they were requested. The images are read from the SDK snap buffer, so no new snap must
+        be acquired before the save has finished.
+
+        Parameters:
+            See SaveImgDisk().
+        Returns:
+            concurrent.futures.Future. Its result() is None once the file is written, or raises the SPC3Error of the save.
+        """
+        return self._io_pool.submit(self.SaveImgDisk, Start_Img, End_Img, filename, mode)
+
     def SaveAveragedImgDisk(self, counter, filename, mode, is_double):
         """SaveAveragedImgDisk - Save the selected images on the hard disk.
         This function saves the average of the images acquired by a specified counter on the hard disk. File format can be proprietary Hermes or TIFF, as explained in HermesSaveImgDisk() function.
@@ -1181,11 +1474,9 @@ class SPC3(object):
             INVALID_OP No images were acquired or the selected range of images is not valid
             UNABLE_CREATE_FILE Unable to create the output file
         """
-        f = self.dll.SPC3_Save_Averaged_Img_Disk
-        f.argtypes = [SPC3_H, c_uint16, c_char_p, c_int, c_short]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSaveAveragedImgDisk(Hermes_H Hermes, uint16_t counter, char* filename, OutFileFormat mode, short isDouble);
-        ec = f(self.c_handle, counter, filename.encode('utf-8'), mode, is_double)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Save_Averaged_Img_Disk(self.c_handle, counter, self._encode(filename), mode, is_double)
         self._checkError(ec)
         return
 
@@ -1209,11 +1500,9 @@ class SPC3(object):
             INVALID_OP No images were acquired or the selected range of images is not valid
             UNABLE_CREATE_FILE Unable to create the output file
         """
-        f = self.dll.SPC3_Save_FLIM_Disk
-        f.argtypes = [SPC3_H, c_char_p, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSaveFlimDisk(Hermes_H Hermes, char* filename, OutFileFormat mode);
-        ec = f(self.c_handle, filename.encode('utf-8'), mode)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Save_FLIM_Disk(self.c_handle, self._encode(filename), mode)
         self._checkError(ec)
         return
 
@@ -1225,29 +1514,24 @@ class SPC3(object):
             filename: Full path of the output file.
             ImgIdx:    Image index in the file. Accepted values: 1 ... 65534
             counter: Desired counter. Accepted values: 1 ... 3
-            Img: Pointer to the output image array. The size of the array must be at least 2 kiB.
-            header: Array in which the header of Hermes file is saved.
+        Returns:
+            Img: The image as flat uint16 array. This is a buffer which is overwritten by the next call, use .copy()
+                to keep it.
+            header: The header of the Hermes file.
         Error codes:
             UNABLE_READ_FILE Unable to read the input file. Is it a Hermes file?
             OUT_OF_BOUND The desired counter or image exceeds the file size.
             NOT_EN_MEMORY Not enough memory to store the data contained in the file
             NULL_POINTER The provided provided handle or pointers point to an empty memory location.
         """
-        f = self.dll.SPC3_ReadSPC3FileFormatImage
-        f.argtypes = [c_char_p,
-                      c_uint32,
-                      c_uint16,
-                      np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags='C_CONTIGUOUS'),
-                      c_char_p]
-        f.restype = SPC3Return
-
-        Img = np.zeros(self.row_size * self._num_rows, dtype=np.uint16)
-        header = create_string_buffer(1024)
+
+        Img = self._read_img_buf
+        header = self._read_header_buf
         #  DllSDKExport HermesReturn HermesReadHermesFileFormatImage(char* filename, uint32_t ImgIdx, uint16_t counter, uint16_t* Img, char header[1024]);
-        ec = f(filename.encode('utf-8'), ImgIdx, counter, Img, header)
+        ec = self._fn_SPC3_ReadSPC3FileFormatImage(self._encode(filename), ImgIdx, counter, Img, header)
         self._checkError(ec)
 
-        return Img, header.decode('utf-8')
+        return Img, header.value.decode('utf-8')
 
     def AverageImg(self, counter):
         """AverageImg - Gets the average image.
@@ -1257,25 +1541,20 @@ class SPC3(object):
         Parameters:
             counter: Desired counter. Accepted values: 1..3
         Returns:
-            The average image.
+            The average image. This is a view into a buffer which is overwritten by the next call, use .copy() to keep it.
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
             INVALID_OP No images were acquired
         """
 
-        f = self.dll.SPC3_Average_Img
-        f.argtypes = [SPC3_H,
-                      np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags='C_CONTIGUOUS'),
-                      c_uint16]
-        f.restype = SPC3Return
 
-        data = np.zeros(self.row_size * self._num_rows, dtype=np.float64)
+        data = self._avg_buf
         #  DllSDKExport HermesReturn HermesAverageImg(Hermes_H Hermes, double* Img, uint16_t counter);
-        ec = f(self.c_handle, data, counter)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_Average_Img(self.c_handle, data, counter)
         self._checkError(ec)
 
-        frames = self.BufferToFrames(data, self._num_pixels, 1)  # expect data of just one counter!
-        return frames[0][0]  # strip away dimensions of frame index and counter index
+        return self._to_single_frame(data)  # expect data of just one counter!
 
     def StDevImg(self, counter):
         """StDevImg - Calculate the standard deviation image.
@@ -1285,24 +1564,49 @@ class SPC3(object):
         Parameters:
             counter: Desired counter. Accepted values: 1..3
         Returns:
-            The standard deviation image.
+            The standard deviation image. This is a view into a buffer which is overwritten by the next call, use .copy()
+            to keep it.
         Error codes:
             NULL_POINTER The provided Hermes_H points to an empty memory location
             INVALID_OP No images were acquired
         """
-        f = self.dll.SPC3_StDev_Img
-        f.argtypes = [SPC3_H,
-                      np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags='C_CONTIGUOUS'),
-                      c_uint16]
-        f.restype = SPC3Return
 
-        data = np.zeros(self.row_size * self._num_rows, dtype=np.float64)
+        data = self._stdev_buf
         #  DllSDKExport HermesReturn HermesStDevImg(Hermes_H Hermes, double* Img, uint16_t counter);
-        ec = f(self.c_handle, data, counter)
+        with self._snap_buf_lock:
+            ec = self._fn_SPC3_StDev_Img(self.c_handle, data, counter)
         self._checkError(ec)
 
-        frames = self.BufferToFrames(data, self._num_pixels, 1)  # expect data of just one counter!
-        return frames[0][0]  # strip away dimensions of frame index and counter index
+        return self._to_single_frame(data)  # expect data of just one counter!
+
+    def AvgAndStdImg(self, counter):
+        """AvgAndStdImg - Calculate the average and the standard deviation image in one go.
+        Instead of AverageImg() and StDevImg() each scanning all acquired images in the SDK, the snap buffer is wrapped
+        once with SnapGetImageBuffer() and the per-pixel sum and sum of squares are accumulated in a single numpy pass
+        each, without a float64 copy of the image stack. Signed counter data is passed on to the SDK functions.
+
+        Parameters:
+            counter: Desired counter. Accepted values: 1..3
+        Returns:
+            Tuple of the average image and the (population) standard deviation image, as new float64 arrays.
+        Error codes:
+            NULL_POINTER The provided Hermes_H points to an empty memory location
+        """
+        if self._data_is_signed and counter > 1:
+            return self.AverageImg(counter).copy(), self.StDevImg(counter).copy()
+
+        frames = self.SnapGetImageBuffer()[counter - 1]
+        num_frames = frames.shape[0]
+        if num_frames == 0:
+            raise SPC3Error(-11)  # INVALID_OP, no images were acquired
+
+        avg = frames.sum(axis=0, dtype=np.float64)
+        avg /= num_frames
+        var = np.einsum('fij,fij->ij', frames, frames, dtype=np.float64)
+        var /= num_frames
+        var -= avg * avg
+        np.maximum(var, 0, out=var)  # guard against rounding below zero for constant pixels
+        return avg, np.sqrt(var, out=var)
 
     def SetCorrelationMode(self, CM, NCorrChannels, s):
         """SetCorrelationMode - Enable the correlation mode.
@@ -1319,11 +1623,8 @@ class SPC3(object):
             OUT_OF_BOUND NCorrChannels must be greater than zero for the Multi-tau algorithm and greater than 2 for the Linear one
             NOT_EN_MEMORY There is not enough memory to enable the correlation mode
         """
-        f = self.dll.SPC3_Set_Correlation_Mode
-        f.argtypes = [SPC3_H, c_int, c_int, c_int]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetCorrelationMode(Hermes_H Hermes, CorrelationMode CM, int NCorrChannels, State s);
-        ec = f(self.c_handle, CM, NCorrChannels, s)
+        ec = self._fn_SPC3_Set_Correlation_Mode(self.c_handle, CM, NCorrChannels, s)
         self._checkError(ec)
         return
 
@@ -1341,11 +1642,8 @@ class SPC3(object):
             NOT_EN_MEMORY Not enough memory to calculate the correlation function
             INVALID_NIMG_CORRELATION The required number of time lags of the correlation function can not be calculated from the available number of images
         """
-        f = self.dll.SPC3_Correlation_Img
-        f.argtypes = [SPC3_H, c_uint16]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesCorrelationImg(Hermes_H Hermes, uint16_t counter);
-        ec = f(self.c_handle, counter)
+        ec = self._fn_SPC3_Correlation_Img(self.c_handle, counter)
         self._checkError(ec)
         return
 
@@ -1394,11 +1692,8 @@ class SPC3(object):
             INVALID_OP The autocorrelation, which has been calculated, is not valid
             UNABLE_CREATE_FILE Unable to create the output file
         """
-        f = self.dll.SPC3_Save_Correlation_Img
-        f.argtypes = [SPC3_H, c_char_p]
-        f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSaveCorrelationImg(Hermes_H Hermes, char* filename);
-        ec = f(self.c_handle, filename.encode('utf-8'))
+        ec = self._fn_SPC3_Save_Correlation_Img(self.c_handle, self._encode(filename))
         self._checkError(ec)
         return
 
@@ -1443,26 +1738,71 @@ class SPC3(object):
 
         num_full_rows = int(num_pixels + row_size - 1) // row_size  # ceil division
 
-        # reshape data in 'flat' blocks each containing all pixels of a frame
-        all_flat_frames = data.reshape((data.size // num_pixels, num_pixels))
-
         # number of frames per counter
-        num_frames = len(all_flat_frames) // num_counters  # number of frames per counter
+        num_frames = data.size // (num_pixels * num_counters)
 
         if num_pixels % row_size == 0:
-            frames = all_flat_frames.reshape((num_frames, num_counters, num_full_rows, row_size))
-        else:
-            # pad frames so that the number of pixels is a multiple of 32 pixels (i.e. one row)
-            num_pad_pixels = row_size * num_full_rows - num_pixels
-            all_flat_frames_padded = np.pad(all_flat_frames, ((0, 0), (0, num_pad_pixels)))
-            frames = all_flat_frames_padded.reshape((num_frames, num_counters, num_full_rows, row_size))
+            # pure view, no data is copied
+            frames = data.reshape((num_frames, num_counters, num_full_rows, row_size))
+            # swap frame indexes and counter dimensions and rotate by 90 degrees (swap rows and cols) in one step
+            return frames.transpose(1, 0, 3, 2)
+
+        # pad frames so that the number of pixels is a multiple of 32 pixels (i.e. one row). Every pixel is written
+        # once, straight to its final (counter, frame, col, row) position, and only the padding pixels are zeroed.
+        frames = np.empty((num_counters, num_frames, row_size, num_full_rows), dtype=data.dtype)
+        rows_view = frames.transpose(0, 1, 3, 2)  # (counters, frames, rows, cols) view into frames
+        src = data.reshape((num_frames, num_counters, num_pixels)).transpose(1, 0, 2)
+        num_complete_rows = num_pixels // row_size
+        num_complete_pixels = num_complete_rows * row_size
+        rows_view[:, :, :num_complete_rows, :] = src[:, :, :num_complete_pixels].reshape(
+            (num_counters, num_frames, num_complete_rows, row_size))
+        rows_view[:, :, -1, :num_pixels - num_complete_pixels] = src[:, :, num_complete_pixels:]
+        rows_view[:, :, -1, num_pixels - num_complete_pixels:] = 0
+        return frames
 
-        # swap frame indexes and counter dimensions
-        frames = np.swapaxes(frames, 0, 1)
-        # rotate by 90 degrees (swap rows and cols)
-        frames = np.swapaxes(frames, frames.ndim - 2, frames.ndim - 1)
+    @staticmethod
+    def FlimFramesToSequence(frames, flim_steps):
+        """FlimFramesToSequence - Splits the frame axis of FLIM data into FLIM acquisitions and gate steps.
+        FLIM frames are stored "FLIM first, time second", i.e. all gate shifts of the 1st FLIM acquisition,
+        followed by all gate shifts of the 2nd one, etc. (see SaveFlimDisk()). The split is a pure reshape, so
+        no pixel data is copied.
 
-        return frames
+        Parameters
+            frames: frames as returned by BufferToFrames(), with shape (counters, frames, cols, rows)
+            flim_steps: number of gate delay steps per FLIM acquisition, as set with SetFlimPar()
+        Returns:
+            Frames with shape (counters, FLIM acquisitions, FLIM steps, cols, rows).
+        """
+        num_counters, num_frames = frames.shape[:2]
+        if num_frames % flim_steps != 0:
+            raise ValueError('The number of frames must be a multiple of flim_steps')
+        return frames.reshape((num_counters, num_frames // flim_steps, flim_steps) + frames.shape[2:])
+
+    @staticmethod
+    def SumCountersMasked(frames, saturation_value=None):
+        """SumCountersMasked - Sums the frames of all counters and flags dead and saturated pixels.
+        The counter sum is accumulated in a single pass in uint32, so the sum of several saturated 16-bit counters
+        does not wrap around. The saturation mask is built one counter at a time into a single scratch frame stack,
+        so no (counters, frames, cols, rows) boolean stack is allocated.
+
+        Parameters
+            frames: integer frames as returned by BufferToFrames(), with shape (counters, frames, cols, rows)
+            saturation_value: pixel value regarded as saturated. Defaults to the maximum of the integer data type.
+        Returns:
+            Summed frames with shape (frames, cols, rows) and a boolean mask of the same shape, which is True for
+            pixels without any counts in all counters or with a saturated value in at least one counter.
+        """
+        if not np.issubdtype(frames.dtype, np.integer):
+            raise ValueError('expected integer frames, got {}'.format(frames.dtype))
+        if saturation_value is None:
+            saturation_value = np.iinfo(frames.dtype).max
+        summed = np.add.reduce(frames, axis=0, dtype=np.uint32)
+        mask = summed == 0
+        saturated = np.empty(mask.shape, dtype=bool)
+        for counter_frames in frames:
+            np.greater_equal(counter_frames, saturation_value, out=saturated)
+            mask |= saturated
+        return summed, mask
 
     @staticmethod
     def ReadHermesDataFile(path):
@@ -1474,98 +1814,23 @@ class SPC3(object):
         Returns:
             data file header and frames
         """
-        def readfield(inf, count, c_type):
-            if c_type is None:
-                inf.read(count)
-                return
-            bs = bytearray(inf.read(count * sizeof(c_type)))
-            if count > 1:
-                return (c_type * count).from_buffer_copy(bs).value
+        with open(path, 'rb') as inf:
+            # read signature and metadata at once and decode all fields in a single step
+            hdr = inf.read(_SPC3_HEADER_STRUCT.size)
+            if len(hdr) < _SPC3_HEADER_STRUCT.size:
+                raise ValueError('File too short for a .hrm header: {}'.format(path))
+            header = _decode_spc3_header(hdr)
+
+            data_count = header.N_cols * header.N_rows * header.N_frames * header.N_counters
+
+            if header.bit_x_pix == 16:
+                dtype = np.uint16
+            elif header.bit_x_pix == 8:
+                dtype = np.uint8
             else:
-                return c_type.from_buffer_copy(bs).value
-
-        inf = open(path, 'rb')
-
-        file_meta_stuff = readfield(inf, 8, c_char)
-
-        class HermesFileHeader():
-            pass
-
-        header = HermesFileHeader
-
-        header.camera_id = readfield(inf, 10, c_char).decode('utf-8')
-
-        header.SN = readfield(inf, 32, c_char).decode('utf-8')
-
-        header.FW_VER = readfield(inf, 1, c_uint16) / 100
-        header.custom_ver = chr(readfield(inf, 1, c_uint8) + ord('A'))  # 0 = A, 1 = B, etc
-        header.date_time = readfield(inf, 20, c_char).decode('utf-8')
-
-        readfield(inf, 35, None)
-
-        header.N_rows = readfield(inf, 1, c_uint8)
-        header.N_cols = readfield(inf, 1, c_uint8)
-        header.bit_x_pix = readfield(inf, 1, c_uint8)
-        header.N_counters = readfield(inf, 1, c_uint8)
-        header.HwIntTime = readfield(inf, 1, c_uint16) * 10e-9
-        header.SummedFrames = readfield(inf, 1, c_uint16)
-        header.DeadTimeCorrectionON = readfield(inf, 1, c_uint8) != 0
-        header.GateDuty_C1 = readfield(inf, 1, c_uint8)
-        header.HoldOff = readfield(inf, 1, c_uint16) * 1e-9
-        header.BKGsubON = readfield(inf, 1, c_uint8) != 0
-        header.C1_2_signed = readfield(inf, 1, c_uint8) != 0
-        header.N_frames = readfield(inf, 1, c_uint32)
-        header.ImgAveraged = readfield(inf, 1, c_uint8) != 0
-        header.Caveraged = readfield(inf, 1, c_uint8)
-        header.N_ave = readfield(inf, 1, c_uint16)
-        header.GateDuty_C2 = readfield(inf, 1, c_uint8)
-        header.GateDuty_C3 = readfield(inf, 1, c_uint8)
-        header.Frames_x_syncIn = readfield(inf, 1, c_uint16)
-        header.N_pix = readfield(inf, 1, c_uint16)
-        readfield(inf, 72, None)
-
-        header.FLIM_ON = readfield(inf, 1, c_uint8) != 0
-        header.FLIM_shift_pct = readfield(inf, 1, c_uint16)
-        header.FLIM_steps = readfield(inf, 1, c_uint16)
-        header.FLIM_frameLen = readfield(inf, 1, c_uint32) * 10e-9
-        header.FLIM_binWidth = readfield(inf, 1, c_uint16) * 1e-15
-        readfield(inf, 9, None)
-
-        header.MultiGate_mode = readfield(inf, 1, c_uint8)
-        header.MultiGate_start_pos = readfield(inf, 1, c_int16)
-        header.MultiGate_widthC1 = readfield(inf, 1, c_uint8)
-        header.MultiGate_widthC2 = readfield(inf, 1, c_uint8)
-        header.MultiGate_widthC3 = readfield(inf, 1, c_uint8)
-        header.MultiGate_gapC1_2 = readfield(inf, 1, c_uint16)
-        header.MultiGate_gapC2_3 = readfield(inf, 1, c_uint16)
-        header.MultiGate_binWidth = readfield(inf, 1, c_uint16) * 1e-15
-
-        header.CoarseGate_C1_ON = readfield(inf, 1, c_uint8) != 0
-        header.CoarseGate_C1_startPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C1_stopPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C2_ON = readfield(inf, 1, c_uint8) != 0
-        header.CoarseGate_C2_startPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C2_stopPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C3_ON = readfield(inf, 1, c_uint8) != 0
-        header.CoarseGate_C3_startPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C3_stopPos = readfield(inf, 1, c_uint16) * 10e-9
-        readfield(inf, 53, None)
-
-        header.PDE_ON = readfield(inf, 1, c_uint8) != 0
-        header.PDE_startWave = readfield(inf, 1, c_uint16) * 1e-9
-        header.PDE_stopWave = readfield(inf, 1, c_uint16) * 1e-9
-        header.PDE_step = readfield(inf, 1, c_uint16) * 1e-9
-
-        data_count = header.N_cols * header.N_rows * header.N_frames * header.N_counters
-
-        if header.bit_x_pix == 16:
-            dtype = np.uint16
-        elif header.bit_x_pix == 8:
-            dtype = np.uint8
-        else:
-            raise ValueError('invalid bit width, got {}'.format(str(header.bit_x_pix)))
-        inf.seek(0)
-        data = np.fromfile(inf, offset=1024 + 8, count=data_count, dtype=dtype)
+                raise ValueError('invalid bit width, got {}'.format(str(header.bit_x_pix)))
+            # the file position is right behind the header, no need to rewind
+            data = np.fromfile(inf, count=data_count, dtype=dtype)
 
         num_pixels = header.N_pix
         num_counters = header.N_counters
@@ -1574,107 +1839,45 @@ class SPC3(object):
         return frames, header
 
     @staticmethod
-    def ReadSPC3DataFile(path):
+    def ReadSPC3DataFile(path, memmap=False):
         """ReadSPC3DataFile - reads .spc3 acquisition files
         or "raw" data read from hermes data files to a more structured data set containing multiple frames
 
         Parameters
             path: path to the .spc3 data file
+            memmap: if True, the frames are a read-only view into a numpy.memmap of the file instead of a copy in RAM.
+                Pixels are read from disk on access, so files larger than the RAM can be processed. The frames become
+                invalid if the file is modified or deleted.
         Returns:
             data file header and frames
         """
-        def readfield(inf, count, c_type):
-            if c_type is None:
-                inf.read(count)
-                return
-            bs = bytearray(inf.read(count * sizeof(c_type)))
-            if count > 1:
-                return (c_type * count).from_buffer_copy(bs).value
+        # map the file once: header and pixel data are read from the mapping without seeking or a second read
+        with open(path, 'rb') as inf:
+            # checked before mapping: mmap cannot map an empty file and would raise a less helpful error
+            if os.fstat(inf.fileno()).st_size < _SPC3_HEADER_STRUCT.size:
+                raise ValueError('File too short for a .spc3 header: {}'.format(path))
+            mm = mmap.mmap(inf.fileno(), 0, access=mmap.ACCESS_READ)
+        with mm:
+            # decode signature and metadata in a single step
+            header = _decode_spc3_header(mm)
+
+            data_count = header.N_cols * header.N_rows * header.N_frames * header.N_counters
+
+            if header.bit_x_pix == 16:
+                dtype = np.uint16
+            elif header.bit_x_pix == 8:
+                dtype = np.uint8
             else:
-                return c_type.from_buffer_copy(bs).value
-
-        inf = open(path, 'rb')
-
-        file_meta_stuff = readfield(inf, 8, c_char)
-
-        class HermesFileHeader():
-            pass
-
-        header = HermesFileHeader
-
-        header.camera_id = readfield(inf, 10, c_char).decode('utf-8')
-
-        header.SN = readfield(inf, 32, c_char).decode('utf-8')
-
-        header.FW_VER = readfield(inf, 1, c_uint16) / 100
-        header.custom_ver = chr(readfield(inf, 1, c_uint8) + ord('A'))  # 0 = A, 1 = B, etc
-        header.date_time = readfield(inf, 20, c_char).decode('utf-8')
-
-        readfield(inf, 35, None)
-
-        header.N_rows = readfield(inf, 1, c_uint8)
-        header.N_cols = readfield(inf, 1, c_uint8)
-        header.bit_x_pix = readfield(inf, 1, c_uint8)
-        header.N_counters = readfield(inf, 1, c_uint8)
-        header.HwIntTime = readfield(inf, 1, c_uint16) * 10e-9
-        header.SummedFrames = readfield(inf, 1, c_uint16)
-        header.DeadTimeCorrectionON = readfield(inf, 1, c_uint8) != 0
-        header.GateDuty_C1 = readfield(inf, 1, c_uint8)
-        header.HoldOff = readfield(inf, 1, c_uint16) * 1e-9
-        header.BKGsubON = readfield(inf, 1, c_uint8) != 0
-        header.C1_2_signed = readfield(inf, 1, c_uint8) != 0
-        header.N_frames = readfield(inf, 1, c_uint32)
-        header.ImgAveraged = readfield(inf, 1, c_uint8) != 0
-        header.Caveraged = readfield(inf, 1, c_uint8)
-        header.N_ave = readfield(inf, 1, c_uint16)
-        header.GateDuty_C2 = readfield(inf, 1, c_uint8)
-        header.GateDuty_C3 = readfield(inf, 1, c_uint8)
-        header.Frames_x_syncIn = readfield(inf, 1, c_uint16)
-        header.N_pix = readfield(inf, 1, c_uint16)
-        readfield(inf, 72, None)
-
-        header.FLIM_ON = readfield(inf, 1, c_uint8) != 0
-        header.FLIM_shift_pct = readfield(inf, 1, c_uint16)
-        header.FLIM_steps = readfield(inf, 1, c_uint16)
-        header.FLIM_frameLen = readfield(inf, 1, c_uint32) * 10e-9
-        header.FLIM_binWidth = readfield(inf, 1, c_uint16) * 1e-15
-        readfield(inf, 9, None)
-
-        header.MultiGate_mode = readfield(inf, 1, c_uint8)
-        header.MultiGate_start_pos = readfield(inf, 1, c_int16)
-        header.MultiGate_widthC1 = readfield(inf, 1, c_uint8)
-        header.MultiGate_widthC2 = readfield(inf, 1, c_uint8)
-        header.MultiGate_widthC3 = readfield(inf, 1, c_uint8)
-        header.MultiGate_gapC1_2 = readfield(inf, 1, c_uint16)
-        header.MultiGate_gapC2_3 = readfield(inf, 1, c_uint16)
-        header.MultiGate_binWidth = readfield(inf, 1, c_uint16) * 1e-15
-
-        header.CoarseGate_C1_ON = readfield(inf, 1, c_uint8) != 0
-        header.CoarseGate_C1_startPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C1_stopPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C2_ON = readfield(inf, 1, c_uint8) != 0
-        header.CoarseGate_C2_startPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C2_stopPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C3_ON = readfield(inf, 1, c_uint8) != 0
-        header.CoarseGate_C3_startPos = readfield(inf, 1, c_uint16) * 10e-9
-        header.CoarseGate_C3_stopPos = readfield(inf, 1, c_uint16) * 10e-9
-        readfield(inf, 53, None)
-
-        header.PDE_ON = readfield(inf, 1, c_uint8) != 0
-        header.PDE_startWave = readfield(inf, 1, c_uint16) * 1e-9
-        header.PDE_stopWave = readfield(inf, 1, c_uint16) * 1e-9
-        header.PDE_step = readfield(inf, 1, c_uint16) * 1e-9
-
-        data_count = header.N_cols * header.N_rows * header.N_frames * header.N_counters
-
-        if header.bit_x_pix == 16:
-            dtype = np.uint16
-        elif header.bit_x_pix == 8:
-            dtype = np.uint8
-        else:
-            raise ValueError('invalid bit width, got {}'.format(str(header.bit_x_pix)))
-        inf.seek(0)
-        data = np.fromfile(inf, offset=1024 + 8, count=data_count, dtype=dtype)
+                raise ValueError('invalid bit width, got {}'.format(str(header.bit_x_pix)))
+            # like np.fromfile, read only the frames actually present, e.g. in files of interrupted acquisitions
+            data_count = min(data_count, (len(mm) - _SPC3_HEADER_STRUCT.size) // np.dtype(dtype).itemsize)
+            if not memmap or data_count == 0:
+                # copy the pixels out of the mapping, so the returned frames stay valid after the file is closed
+                data = np.frombuffer(mm, dtype=dtype, count=data_count, offset=_SPC3_HEADER_STRUCT.size).copy()
+
+        if memmap and data_count > 0:
+            # BufferToFrames() only reshapes divisible geometries, so the frames stay a view into the mapped file
+            data = np.memmap(path, dtype=dtype, mode='r', offset=_SPC3_HEADER_STRUCT.size, shape=(data_count,))
 
         num_pixels = header.N_pix
         num_counters = header.N_counters
@@ -4,7 +4,7 @@
 Qudi hardware module for the MPD SPC3 SPAD camera.
 
 Wraps the vendor-provided SPC3 Python SDK (spc.py) and exposes it through the
-qudi CameraInterface.  spc.py must NOT be modified — all adaptation happens here.
+qudi CameraInterface.  All qudi-specific adaptation happens here.
 
 ---
 
@@ -30,15 +30,6 @@ import os
 import time
 import struct
 import numpy as np
-from ctypes import (
-    c_int,
-    c_short,
-    c_void_p,
-    c_uint32,
-    c_uint16,
-    POINTER,
-    byref,
-)
 
 from qudi.core.configoption import ConfigOption
 from qudi.interface.camera_interface import CameraInterface
@@ -383,27 +374,17 @@ class SPC3_Qudi(CameraInterface):
         num_rows_raw = int(getattr(self._spc, "_num_rows", 64) or 64)
         buf_len = row_size * num_rows_raw
 
-        # The C signature is effectively:
-        #   int SPC3_Get_Img_Position(void* h, uint16_t* Img, uint32_t pos, uint16_t counter)
-        # Use uint16 for compatibility (also works for 8-bit mode; values are truncated).
-        f = self._spc.dll.SPC3_Get_Img_Position
-        f.argtypes = [
-            c_void_p,
-            np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags="C_CONTIGUOUS"),
-            c_uint32,
-            c_uint16,
-        ]
-        f.restype = c_int
-
         frames_out = np.empty(
             (num_counters, num_frames, self._NROWS, self._ncols), dtype=np.uint16
         )
 
+        # Every image is copied into frames_out, so one buffer allocated before
+        # the loop serves all positions.
+        data = np.zeros(buf_len, dtype=np.uint16)
         for counter_idx in range(1, num_counters + 1):
             for frame_idx in range(1, num_frames + 1):
-                data = np.zeros(buf_len, dtype=np.uint16)
-                ec = f(self._spc.c_handle, data, frame_idx, counter_idx)
-                self._spc._checkError(ec)
+                # The SDK writes the uint16 image straight into data
+                self._spc.SnapGetImgPosition(frame_idx, counter_idx, out=data)
 
                 # BufferToFrames may see padding (e.g. Half_array) and interpret
                 # the raw buffer as multiple frames. We always take the first.
@@ -490,15 +471,9 @@ class SPC3_Qudi(CameraInterface):
         raise ValueError(f"Unexpected frame array ndim={arr.ndim}")
 
     def _is_triggered(self):
-        """Correct trigger polling (work around SDK wrapper bug in spc.py)."""
+        """Poll the camera for the external trigger state."""
         try:
-            f = self._spc.dll.SPC3_IsTriggered
-            f.argtypes = [c_void_p, POINTER(c_short)]
-            f.restype = c_int
-            is_triggered = c_short(0)
-            ec = f(self._spc.c_handle, byref(is_triggered))
-            self._spc._checkError(ec)
-            return bool(is_triggered.value)
+            return self._spc.IsTriggered()
         except Exception as e:
             self.log.error(f"Trigger poll failed: {e}")
             return False
@@ -506,12 +481,7 @@ class SPC3_Qudi(CameraInterface):
     def _wait_for_trigger(self, timeout_s=None):
         if timeout_s is None:
             timeout_s = self._TRIGGER_WAIT_TIMEOUT_S
-        start = time.monotonic()
-        while not self._is_triggered():
-            if (time.monotonic() - start) > timeout_s:
-                return False
-            time.sleep(0.01)
-        return True
+        return self._spc.WaitForTrigger(timeout_s, poll_ms=10)
 
     def set_exposure(self, exposure):
         """Set exposure time in seconds.
@@ -25,8 +25,13 @@ You should have received a copy of the GNU Lesser General Public License along w
 If not, see <https://www.gnu.org/licenses/>.
 """
 
-from enum import Enum
-from ctypes import *
+import os
+import time
+import struct
+import threading
+import traceback
+from contextlib import contextmanager
+from enum import Enum, IntEnum
 from ctypes import c_uint32, c_uint16
 import numpy as np
 
@@ -35,6 +40,20 @@ from qudi.interface.camera_interface import CameraInterface
 
 from qudi.hardware.camera.SPC3.spc_old import SPC3, SPC3_H, SPC3Return
 
+# Duration of one FPGA clock cycle; the hardware integration time (HIT) is
+# given to the SDK in these ticks.
+TICK_NS = 10
+TICK_S = TICK_NS * 1e-9
+
+
+class AcquisitionState(IntEnum):
+    """Acquisition state of SPC3_Qudi; exactly one is active at a time."""
+
+    IDLE = 0
+    LIVE = 1  # live mode, frames grabbed by the producer thread
+    SNAP = 2  # snap acquisition in progress
+    CONTINUOUS = 3  # continuous acquisition streaming to file
+
 
 class SPC3_Qudi(CameraInterface):
     """Hardware class for SPC3 SPAD Camera
@@ -56,6 +75,7 @@ class SPC3_Qudi(CameraInterface):
             default_display_units: 'counts'  # or 'cps'
             trigger_mode: 'no_trigger'  # 'no_trigger' | 'single_trigger' | 'multiple_trigger'
             trigger_frames_per_pulse: 1  # frames per SYNC_IN pulse (only for 'multiple_trigger', 1-100)
+            counter_index: 0  # counter shown in live mode (0 .. NCounters - 1)
 
     Unit Convention:
         - ALL public parameters use SECONDS for time values (exposure, integration)
@@ -67,6 +87,13 @@ class SPC3_Qudi(CameraInterface):
         - Advanced mode: Hardware integration configurable (1-65534 clock cycles)
         - Actual exposure = NIntegFrames × HardwareIntegration × 10ns
 
+    Note on live latency:
+        - The SDK has no frame-queue depth setting (no equivalent of a driver
+          buffer count). LiveGetImg() reads the current live image on demand,
+          so get_acquired_data() never returns a stale queued frame.
+        - Snap acquisitions start from a fresh SnapPrepare(), so no frames from
+          earlier acquisitions need to be flushed.
+
     """
 
     _camera_mode = ConfigOption("camera_mode", missing="error")
@@ -85,6 +112,8 @@ class SPC3_Qudi(CameraInterface):
     _trigger_mode = ConfigOption("trigger_mode", "no_trigger")
     # Number of frames acquired per trigger pulse (only for 'multiple_trigger', valid range 1-100)
     _trigger_frames_per_pulse = ConfigOption("trigger_frames_per_pulse", 1)
+    # Seconds a triggered snap waits for its SYNC_IN pulse before giving up
+    _trigger_timeout = ConfigOption("trigger_timeout", 60)
     # Default directory for saving acquisition files (empty string = no default)
     _default_save_directory = ConfigOption("default_save_directory", "")
     # Coarse gate mode: 'off' | 'coarse'  (counter 1 only)
@@ -93,6 +122,10 @@ class SPC3_Qudi(CameraInterface):
     _coarse_gate_start = ConfigOption("coarse_gate_start", 0)
     # Coarse gate stop position in clock cycles (10 ns each). Range: (start+1) .. (HIT - 5)
     _coarse_gate_stop = ConfigOption("coarse_gate_stop", 100)
+    # Counter plane (0-based) shown in live mode and used for the background
+    _counter_index = ConfigOption("counter_index", 0)
+    # Number of live frames averaged for the background image (None = NFrames)
+    _background_frames = ConfigOption("background_frames", None)
 
     _HardwareIntegration = _default_hardware_integration
     _NFrames = _default_NFrames
@@ -106,8 +139,6 @@ class SPC3_Qudi(CameraInterface):
     _HardwareIntegration_Normal = (
         1040  # fixed to 10.4 us in Normal mode (in units of 10ns clock cycles)
     )
-    _Nrows = 32
-    _Ncols = 64
     _exposure = 0.02  # in seconds (for GUI display, calculated from NIntegFrames * HardwareIntegration * 10ns)
 
     # Valid parameter ranges from spc.py documentation
@@ -118,9 +149,9 @@ class SPC3_Qudi(CameraInterface):
     _MIN_INTEG_FRAMES = 1
     _MAX_INTEG_FRAMES = 65534
 
-    _live = False
-    _acquiring = False
-    _continuous = False
+    _settings_debounce_s = 0.05  # delay before coalesced setter changes are committed
+
+    _state = AcquisitionState.IDLE  # changed only under _state_lock
     _current_cont_filename = None  # stores stem passed to ContAcqToFileStart
     _camera_name = "SPC3"
     _background_subtraction_enabled = (
@@ -129,6 +160,17 @@ class SPC3_Qudi(CameraInterface):
     _last_display_frame = (
         None  # cached raw frame from last live tick; used as ContAcq preview
     )
+    _background_image = None  # set by capture_background_image()
+    _frame_ready_callback = None  # see register_frame_ready_callback()
+    _commit_error = None  # exception of the last failed settings commit
+
+    # Data set opened for viewing (see load_acquisition_file)
+    _loaded_frames = None  # (counters, frames, rows, cols)
+    _frames_view = None  # counter 0 of _loaded_frames, (frames, rows, cols)
+    _loaded_header = None
+    _loaded_filepath = None
+    _loaded_background = None  # float32 .bg.npy sidecar, (rows, cols)
+    _current_frame_index = 0
 
     def _to_binary(self, value, name):
         """Normalize binary config options to 0/1.
@@ -144,10 +186,36 @@ class SPC3_Qudi(CameraInterface):
     def on_activate(self):
         """Initialisation performed during activation of the module."""
 
+        # The HIT goes to SetCameraPar as an integer tick count; reject values
+        # the SDK cannot represent instead of letting ctypes truncate them.
+        if self._camera_mode == "Advanced":
+            cycles = self._HardwareIntegration
+            if int(cycles) != cycles or not (
+                self._MIN_HARDWARE_INTEGRATION
+                <= cycles
+                <= self._MAX_HARDWARE_INTEGRATION
+            ):
+                raise ValueError(
+                    f"default_hardware_integration must be an integer number of "
+                    f"{TICK_NS} ns clock cycles in [{self._MIN_HARDWARE_INTEGRATION}, "
+                    f"{self._MAX_HARDWARE_INTEGRATION}], got {cycles}"
+                )
+            self._HardwareIntegration = int(cycles)
+        self._update_hw_int_cycles()
+
+        if not 0 <= int(self._counter_index) < int(self._NCounters):
+            raise ValueError(
+                f"counter_index must be in [0, {int(self._NCounters) - 1}], "
+                f"got {self._counter_index}"
+            )
+        self._counter_index = int(self._counter_index)
+
         # Normalize binary options using configured values
         force8bit = self._to_binary(self._Force8bit, "Force8bit")
         half_array = self._to_binary(self._Half_array, "Half_array")
         signed_data = self._to_binary(self._Signed_data, "Signed_data")
+        # (Force8bit, Half_array, Signed_data) as passed to SetCameraPar
+        self._camera_flags = (force8bit, half_array, signed_data)
 
         # Advanced Camera Mode
         if self._camera_mode == "Advanced":
@@ -162,7 +230,7 @@ class SPC3_Qudi(CameraInterface):
                 half_array,
                 signed_data,
             )
-            hardware_time = self._HardwareIntegration * 10e-9
+            hardware_time = self._HardwareIntegration * TICK_S
             self.log.info(
                 f"SPC3 initialized in Advanced mode: HW integration = {hardware_time*1e6:.2f} µs"
             )
@@ -186,28 +254,85 @@ class SPC3_Qudi(CameraInterface):
                 half_array,
                 signed_data,
             )
-            hardware_time = self._HardwareIntegration_Normal * 10e-9
+            hardware_time = self._HardwareIntegration_Normal * TICK_S
             self.log.info(
                 f"SPC3 initialized in Normal mode: HW integration = {hardware_time*1e6:.2f} µs (fixed)"
             )
 
-        # Commit camera parameters to hardware first so that the HIT is
-        # established before gate values are validated by the SDK.
-        self.spc3.ApplySettings()
+        # Coarse gate values are validated by the SDK against the committed
+        # HIT, so in that case the camera parameters are committed first.
+        # Otherwise camera, trigger and gate settings share one ApplySettings.
+        if self._camera_mode == "Advanced" and self._gate_mode == "coarse":
+            self.spc3.ApplySettings()
 
         # Apply trigger settings
         self._apply_trigger_settings()
 
-        # Apply gate settings (must come after the first ApplySettings so the
-        # SDK knows the HIT when validating SetCoarseGateValues ranges)
+        # Apply gate settings (after the HIT commit above, if one was needed)
         self._apply_gate_settings()
 
         # Commit trigger + gate settings
         self.spc3.ApplySettings()
-        self._Ncols = self._Ncols >> half_array
+
+        # Sensor geometry is per instance and reset on every activation, so a
+        # re-activation never halves an already halved column count.
+        self._Nrows, self._Ncols = 32, 64
+        if half_array == SPC3.State.ENABLED:
+            self._Ncols //= 2
+        self._frame_shape = (self._Nrows, self._Ncols)
+        self._size_wh = (self._Ncols, self._Nrows)
+        self._serial = self.spc3.GetSerial()
+        self._frame_size_bytes = (
+            self._Nrows * self._Ncols * np.dtype(np.uint16).itemsize
+        )
+
+        # Frame buffers use the camera's native uint16 pixel format and are
+        # allocated with np.empty where every pixel is written before use.
+        # Reused copy of the last raw live frame (see get_acquired_data)
+        self._image_buffer = np.empty(self._frame_shape, dtype=np.uint16)
+        # Shared read-only frame returned while no live frame is available
+        self._zero_frame = np.zeros(self._frame_shape, dtype=np.uint16)
+        self._zero_frame.flags.writeable = False
+        # Per-thread scratch frames for software background subtraction (see
+        # _thread_scratch): it runs on the GUI and on acquisition threads
+        self._scratch = threading.local()
+        # Output frames of get_acquired_data(), reused for every frame. Counts
+        # frames are returned as uint16 (_sub_out), cps frames as float32
+        # (_cps_out). Separate buffers, so a frame kept from before a units
+        # switch is never reinterpreted as the other dtype.
+        self._sub_out = np.empty(self._frame_shape, dtype=np.uint16)
+        self._cps_out = np.empty(self._frame_shape, dtype=np.float32)
+
+        # Live frames are grabbed by a producer thread into a small ring of
+        # preallocated frames; get_acquired_data() reads the latest one.
+        # _spc3_lock serialises SDK access between that thread and the GUI.
+        # The ring is (re)built by _start_grab_thread() for the active counters.
+        self._spc3_lock = threading.RLock()
+        self._ring_raw = []  # flat SDK output buffers
+        self._ring = []  # frame views of counter _counter_index into _ring_raw
+        self._ring_idx = -1  # slot of the latest published frame, -1 = none yet
+        self._grab_stop = threading.Event()
+        self._frame_ready = threading.Event()  # set on every published frame
+        self._grab_thread = None
+        self._reset_acquisition_stats()
+
+        # Setters only record parameter changes; they are pushed to hardware
+        # with one SetCameraPar + ApplySettings by _commit_settings().
+        self._settings_dirty = False
+        self._commit_timer = None
+        self._batch_depth = 0  # nesting level of batch_update() blocks
+
+        # _state_lock serialises acquisition start/stop and deactivation so
+        # that no SDK call can race with Destr(); _destroyed is set just before
+        # Destr() and turns later transitions into no-ops.
+        self._state_lock = threading.RLock()
+        self._destroyed = False
+        # Set by stop_acquisition()/on_deactivate() to abort a snap that is
+        # waiting for its trigger (the wait runs without _state_lock held)
+        self._snap_abort = threading.Event()
 
         # Calculate and log initial exposure time
-        self._exposure = self._NIntegFrames * hardware_time
+        self._update_exposure()
         self.log.info(
             f"Initial exposure: {self._exposure*1e3:.2f} ms ({self._NIntegFrames} frames × {hardware_time*1e6:.2f} µs)"
         )
@@ -270,9 +395,10 @@ class SPC3_Qudi(CameraInterface):
             return
         self._trigger_mode = mode
         self._trigger_frames_per_pulse = max(1, min(int(frames_per_pulse), 100))
-        self._apply_trigger_settings()
-        # Commit trigger change to hardware (gate is re-issued by _apply_settings)
-        self._apply_settings()
+        with self._spc3_lock:
+            self._apply_trigger_settings()
+            # Commit trigger change to hardware (gate is re-issued by _apply_settings)
+            self._apply_settings()
 
     def _apply_gate_settings(self):
         """Apply coarse gate settings to hardware (counter 1 only).
@@ -300,11 +426,7 @@ class SPC3_Qudi(CameraInterface):
             self.log.info("Gate: disabled (continuous mode) for counter 1")
 
         elif self._gate_mode == "coarse":
-            hit = (
-                self._HardwareIntegration
-                if self._camera_mode == "Advanced"
-                else self._HardwareIntegration_Normal
-            )
+            hit = self._hw_int_cycles
             start = int(self._coarse_gate_start)
             stop = int(self._coarse_gate_stop)
 
@@ -345,8 +467,9 @@ class SPC3_Qudi(CameraInterface):
         Use this instead of calling spc3.ApplySettings() directly in any
         method that also calls SetCameraPar().
         """
-        self._apply_gate_settings()
-        self.spc3.ApplySettings()
+        with self._spc3_lock:
+            self._apply_gate_settings()
+            self.spc3.ApplySettings()
 
     def get_gate_mode(self):
         """Return the current gate mode string ('off' or 'coarse')."""
@@ -368,74 +491,183 @@ class SPC3_Qudi(CameraInterface):
         self._gate_mode = "coarse"
         self._coarse_gate_start = int(start_cycles)
         self._coarse_gate_stop = int(stop_cycles)
-        self._apply_gate_settings()
-        self.spc3.ApplySettings()
+        with self._spc3_lock:
+            self._apply_gate_settings()
+            self.spc3.ApplySettings()
 
     def disable_gate(self):
         """Disable gating (set counter 1 back to continuous mode)."""
         self._gate_mode = "off"
-        self._apply_gate_settings()
-        self.spc3.ApplySettings()
+        with self._spc3_lock:
+            self._apply_gate_settings()
+            self.spc3.ApplySettings()
 
     def _apply_camera_settings(self):
         """Apply current camera parameters to hardware"""
-        force8bit = self._to_binary(self._Force8bit, "Force8bit")
-        half_array = self._to_binary(self._Half_array, "Half_array")
-        signed_data = self._to_binary(self._Signed_data, "Signed_data")
-
-        if self._camera_mode == "Advanced":
-            self.spc3.SetCameraPar(
-                self._HardwareIntegration,
-                self._NFrames,
-                self._NIntegFrames,
-                self._NCounters,
-                force8bit,
-                half_array,
-                signed_data,
-            )
-        else:
+        with self._spc3_lock:
+            # The binary options are fixed after activation, so their
+            # normalised values are reused instead of re-validated per call.
             self.spc3.SetCameraPar(
-                self._HardwareIntegration_Normal,
+                self._hw_int_cycles,
                 self._NFrames,
                 self._NIntegFrames,
                 self._NCounters,
-                force8bit,
-                half_array,
-                signed_data,
+                *self._camera_flags,
             )
-        self._apply_settings()
+            self._apply_settings()
+
+    def _mark_settings_dirty(self):
+        """Record that camera parameters changed and schedule a debounced commit.
+
+        A burst of setter calls (e.g. from a GUI slider) restarts the timer, so
+        the hardware is reprogrammed once after the burst instead of per call.
+        Acquisition start commits immediately without waiting for the timer.
+
+        @return bool: False if the previous commit failed; the change is still
+                      recorded and that commit is retried together with it
+        """
+        with self._spc3_lock:
+            self._settings_dirty = True
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+            if not self._batch_depth:
+                # Otherwise committed when the outermost batch_update() exits
+                self._commit_timer = threading.Timer(
+                    self._settings_debounce_s, self._debounced_commit
+                )
+                self._commit_timer.daemon = True
+                self._commit_timer.start()
+            return self._commit_error is None
+
+    def _debounced_commit(self):
+        """Timer callback of _mark_settings_dirty(): commit in the background.
+
+        A failure cannot be raised to anyone here. The changes stay pending,
+        the next setter call reports it, and the next synchronous commit
+        (commit_settings(), batch_update() exit, acquisition start) retries
+        and raises it.
+        """
+        try:
+            self._commit_settings()
+        except Exception as e:
+            self.log.error(f"Failed to apply camera settings: {e}")
+
+    def _commit_settings(self):
+        """Push pending camera parameter changes to hardware, if any.
+
+        Raises the hardware error if the commit fails; the changes then stay
+        pending (see _commit_error).
+        """
+        # _state_lock first (the order used by acquisition start/stop), so the
+        # debounce timer thread cannot commit while Destr() runs
+        with self._state_lock, self._spc3_lock:
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+            if not self._settings_dirty or self._destroyed:
+                return
+            self._settings_dirty = False
+            try:
+                self._apply_camera_settings()
+            except Exception as e:
+                self._settings_dirty = True
+                self._commit_error = e
+                raise
+            self._commit_error = None
+
+    def commit_settings(self):
+        """Push pending exposure/binning/integration changes to hardware now.
+
+        Setters otherwise commit automatically after a short debounce delay.
+
+        @return bool: True if the hardware accepted the settings
+        """
+        try:
+            self._commit_settings()
+        except Exception as e:
+            self.log.error(f"Failed to apply camera settings: {e}")
+            return False
+        return True
+
+    @contextmanager
+    def batch_update(self):
+        """Group several setter calls into a single hardware commit.
+
+        Usage:
+            with camera.batch_update():
+                camera.set_hardware_integration(20e-6)
+                camera.set_binning(500)
+
+        The pending changes are committed once when the outermost block exits.
+        """
+        with self._spc3_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._spc3_lock:
+                self._batch_depth -= 1
+                commit = self._batch_depth == 0
+            # Outside _spc3_lock: _commit_settings takes _state_lock first
+            if commit:
+                self._commit_settings()
+
+    @contextmanager
+    def _acquisition_state(self, state):
+        """Enter *state* for the duration of the block, back to IDLE on exit.
+
+        The state is restored on both success and error. Must be entered with
+        _state_lock held.
+        """
+        self._state = state
+        try:
+            yield
+        finally:
+            self._state = AcquisitionState.IDLE
 
     def on_deactivate(self):
         """Deinitialisation performed during deactivation of the module."""
-        # self._spc3.ContAcqToMemoryStop()
-        if self._live:
-            self.spc3.LiveSetModeOFF()
-            self._live = False
-        if self._acquiring:
-            self._acquiring = False
-        if self._continuous:
-            self._continuous = False
-            self.spc3.ContAcqToFileStop()
-            if self._current_cont_filename is not None:
-                self._patch_gate_header(self._current_cont_filename + ".spc3")
-                self._current_cont_filename = None
-        self.spc3.Destr()
+        self._snap_abort.set()
+        with self._state_lock:
+            if self._destroyed:
+                return
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+            # self._spc3.ContAcqToMemoryStop()
+            self.log.info(f"Live acquisition stats: {self.get_acquisition_stats()}")
+            state, self._state = self._state, AcquisitionState.IDLE
+            if state == AcquisitionState.LIVE:
+                self._stop_grab_thread()
+                self.spc3.LiveSetModeOFF()
+            elif state == AcquisitionState.CONTINUOUS:
+                self.spc3.ContAcqToFileStop()
+                if self._current_cont_filename is not None:
+                    self._patch_gate_header(self._current_cont_filename + ".spc3")
+                    self._current_cont_filename = None
+            # Terminal: later state transitions and settings commits are no-ops
+            self._destroyed = True
+            self.spc3.Destr()
+            # Drop the loaded data set; a memory-mapped file is unmapped once
+            # no view of it is left
+            self._loaded_frames = self._frames_view = None
 
     def get_name(self):
         """Retrieve an identifier of the camera that the GUI can print
 
         @return string: name for the camera
         """
-        return self.spc3.GetSerial()
+        # Queried once in on_activate; the serial cannot change while connected
+        return self._serial
 
     def get_size(self):
         """Retrieve size of the image in pixel
 
         @return tuple: Size (width, height)
         """
-        # Return (height, width) to match numpy array shape convention
-        # _Ncols is adjusted based on Half_array setting during activation
-        return self._Nrows, self._Ncols
+        # Cached in on_activate (after the Half_array adjustment of _Ncols).
+        # Frames themselves are (rows, cols) arrays, i.e. (height, width).
+        return self._size_wh
 
     def support_live_acquisition(self):
         """Return whether or not the camera can take care of live acquisition
@@ -449,11 +681,127 @@ class SPC3_Qudi(CameraInterface):
 
         @return bool: Success ?
         """
-        self._live = True
-        self._acquiring = False
-        self.spc3.LiveSetModeON()
+        with self._state_lock:
+            if self._destroyed:
+                return False
+            if self._state == AcquisitionState.LIVE:
+                return True
+            if self._state != AcquisitionState.IDLE:
+                self.log.error(f"Cannot start live mode: {self._state.name} active")
+                return False
+            try:
+                self._commit_settings()
+            except Exception as e:
+                self.log.error(f"Cannot start live mode, settings not applied: {e}")
+                return False
+            self._state = AcquisitionState.LIVE
+            self.spc3.LiveSetModeON()
+            self._start_grab_thread()
 
-        return True
+            return True
+
+    def register_frame_ready_callback(self, callback):
+        """Have *callback* called whenever a new live frame is available.
+
+        The callback takes no arguments and runs in the grab thread, so it
+        must return quickly (e.g. emit a queued Qt signal) and fetch the frame
+        later with get_acquired_data().
+
+        @param callable callback: function to call, or None to unregister
+        """
+        self._frame_ready_callback = callback
+
+    def _start_grab_thread(self):
+        """Start the producer thread that grabs live frames into the ring."""
+        if self._grab_thread is not None:
+            return
+        self._build_ring()
+        self._ring_idx = -1
+        self._grab_stop.clear()
+        self._grab_thread = threading.Thread(
+            target=self._grab_loop, name="SPC3_live_grab", daemon=True
+        )
+        self._grab_thread.start()
+
+    def _build_ring(self, slots=3):
+        """Allocate the live ring so the SDK writes frames straight into it.
+
+        Each slot is a flat buffer in the layout SPC3_Get_Live_Img fills; the
+        ring frames are views of counter _counter_index into those buffers, so
+        grabbing a frame needs no copy. The views are strided (rows and cols
+        are swapped); get_acquired_data() copies them into the C-contiguous
+        _image_buffer. The unused tail of each buffer stays zero.
+        """
+        spc3 = self.spc3
+        num_counters = int(spc3._num_counters)
+        size = spc3.row_size * spc3._num_rows * num_counters
+        if self._ring_raw and self._ring_raw[0].size == size:
+            return
+        self._ring_raw = [np.zeros(size, dtype=np.uint16) for _ in range(slots)]
+        counter = self._counter_index
+        self._ring = [
+            spc3.BufferToFrames(raw, spc3._num_pixels, num_counters)[counter][0]
+            for raw in self._ring_raw
+        ]
+
+    def _stop_grab_thread(self):
+        """Stop the producer thread and wait for it to finish."""
+        self._grab_stop.set()
+        if self._grab_thread is not None:
+            self._grab_thread.join()
+            self._grab_thread = None
+
+    def _reset_acquisition_stats(self):
+        """Reset the live acquisition counters reported by get_acquisition_stats."""
+        # Each counter has a single writer (producer thread or GUI reader), so
+        # plain ints are sufficient.
+        self._frames_captured = 0  # written by the producer thread
+        self._frames_seen = 0  # _frames_captured at the last read
+        self._frames_dropped = 0  # grabbed frames never returned to the GUI
+        self._backlog_high_water = 0  # max. frames grabbed between two reads
+        self._last_latency_ms = 0.0  # duration of the last LiveGetImg() call
+
+    def get_acquisition_stats(self):
+        """Return counters for diagnosing live acquisition bottlenecks.
+
+        A growing frames_dropped count means the GUI polls slower than the
+        camera delivers frames; a large last_latency_ms points at the SDK.
+
+        @return dict: frames_captured, frames_dropped, backlog_high_water,
+                      last_latency_ms
+        """
+        return {
+            "frames_captured": self._frames_captured,
+            "frames_dropped": self._frames_dropped,
+            "backlog_high_water": self._backlog_high_water,
+            "last_latency_ms": self._last_latency_ms,
+        }
+
+    def _grab_loop(self):
+        """Producer loop: grab a live frame about once per exposure.
+
+        Each frame is written by the SDK into the ring slot after the latest
+        one and then published by updating _ring_idx, so a reader never sees a
+        slot that is being written. With three slots the reader's slot stays
+        untouched for at least one more frame period; older frames are dropped.
+        """
+        while not self._grab_stop.is_set():
+            try:
+                idx = (self._ring_idx + 1) % len(self._ring)
+                t0 = time.perf_counter_ns()
+                with self._spc3_lock:
+                    self.spc3.LiveGetImg(out=self._ring_raw[idx])
+                self._last_latency_ms = (time.perf_counter_ns() - t0) * 1e-6
+                self._ring_idx = idx
+                self._frames_captured += 1
+                self._frame_ready.set()
+                callback = self._frame_ready_callback
+                if callback is not None:
+                    callback()
+            except Exception as e:
+                self.log.error(f"Live frame grab failed: {e}")
+                return
+            self._grab_stop.wait(max(self._exposure, 1e-3))
 
     def start_single_acquisition(self):
         """Perform snap acquisition using proper SDK sequence
@@ -463,108 +811,161 @@ class SPC3_Qudi(CameraInterface):
 
         @return numpy array: Acquired frames, or None if failed
         """
-        if self._live:
-            self.log.error("Cannot snap: live mode is active")
-            return None
-
-        try:
-            self._acquiring = True
-            # Step 1: Re-apply gate + trigger settings and commit to hardware.
-            # SetCameraPar (called from set_exposure / set_binning) resets the SDK's
-            # pending-settings queue, which would silently drop any gate or trigger
-            # configuration set earlier.  Calling _apply_settings() here ensures the
-            # hardware state is always consistent with the module's internal state
-            # immediately before every snap acquisition.
-            self._apply_settings()
-
-            # Step 2: Prepare camera for snap
-            self.spc3.SnapPrepare()
-
-            # Step 2: Wait for trigger (if trigger mode active) then acquire
-            # SnapAcquire() blocks until all frames are downloaded. In trigger mode
-            # the camera waits for a SYNC_IN pulse before capturing, so calling
-            # SnapAcquire() immediately causes the SDK to time out with COMMUNICATION_ERROR.
-            # Instead, poll IsTriggered() until the camera has received its trigger pulse
-            # and started acquiring, then call SnapAcquire() to download the frames.
-            if self._trigger_mode in ("single_trigger", "multiple_trigger"):
-                import time
+        with self._state_lock:
+            if self._destroyed:
+                return None
+            if self._state != AcquisitionState.IDLE:
+                self.log.error(f"Cannot snap: {self._state.name} acquisition is active")
+                return None
 
-                self.log.info(
-                    f"Waiting for external trigger on SYNC_IN "
-                    f"(trigger_mode='{self._trigger_mode}')..."
-                )
-                while not self.spc3.IsTriggered():
-                    time.sleep(0.01)  # poll every 10 ms
-                self.log.info("Trigger received, downloading frames...")
-
-            # Step 3: Trigger acquisition (blocks until frames downloaded)
-            self.spc3.SnapAcquire()
-
-            # Step 3: Extract frames from SDK internal buffer by calling SDK directly
-            # This uses the SAME internal buffer that SaveImgDisk uses, ensuring consistent data
-            # We bypass spc.py's buggy SnapGetImgPosition wrapper and call the SDK directly
-            num_frames = self._NFrames
-            num_counters = self._NCounters
-
-            # Determine correct dtype based on bit depth
-            data_bits = self.spc3._data_bits
-            if data_bits == 16:
-                dtype = np.uint16
-            else:
-                dtype = np.uint8
-
-            # Setup SDK function call
-            f = self.spc3.dll.SPC3_Get_Img_Position
-            f.argtypes = [
-                SPC3_H,
-                np.ctypeslib.ndpointer(dtype=dtype, ndim=1, flags="C_CONTIGUOUS"),
-                c_uint32,
-                c_uint16,
-            ]
-            f.restype = SPC3Return
-
-            # Extract frames
-            frames_list = []
-            for counter_idx in range(1, num_counters + 1):  # SDK uses 1-based indexing
-                counter_frames = []
-                for frame_idx in range(1, num_frames + 1):  # SDK uses 1-based indexing
-                    # Allocate buffer for single frame
+            try:
+                # Step 1: Re-apply gate + trigger settings and commit to hardware.
+                # SetCameraPar (called from set_exposure / set_binning) resets the SDK's
+                # pending-settings queue, which would silently drop any gate or trigger
+                # configuration set earlier.  Calling _apply_settings() here ensures the
+                # hardware state is always consistent with the module's internal state
+                # immediately before every snap acquisition.
+                if self._settings_dirty:
+                    self._commit_settings()  # also re-issues gate settings
+                else:
+                    self._apply_settings()
+
+                # Step 2: Prepare camera for snap
+                self.spc3.SnapPrepare()
+            except Exception as e:
+                self.log.error(f"Snap acquisition failed: {e}")
+                self.log.error(f"Traceback: {traceback.format_exc()}")
+                return None
+            # Reserve the camera while waiting for the trigger
+            self._state = AcquisitionState.SNAP
+            self._snap_abort.clear()
+
+        # Step 2: Wait for trigger (if trigger mode active) then acquire
+        # SnapAcquire() blocks until all frames are downloaded. In trigger mode
+        # the camera waits for a SYNC_IN pulse before capturing, so calling
+        # SnapAcquire() immediately causes the SDK to time out with COMMUNICATION_ERROR.
+        # Instead, poll IsTriggered() until the camera has received its trigger pulse
+        # and started acquiring, then call SnapAcquire() to download the frames.
+        # The wait runs without _state_lock so that it can be aborted.
+        if self._trigger_mode in ("single_trigger", "multiple_trigger"):
+            if not self._wait_for_trigger():
+                with self._state_lock:
+                    if self._state == AcquisitionState.SNAP:
+                        self._state = AcquisitionState.IDLE
+                return None
+
+        with self._state_lock:
+            if self._destroyed or self._state != AcquisitionState.SNAP:
+                self.log.warning("Snap acquisition aborted")
+                return None
+            try:
+                with self._acquisition_state(AcquisitionState.SNAP):
+                    # Step 3: Trigger acquisition (blocks until frames downloaded)
+                    self.spc3.SnapAcquire()
+
+                    # Step 3: Extract frames from SDK internal buffer by calling SDK directly
+                    # This uses the SAME internal buffer that SaveImgDisk uses, ensuring consistent data
+                    # We bypass spc.py's buggy SnapGetImgPosition wrapper and call the SDK directly
+                    num_frames = self._NFrames
+                    num_counters = self._NCounters
+
+                    # Determine correct dtype based on bit depth
+                    data_bits = self.spc3._data_bits
+                    if data_bits == 16:
+                        dtype = np.uint16
+                    else:
+                        dtype = np.uint8
+
+                    # Setup SDK function call
+                    f = self.spc3.dll.SPC3_Get_Img_Position
+                    f.argtypes = [
+                        SPC3_H,
+                        np.ctypeslib.ndpointer(
+                            dtype=dtype, ndim=1, flags="C_CONTIGUOUS"
+                        ),
+                        c_uint32,
+                        c_uint16,
+                    ]
+                    f.restype = SPC3Return
+
+                    # One SDK output buffer is reused for every frame; its unused
+                    # tail beyond the active pixels stays zero.
+                    num_pixels = self.spc3._num_pixels
                     data = np.zeros(
                         self.spc3.row_size * self.spc3._num_rows, dtype=dtype
                     )
 
-                    # Call SDK to get frame
-                    ec = f(self.spc3.c_handle, data, frame_idx, counter_idx)
-                    self.spc3._checkError(ec)
+                    def to_frame():
+                        # Remove counter and frame dimensions to get (cols, rows)
+                        return self.spc3.BufferToFrames(data, num_pixels, 1)[0, 0]
 
-                    # Transform using BufferToFrames
-                    frame = self.spc3.BufferToFrames(data, self.spc3._num_pixels, 1)
-                    # Remove counter and frame dimensions to get (cols, rows)
-                    frame = frame[0, 0, :, :]
-                    counter_frames.append(frame)
-                frames_list.append(counter_frames)
+                    # Without row padding the frame is a view into `data`
+                    frame = to_frame()
+                    frame_is_view = np.shares_memory(frame, data)
 
-            # Stack into final array: (counters, frames, cols, rows)
-            frames = np.array(frames_list)
+                    # Final array: (counters, frames, cols, rows), filled in place
+                    frames = np.empty(
+                        (num_counters, num_frames) + frame.shape, dtype=dtype
+                    )
+                    # SDK uses 1-based indexing for counters and frames
+                    for ci in range(num_counters):
+                        for fi in range(num_frames):
+                            ec = f(self.spc3.c_handle, data, fi + 1, ci + 1)
+                            self.spc3._checkError(ec)
+                            frames[ci, fi] = frame if frame_is_view else to_frame()
+
+                    # Apply background subtraction (if enabled) frame by frame
+                    # through one scratch buffer
+                    if self._background_subtraction_active(frames[0, 0]):
+                        stack = frames.reshape((-1,) + frame.shape)
+                        if frames.dtype == np.uint16:
+                            scratch = np.empty(frame.shape, dtype=np.uint16)
+                            for out_frame in stack:
+                                self._subtract_background_u16(
+                                    out_frame, out_frame, scratch
+                                )
+                        else:
+                            scratch = np.empty(frame.shape, dtype=np.float32)
+                            for out_frame in stack:
+                                self._subtract_background_f32(out_frame, scratch)
+                                np.copyto(out_frame, scratch, casting="unsafe")
 
-            # Apply background subtraction (if enabled) to every frame
-            for ci in range(frames.shape[0]):
-                for fi in range(frames.shape[1]):
-                    frames[ci, fi] = self.apply_background_subtraction(frames[ci, fi])
+                self.log.info(
+                    f"Snap acquisition complete: shape={frames.shape}, dtype={frames.dtype}"
+                )
+                return frames
 
-            self._acquiring = False
-            self.log.info(
-                f"Snap acquisition complete: shape={frames.shape}, dtype={frames.dtype}"
-            )
-            return frames
+            except Exception as e:
+                self.log.error(f"Snap acquisition failed: {e}")
+                self.log.error(f"Traceback: {traceback.format_exc()}")
+                return None
 
-        except Exception as e:
-            self._acquiring = False
-            self.log.error(f"Snap acquisition failed: {e}")
-            import traceback
+    def _wait_for_trigger(self):
+        """Poll IsTriggered() until the camera has received its SYNC_IN pulse.
 
-            self.log.error(f"Traceback: {traceback.format_exc()}")
-            return None
+        @return bool: True once triggered; False if aborted (see _snap_abort)
+                      or after trigger_timeout seconds without a trigger
+        """
+        self.log.info(
+            f"Waiting for external trigger on SYNC_IN "
+            f"(trigger_mode='{self._trigger_mode}')..."
+        )
+        deadline = time.monotonic() + self._trigger_timeout
+        while True:
+            with self._spc3_lock:
+                if self.spc3.IsTriggered():
+                    break
+            if self._snap_abort.wait(0.01):  # poll every 10 ms
+                self.log.warning("Snap aborted while waiting for trigger")
+                return False
+            if time.monotonic() > deadline:
+                self.log.error(
+                    f"No trigger received within {self._trigger_timeout} s, "
+                    f"snap aborted"
+                )
+                return False
+        self.log.info("Trigger received, downloading frames...")
+        return True
 
     def _save_background_sidecar(self, spc3_filepath):
         """Save the current background image as a sidecar .bg.npy file.
@@ -587,7 +988,7 @@ class SPC3_Qudi(CameraInterface):
 
         Does nothing if no background image has been captured.
         """
-        if not hasattr(self, "_background_image") or self._background_image is None:
+        if self._background_image is None:
             if self._background_subtraction_enabled:
                 self.log.warning(
                     "Background subtraction is ENABLED but no background image has been "
@@ -598,20 +999,14 @@ class SPC3_Qudi(CameraInterface):
                 self.log.info("No background image captured — skipping sidecar save.")
             return
 
-        import os
-        import struct
-
         # Derive sidecar path:  strip .spc3 if present, append .bg.npy
         stem = spc3_filepath
         if stem.lower().endswith(".spc3"):
             stem = stem[:-5]
         sidecar_path = stem + ".bg.npy"
 
-        # Reshape to 2-D (rows × cols) for convenient analysis
-        bg_2d = self._background_image.reshape(self._Nrows, self._Ncols).astype(
-            np.float32
-        )
-        np.save(sidecar_path, bg_2d)
+        # float32 2-D (rows × cols) copy kept since capture, for easy analysis
+        np.save(sidecar_path, self._background_f32)
         self.log.info(f"Background sidecar saved: {sidecar_path}")
 
         # Patch the .spc3 header byte 112 (background subtraction enabled flag).
@@ -641,8 +1036,6 @@ class SPC3_Qudi(CameraInterface):
         """
         if self._gate_mode != "coarse":
             return
-        import struct
-
         try:
             with open(filepath, "r+b") as fh:
                 fh.seek(8 + 232)  # gate ON flag
@@ -661,47 +1054,73 @@ class SPC3_Qudi(CameraInterface):
 
         @return bool: Success ?
         """
-        if self._live or self._acquiring:
-            return False
-        else:
-            self._continuous = True
-            self._current_cont_filename = filename
-            # Re-apply gate + trigger settings and commit to hardware before
-            # starting the continuous acquisition.  Any intermediate SetCameraPar
-            # call (e.g. from set_exposure / set_binning) resets the SDK's
-            # pending-settings queue, which would silently drop gate/trigger config.
-            # Calling _apply_settings() here guarantees the hardware state matches
-            # the module's internal state at the moment acquisition begins.
-            # Note: ContAcqToFileStart zeroes the gate header bytes in the file,
-            # which is why gate values are patched back in stop_continuous_acquisition()
-            # after ContAcqToFileStop() closes the file.
-            self._apply_settings()
-            self.spc3.ContAcqToFileStart(filename)
-        return True
+        with self._state_lock:
+            if self._destroyed:
+                return False
+            if self._state != AcquisitionState.IDLE:
+                return False
+            else:
+                self._state = AcquisitionState.CONTINUOUS
+                self._current_cont_filename = filename
+                # Re-apply gate + trigger settings and commit to hardware before
+                # starting the continuous acquisition.  Any intermediate SetCameraPar
+                # call (e.g. from set_exposure / set_binning) resets the SDK's
+                # pending-settings queue, which would silently drop gate/trigger config.
+                # Calling _apply_settings() here guarantees the hardware state matches
+                # the module's internal state at the moment acquisition begins.
+                # Note: ContAcqToFileStart zeroes the gate header bytes in the file,
+                # which is why gate values are patched back in stop_continuous_acquisition()
+                # after ContAcqToFileStop() closes the file.
+                try:
+                    if self._settings_dirty:
+                        self._commit_settings()  # also re-issues gate settings
+                    else:
+                        self._apply_settings()
+                except Exception as e:
+                    self._state = AcquisitionState.IDLE
+                    self._current_cont_filename = None
+                    self.log.error(
+                        f"Cannot start continuous acquisition, settings not "
+                        f"applied: {e}"
+                    )
+                    return False
+                # The file-mode API is kept over ContAcqToMemoryStart: the SDK
+                # writes the .spc3 header that read_spc3_file() relies on,
+                # whereas the memory API only returns headerless buffers.
+                # Disk writes happen inside get_continuous_memory(), which
+                # callers drive from their own thread, off the GUI thread.
+                self.spc3.ContAcqToFileStart(filename)
+            return True
 
     def stop_continuous_acquisition(self):
         """Stop continuous acquisition
 
         @return bool: Success ?
         """
-        if self._continuous:
-            self.spc3.ContAcqToFileStop()
-            if self._current_cont_filename is not None:
-                spc3_path = self._current_cont_filename + ".spc3"
-                self._patch_gate_header(spc3_path)
-                self._save_background_sidecar(spc3_path)
-                self._current_cont_filename = None
-            self._continuous = False
-        return True
+        with self._state_lock:
+            if self._destroyed:
+                return True
+            if self._state == AcquisitionState.CONTINUOUS:
+                self.spc3.ContAcqToFileStop()
+                if self._current_cont_filename is not None:
+                    spc3_path = self._current_cont_filename + ".spc3"
+                    self._patch_gate_header(spc3_path)
+                    self._save_background_sidecar(spc3_path)
+                    self._current_cont_filename = None
+                self._state = AcquisitionState.IDLE
+            return True
 
     def get_continuous_memory(self):
         """Get continuous acquisition memory data
 
+        Safe to call from a drain thread: the SDK call is serialized with the
+        other camera calls by _spc3_lock.
+
         @return int: Total number of bytes read
         """
-        if self._continuous:
-            return self.spc3.ContAcqToFileGetMemory()
-        else:
+        with self._spc3_lock:
+            if self._state == AcquisitionState.CONTINUOUS:
+                return self.spc3.ContAcqToFileGetMemory()
             return 0
 
     def stop_acquisition(self):
@@ -709,10 +1128,19 @@ class SPC3_Qudi(CameraInterface):
 
         @return bool: Success ?
         """
-        if self._live:
-            self.spc3.LiveSetModeOFF()
-        self._live = False
-        self._acquiring = False
+        # Wakes a snap waiting for its trigger, which then releases the camera
+        self._snap_abort.set()
+        with self._state_lock:
+            if self._destroyed:
+                return True
+            # Continuous acquisitions are stopped by stop_continuous_acquisition()
+            if self._state == AcquisitionState.LIVE:
+                self._stop_grab_thread()
+                self.spc3.LiveSetModeOFF()
+                self._state = AcquisitionState.IDLE
+            elif self._state == AcquisitionState.SNAP:
+                self._state = AcquisitionState.IDLE
+        return True
 
     def get_acquired_data(self):
         """Return current live mode frame.
@@ -721,55 +1149,99 @@ class SPC3_Qudi(CameraInterface):
         For snap mode, use start_single_acquisition() which returns frames directly.
         For continuous mode, data streams directly to file.
 
-        @return numpy array: Live frame data with background subtraction and scaling applied
-        """
+        The returned array is an output buffer owned by this module and reused:
+        the next call overwrites it in place. Callers that keep a frame beyond
+        that must copy it (or use get_acquired_data_into).
 
-        image_array = np.zeros(self._Nrows * self._Ncols)
-        if self._live:
-            image_array = self.spc3.LiveGetImg()
+        @return numpy array: Live frame data with background subtraction and scaling applied,
+                             always 2-D (rows, cols): ring slots, the zero frame and the
+                             output buffers are all allocated in that shape
+        """
+        state = self._state
+        if state == AcquisitionState.LIVE and self._ring_idx >= 0:
             # Keep a rolling cache of the last raw live frame.  This is used as
             # a static preview during continuous acquisition (where the SDK
             # streams directly to file and LiveGetImg() cannot be called).
-            self._last_display_frame = image_array[0].copy()
-
-        # During continuous acquisition Live and ContAcq are mutually exclusive
-        # in the SDK — fall back to whatever the last live frame was.
-        if self._continuous and not self._live:
-            raw = (
-                self._last_display_frame.copy()
-                if self._last_display_frame is not None
-                else np.zeros((self._Nrows, self._Ncols), dtype=np.uint16)
-            )
+            # The copy goes into a buffer allocated once in on_activate.
+            captured = self._copy_latest_live_frame(self._image_buffer)
+            backlog = captured - self._frames_seen
+            if backlog > 0:
+                self._frames_dropped += backlog - 1
+                self._backlog_high_water = max(self._backlog_high_water, backlog)
+                self._frames_seen = captured
+            self._last_display_frame = raw = self._image_buffer
+        elif (
+            state == AcquisitionState.CONTINUOUS
+            and self._last_display_frame is not None
+        ):
+            # During continuous acquisition Live and ContAcq are mutually exclusive
+            # in the SDK — fall back to whatever the last live frame was.
+            # Live mode is off, so nothing overwrites that buffer and it is
+            # only read here; no copy is needed on every drain-loop poll.
+            raw = self._last_display_frame
         else:
-            raw = image_array[0]
+            # No live frame available: return a blank frame of the right shape
+            raw = self._zero_frame
 
-        # Apply background subtraction, CPS scaling, and reshape, then return
-        counter1_frame = self.apply_background_subtraction(raw)
-
-        # Scale to counts per second if enabled
+        # Apply background subtraction and CPS scaling, then return
         if self._display_units == "cps":
-            hardware_integration = (
-                self._HardwareIntegration
-                if self._camera_mode == "Advanced"
-                else self._HardwareIntegration_Normal
+            # Subtract, clip and scale in place in the float32 output frame.
+            # Rates are returned as float32: no cast back to the raw dtype,
+            # which could not hold rates above 65535 cps anyway.
+            counter1_frame = self._subtract_background_f32(
+                raw, self._cps_out, self._background_subtraction_active(raw)
             )
-            exposure_time_seconds = hardware_integration * 10e-9 * self._NIntegFrames
-            counter1_frame = (
-                counter1_frame.astype(np.float32) / exposure_time_seconds
-            ).astype(counter1_frame.dtype)
-
-        # Ensure 2D shape for GUI display (rows, cols)
-        if counter1_frame.ndim == 1:
-            counter1_frame = counter1_frame.reshape(self._Nrows, self._Ncols)
+            np.multiply(counter1_frame, self._inv_exposure_s, out=counter1_frame)
+        else:
+            counter1_frame = self.apply_background_subtraction(raw, out=self._sub_out)
+            if counter1_frame is not self._sub_out:
+                # Return the output buffer, never the frame cache itself
+                np.copyto(self._sub_out, counter1_frame)
+                counter1_frame = self._sub_out
 
         return counter1_frame
 
+    def _copy_latest_live_frame(self, out, attempts=3):
+        """Copy the latest published ring frame into *out* without tearing.
+
+        The producer only starts overwriting a published slot after it has
+        completed len(ring) - 1 further frames, so a copy is intact if fewer
+        frames than that were captured meanwhile (a sequence check, as in a
+        seqlock). After *attempts* failed tries the copy is made under
+        _spc3_lock, which the producer holds while it writes a slot.
+
+        @param numpy.ndarray out: (rows, cols) array to copy into
+        @return int: _frames_captured at the time of the copied frame
+        """
+        overwrite_after = len(self._ring) - 1
+        for _ in range(attempts):
+            captured = self._frames_captured
+            np.copyto(out, self._ring[self._ring_idx])
+            if self._frames_captured - captured < overwrite_after:
+                return captured
+        with self._spc3_lock:
+            np.copyto(out, self._ring[self._ring_idx])
+            return self._frames_captured
+
+    def get_acquired_data_into(self, out):
+        """Like get_acquired_data, but write the frame into a caller-owned array.
+
+        Lets callers that keep their own frame buffer (e.g. for display)
+        avoid holding on to a new array per frame.
+
+        @param numpy.ndarray out: Array of shape (rows, cols) to write into
+        @return numpy.ndarray: out
+        """
+        np.copyto(out, self.get_acquired_data(), casting="unsafe")
+        return out
+
     def set_exposure(self, exposure):
         """Set the exposure time in seconds
 
         @param float exposure: desired new exposure time in seconds
 
-        @return bool: Success?
+        @return float: exposure time actually set, in seconds. It reaches the
+                       hardware with the debounced commit (see commit_settings).
 
         FORMULA: exposure_seconds = NIntegFrames × HardwareIntegration_cycles × 10ns_per_cycle
         Note: HardwareIntegration is in CLOCK CYCLES where each cycle = 10ns
@@ -780,12 +1252,7 @@ class SPC3_Qudi(CameraInterface):
         # For Normal mode: HardwareIntegration fixed at 1040 cycles (1040 × 10ns = 10.4 µs)
         # For Advanced mode: use configured _HardwareIntegration (in cycles)
 
-        if self._camera_mode == "Advanced":
-            hardware_time = self._HardwareIntegration * 10e-9  # convert to seconds
-        else:
-            hardware_time = (
-                self._HardwareIntegration_Normal * 10e-9
-            )  # convert to seconds
+        hardware_time = self._hw_int_cycles * TICK_S  # convert to seconds
 
         # Calculate required NIntegFrames
         n_integ_frames = int(round(exposure / hardware_time))
@@ -801,28 +1268,14 @@ class SPC3_Qudi(CameraInterface):
             )
 
         self._NIntegFrames = n_integ_frames
-        self._exposure = n_integ_frames * hardware_time  # actual achieved exposure
+        self._update_exposure()  # actual achieved exposure
 
-        # Normalize binary options for safe re-application
-        force8bit = self._to_binary(self._Force8bit, "Force8bit")
-        half_array = self._to_binary(self._Half_array, "Half_array")
-        signed_data = self._to_binary(self._Signed_data, "Signed_data")
-
-        self.spc3.SetCameraPar(
-            (
-                self._HardwareIntegration
-                if self._camera_mode == "Advanced"
-                else self._HardwareIntegration_Normal
-            ),
-            self._NFrames,
-            self._NIntegFrames,
-            self._NCounters,
-            force8bit,
-            half_array,
-            signed_data,
-        )
-        self._apply_settings()
-        return True
+        if not self._mark_settings_dirty():
+            self.log.warning(
+                f"Previous camera settings commit failed "
+                f"({self._commit_error}); retrying with the new exposure"
+            )
+        return self._actual_exposure_s
 
     def get_exposure(self):
         """Get the exposure time in seconds
@@ -832,26 +1285,38 @@ class SPC3_Qudi(CameraInterface):
         FORMULA: exposure = NIntegFrames × HardwareIntegration_cycles × 10ns_per_cycle
         Each clock cycle = 10ns = 10e-9 seconds
         """
-        # Calculate actual exposure time: NIntegFrames * HardwareIntegration_cycles * 10ns
-        # HardwareIntegration is in clock cycles (10ns per cycle)
+        # Kept up to date by _update_exposure() whenever one of its inputs changes
+        return self._actual_exposure_s
+
+    def get_actual_exposure(self):
+        """Get the actual exposure time in seconds
+
+        @return float exposure time
+        """
+        return self._actual_exposure_s
+
+    def _update_hw_int_cycles(self):
+        """Cache the HIT in clock cycles that applies to the current camera mode.
+
+        Must be called whenever _HardwareIntegration or the camera mode changes.
+        """
         if self._camera_mode == "Advanced":
-            hardware_time = (
-                self._HardwareIntegration * 10e-9
-            )  # cycles × 10ns/cycle = seconds
+            self._hw_int_cycles = int(self._HardwareIntegration)
         else:
-            hardware_time = (
-                self._HardwareIntegration_Normal * 10e-9
-            )  # cycles × 10ns/cycle = seconds
-
-        self._exposure = self._NIntegFrames * hardware_time
-        return self._exposure
+            self._hw_int_cycles = int(self._HardwareIntegration_Normal)
 
-    # def get_actual_exposure(self):
-    # """Get the actual exposure time in seconds
+    def _update_exposure(self):
+        """Recompute the cached exposure time from NIntegFrames and the HIT.
 
-    # @return float exposure time
-    # """
-    # return self._NIntegFrames * (self._HardwareIntegration_Normal / 100) / 1000
+        Must be called whenever _NIntegFrames or _hw_int_cycles changes. The
+        cycle count is multiplied in integer arithmetic and converted to
+        seconds once (10 ns per clock cycle). The reciprocal is cached too, so
+        the cps scaling in get_acquired_data() is a multiplication.
+        """
+        cycles = self._hw_int_cycles
+        self._actual_exposure_s = int(self._NIntegFrames) * cycles * TICK_S
+        self._inv_exposure_s = 1.0 / self._actual_exposure_s
+        self._exposure = self._actual_exposure_s
 
     def set_hardware_integration(self, integration_seconds):
         """Set hardware integration time (only for Advanced mode)
@@ -860,7 +1325,9 @@ class SPC3_Qudi(CameraInterface):
         This method accepts SECONDS and converts to clock cycles.
 
         @param float integration_seconds: Hardware integration time in SECONDS
-        @return bool: Success?
+        @return bool: True if recorded; the hardware is updated by the debounced
+                      commit (see commit_settings). False in Normal mode or if
+                      the previous commit failed.
 
         Conversion formula: seconds × 1e9 ns/s ÷ 10 ns/cycle = clock_cycles
         """
@@ -872,8 +1339,8 @@ class SPC3_Qudi(CameraInterface):
 
         # STEP 1: Convert SECONDS to NANOSECONDS (multiply by 1e9)
         integration_ns = integration_seconds * 1e9
-        # STEP 2: Convert NANOSECONDS to CLOCK CYCLES (divide by 10, since each cycle = 10ns)
-        integration_cycles = int(round(integration_ns / 10.0))
+        # STEP 2: Convert NANOSECONDS to CLOCK CYCLES (divide by TICK_NS = 10 ns per cycle)
+        integration_cycles = int(round(integration_ns / TICK_NS))
 
         # Clamp to valid range
         integration_cycles = max(
@@ -882,31 +1349,20 @@ class SPC3_Qudi(CameraInterface):
         )
 
         self._HardwareIntegration = integration_cycles
+        self._update_hw_int_cycles()
 
         # Update exposure time calculation
-        self._exposure = self._NIntegFrames * integration_cycles * 10e-9
-
-        force8bit = self._to_binary(self._Force8bit, "Force8bit")
-        half_array = self._to_binary(self._Half_array, "Half_array")
-        signed_data = self._to_binary(self._Signed_data, "Signed_data")
+        self._update_exposure()
 
-        self.spc3.SetCameraPar(
-            integration_cycles,
-            self._NFrames,
-            self._NIntegFrames,
-            self._NCounters,
-            force8bit,
-            half_array,
-            signed_data,
-        )
-        self._apply_settings()
-        return True
+        return self._mark_settings_dirty()
 
     def set_binning(self, binning):
         """Set temporal binning (NIntegFrames)
 
         @param int binning: Number of frames to integrate
-        @return bool: Success?
+        @return bool: True if recorded; the hardware is updated by the debounced
+                      commit (see commit_settings). False if the previous
+                      commit failed.
         """
         # Clamp to valid range
         binning = max(self._MIN_INTEG_FRAMES, min(binning, self._MAX_INTEG_FRAMES))
@@ -914,31 +1370,9 @@ class SPC3_Qudi(CameraInterface):
         self._NIntegFrames = binning
 
         # Update exposure time
-        if self._camera_mode == "Advanced":
-            hardware_time = self._HardwareIntegration * 10e-9
-        else:
-            hardware_time = self._HardwareIntegration_Normal * 10e-9
-        self._exposure = binning * hardware_time
-
-        force8bit = self._to_binary(self._Force8bit, "Force8bit")
-        half_array = self._to_binary(self._Half_array, "Half_array")
-        signed_data = self._to_binary(self._Signed_data, "Signed_data")
+        self._update_exposure()
 
-        self.spc3.SetCameraPar(
-            (
-                self._HardwareIntegration
-                if self._camera_mode == "Advanced"
-                else self._HardwareIntegration_Normal
-            ),
-            self._NFrames,
-            self._NIntegFrames,
-            self._NCounters,
-            force8bit,
-            half_array,
-            signed_data,
-        )
-        self._apply_settings()
-        return True
+        return self._mark_settings_dirty()
 
     def get_binning(self):
         """Get the current temporal binning (NIntegFrames)
@@ -993,10 +1427,7 @@ class SPC3_Qudi(CameraInterface):
 
         @return bool: ready ?
         """
-        if self._live:
-            return False
-        else:
-            return True
+        return self._state != AcquisitionState.LIVE
 
     def capture_background_image(self):
         """Capture a background image for background subtraction.
@@ -1009,81 +1440,188 @@ class SPC3_Qudi(CameraInterface):
         """
         try:
             # Determine if we need to start/stop live mode
-            was_live = self._live
+            was_live = self._state == AcquisitionState.LIVE
             if not was_live:
-                self.start_live_acquisition()
-                import time
-
+                if not self.start_live_acquisition():
+                    self.log.error("Cannot capture background: live mode unavailable")
+                    return False
                 time.sleep(0.5)  # Give hardware time to stabilize
 
-            # Capture multiple live frames using NFrames from config
-            num_frames_to_average = self._NFrames
+            # Capture multiple live frames (background_frames, default NFrames)
+            num_frames_to_average = max(
+                1, int(self._background_frames or self._NFrames)
+            )
             self.log.info(
                 f"Capturing background: averaging {num_frames_to_average} frames"
             )
-            frames_list = []
-
-            for i in range(num_frames_to_average):
-                image_array = self.spc3.LiveGetImg()
-                counter0_frame = image_array[0]  # Shape: (rows, cols)
-                frames_list.append(counter0_frame)
 
-            # Stop live if we started it
-            if not was_live:
-                self.stop_acquisition()
+            # Sum the frames into one preallocated integer accumulator instead
+            # of keeping every frame and stacking them at the end. An int64
+            # sum of 16-bit frames cannot overflow for any frame count the
+            # background_frames / NFrames settings allow (< 2**47 frames).
+            accum = np.zeros(self._frame_shape, dtype=np.int64)
+            # Frames come from the live producer thread, so the next
+            # LiveGetImg() overlaps with accumulating the current frame.
+            try:
+                self._accumulate_live_frames(accum, num_frames_to_average)
+            finally:
+                # Stop live if we started it
+                if not was_live:
+                    self.stop_acquisition()
 
-            # Stack and average all frames
-            frames_stack = np.stack(
-                frames_list, axis=0
-            )  # Shape: (num_frames, rows, cols)
-            background_2d = np.mean(frames_stack, axis=0).astype(
-                np.uint16
-            )  # Shape: (rows, cols)
+            # Divide once at the end (exact integer mean, truncated)
+            accum //= num_frames_to_average
+            background_2d = accum.astype(np.uint16)  # Shape: (rows, cols)
 
-            # Flatten to 1D for storage
-            self._background_image = background_2d.flatten()
+            # Stored in frame shape, like the frames it is subtracted from
+            self._background_image = background_2d
+            # float32 copy in frame shape, used by apply_background_subtraction
+            self._background_f32 = background_2d.astype(np.float32)
 
             self.log.info(
                 f"Background image captured: averaged {num_frames_to_average} frames"
             )
             return True
         except Exception as e:
-            import traceback
-
             self.log.error(f"Failed to capture background image: {e}")
             self.log.error(f"Traceback: {traceback.format_exc()}")
             return False
 
-    def apply_background_subtraction(self, frame):
+    def _accumulate_live_frames(self, accum, num_frames):
+        """Add the next *num_frames* frames published by the grab thread to *accum*.
+
+        Each frame is copied out of its ring slot with a sequence check (see
+        _copy_latest_live_frame), so a slot the producer is rewriting is
+        never added.
+
+        @param numpy.ndarray accum: (rows, cols) accumulator, updated in place
+        @param int num_frames: Number of distinct live frames to add
+        """
+        timeout = max(10 * self._exposure, 1.0)
+        seen = self._frames_captured
+        frame = np.empty(self._frame_shape, dtype=np.uint16)
+        added = 0
+        while added < num_frames:
+            if not self._frame_ready.wait(timeout):
+                raise TimeoutError(f"No live frame received within {timeout:.1f} s")
+            self._frame_ready.clear()
+            captured = self._frames_captured
+            if captured == seen:
+                continue
+            seen = self._copy_latest_live_frame(frame)
+            np.add(accum, frame, out=accum)
+            added += 1
+
+    def apply_background_subtraction(self, frame, out=None):
         """Apply stored background image to *frame* if subtraction is enabled.
 
         This is a pure, mode-independent helper.  It can be called on any
         2-D or 1-D frame array — from live, snap, or loaded-file display.
 
         @param numpy.ndarray frame: Raw pixel data (any shape)
-        @return numpy.ndarray: Subtracted frame (same shape and dtype), or the
-                               original frame unchanged if subtraction is off /
-                               no background has been captured yet.
+        @param numpy.ndarray out: Optional array of the frame's shape to write
+                                  the subtracted frame into
+        @return numpy.ndarray: Subtracted frame (same shape and dtype, or *out*),
+                               or the original frame unchanged if subtraction
+                               is off / no background has been captured yet.
         """
-        if not self._background_subtraction_enabled:
-            return frame
-        if not hasattr(self, "_background_image") or self._background_image is None:
+        if not self._background_subtraction_active(frame):
             return frame
 
-        original_shape = frame.shape
-        frame_flat = frame.flatten().astype(np.float32)
+        if frame.dtype == np.uint16:
+            if out is None:
+                out = np.empty_like(frame)
+            if frame.shape == self._frame_shape:
+                scratch = self._thread_scratch(np.uint16)
+            else:
+                scratch = np.empty_like(frame)
+            return self._subtract_background_u16(frame, out, scratch)
+        if frame.shape == self._frame_shape:
+            scratch = self._subtract_background_f32(
+                frame, self._thread_scratch(np.float32)
+            )
+        else:
+            scratch = self._subtract_background_f32(
+                frame, np.empty(frame.shape, dtype=np.float32)
+            )
+        if out is None:
+            return scratch.astype(frame.dtype)
+        np.copyto(out, scratch, casting="unsafe")
+        return out
 
-        if self._background_image.size != frame_flat.size:
+    def _background_subtraction_active(self, frame):
+        """Return True if the stored background can be subtracted from *frame*."""
+        if not self._background_subtraction_enabled:
+            return False
+        if self._background_image is None:
+            return False
+        if self._background_image.size != frame.size:
             self.log.warning(
-                f"Background size mismatch: frame={frame_flat.size}, "
+                f"Background size mismatch: frame={frame.size}, "
                 f"background={self._background_image.size} — subtraction skipped"
             )
-            return frame
+            return False
+        return True
 
-        subtracted = np.maximum(
-            frame_flat - self._background_image.astype(np.float32), 0
-        )
-        return subtracted.astype(frame.dtype).reshape(original_shape)
+    def _subtract_background_u16(self, frame, out, scratch):
+        """Saturating uint16 subtraction: *out* = max(*frame* - background, 0).
+
+        The background is the integer mean of raw frames, so this gives the
+        same result as the float32 path while staying in uint16: two passes
+        over half the bytes, no conversion and no clipping pass.
+
+        @param numpy.ndarray frame: uint16 pixel data
+        @param numpy.ndarray out: array of the frame's shape; may be *frame*
+        @param numpy.ndarray scratch: uint16 array of the frame's shape, not
+                                      aliasing *frame* or *out*
+        @return numpy.ndarray: out
+        """
+        bg = self._background_image
+        if bg.shape != frame.shape:
+            bg = bg.reshape(frame.shape)
+        np.minimum(frame, bg, out=scratch)
+        return np.subtract(frame, scratch, out=out)
+
+    def _subtract_background_f32(self, frame, scratch, subtract=True):
+        """Write *frame* as float32 into *scratch*, minus the background if asked.
+
+        Subtraction and conversion run in one pass and the result is clipped
+        at zero in place, so no temporaries are allocated.
+
+        @param numpy.ndarray frame: Raw pixel data
+        @param numpy.ndarray scratch: float32 array of the frame's shape
+        @param bool subtract: Subtract the stored background (see
+                              _background_subtraction_active)
+        @return numpy.ndarray: scratch
+        """
+        if subtract:
+            bg = self._background_f32
+            if bg.shape != frame.shape:
+                bg = bg.reshape(frame.shape)
+            np.subtract(
+                frame,
+                bg,
+                out=scratch,
+                dtype=np.float32,
+                casting="unsafe",
+            )
+            np.maximum(scratch, 0, out=scratch)
+        else:
+            np.copyto(scratch, frame, casting="unsafe")
+        return scratch
+
+    def _thread_scratch(self, dtype):
+        """Return the calling thread's reusable scratch frame of *dtype*.
+
+        Each thread gets its own buffer, so concurrent subtractions never write
+        into the same scratch memory.
+        """
+        name = np.dtype(dtype).name
+        scratch = getattr(self._scratch, name, None)
+        if scratch is None or scratch.shape != self._frame_shape:
+            scratch = np.empty(self._frame_shape, dtype=dtype)
+            setattr(self._scratch, name, scratch)
+        return scratch
 
     def enable_background_subtraction(self):
         """Enable software background subtraction.
@@ -1092,7 +1630,7 @@ class SPC3_Qudi(CameraInterface):
 
         @return bool: Success ?
         """
-        if not hasattr(self, "_background_image") or self._background_image is None:
+        if self._background_image is None:
             self.log.warning(
                 "No background image captured. Call capture_background_image() first."
             )
@@ -1120,32 +1658,59 @@ class SPC3_Qudi(CameraInterface):
         frames, header = self.spc3.ReadSPC3DataFile(path)
         return frames, header
 
+    def read_spc3_file_mmap(self, path):
+        """Map the frames of a .spc3 data file without reading them into memory.
+
+        SPC3.ReadSPC3DataFile memory-maps the pixel data, so frames are paged in
+        on demand when they are accessed. Only the frames present in the file
+        are mapped, also for truncated files.
+
+        @param str path: Path to .spc3 file
+        @return numpy.ndarray: Frames of shape (num_counters, num_frames, rows, cols)
+        """
+        frames, _ = self.read_spc3_file(path)
+        return frames
+
     def save_frames_to_file(self, frames, filepath):
         """Save acquired snap frames to .spc3 file using SDK
 
         Uses SDK's SaveImgDisk to write directly from internal buffer.
         SDK may add .spc3 extension automatically.
 
+        A path ending in .npy or .npz instead writes *frames* itself with numpy
+        (.npz compressed, under the key 'frames'), without going through the
+        SDK. These hold the frames as returned by start_single_acquisition(),
+        i.e. with background subtraction already applied. .spc3 remains the
+        default format for exchange with other SPC3 tools.
+
         @param numpy array frames: Frames array (to get actual frame count)
         @param str filepath: Path to save file
         @return bool: Success?
         """
         try:
-            import os
-
             # Normalize path to Windows format (handles spaces in directory names)
             filepath = os.path.normpath(filepath)
 
-            # Remove .spc3 extension if present (SDK adds it automatically)
-            if filepath.endswith(".spc3"):
-                filepath = filepath[:-5]
-
             # Ensure directory exists
             directory = os.path.dirname(filepath)
             if directory and not os.path.exists(directory):
                 os.makedirs(directory, exist_ok=True)
                 self.log.info(f"Created directory: {directory}")
 
+            # Numpy output: dump the frames already in memory
+            ext = os.path.splitext(filepath)[1].lower()
+            if ext in (".npy", ".npz") and frames is not None:
+                self.log.info(f"Saving {frames.shape[1]} frames to '{filepath}'")
+                if ext == ".npz":
+                    np.savez_compressed(filepath, frames=frames)
+                else:
+                    np.save(filepath, np.ascontiguousarray(frames))
+                return True
+
+            # Remove .spc3 extension if present (SDK adds it automatically)
+            if filepath.endswith(".spc3"):
+                filepath = filepath[:-5]
+
             # Get actual number of frames from the frames array
             # Shape is (num_counters, num_frames, rows, cols)
             actual_num_frames = frames.shape[1]
@@ -1174,45 +1739,43 @@ class SPC3_Qudi(CameraInterface):
                 return False
         except Exception as e:
             self.log.error(f"Failed to save frames: {e}")
-            import traceback
-
             self.log.error(f"Traceback: {traceback.format_exc()}")
             return False
 
     def load_acquisition_file(self, filepath):
         """Load acquisition file for viewing
 
-        Loads .npy files (from snap) or .spc3 files (from continuous acquisitions).
-        Works with any image dimensions stored in the file.
+        Loads .npy/.npz files (from snap) or .spc3 files (from continuous
+        acquisitions). Works with any image dimensions stored in the file.
 
-        @param str filepath: Path to .npy or .spc3 file
+        @param str filepath: Path to .npy, .npz or .spc3 file
         @return bool: Success?
         """
         try:
-            import os
-
             # Normalize path to Windows format (handles spaces in directory names)
             filepath = os.path.normpath(filepath)
 
-            # Load based on file extension
-            if filepath.endswith(".npy"):
-                # Numpy format (snap acquisitions)
-                self._loaded_frames = np.load(filepath)
-                self._loaded_header = {}  # No header in numpy files
+            # Load based on file extension, case-insensitive like the save path
+            ext = os.path.splitext(filepath)[1].lower()
+            if ext == ".npy":
+                # Numpy format (snap acquisitions), no header. Memory-mapped
+                # read-only, so only the frames that are viewed are read.
+                frames, header = np.load(filepath, mmap_mode="r"), {}
+            elif ext == ".npz":
+                # Compressed numpy format, see save_frames_to_file
+                with np.load(filepath) as archive:
+                    frames, header = archive["frames"], {}
             else:
-                # SPC3 format (continuous acquisitions)
-                self._loaded_frames, self._loaded_header = self.read_spc3_file(filepath)
-            self._current_frame_index = 0
-            self._loaded_filepath = filepath
+                # SPC3 format (continuous acquisitions), memory-mapped read-only
+                frames, header = self.read_spc3_file(filepath)
+            self._set_loaded_frames(frames, header, filepath)
 
-            num_counters, num_frames, rows, cols = self._loaded_frames.shape
+            num_counters, num_frames, rows, cols = frames.shape
             self.log.info(
                 f"Loaded {num_frames} frames ({rows}\u00d7{cols}) from {filepath}"
             )
 
             # Auto-load background sidecar if present
-            import os
-
             stem = os.path.splitext(filepath)[0]
             sidecar = stem + ".bg.npy"
             if os.path.exists(sidecar):
@@ -1226,20 +1789,33 @@ class SPC3_Qudi(CameraInterface):
             return True
         except Exception as e:
             self.log.error(f"Failed to load file {filepath}: {e}")
-            import traceback
-
             self.log.error(f"Traceback: {traceback.format_exc()}")
             return False
 
+    def _set_loaded_frames(self, frames, header, filepath):
+        """Make *frames* (counters, frames, rows, cols) the loaded data set."""
+        self._loaded_frames = frames
+        # Counter 0, (frames, rows, cols). Kept as a view so memory-mapped
+        # files are not read into RAM; get_loaded_frame() makes the single
+        # requested frame contiguous.
+        self._frames_view = frames[0]
+        self._loaded_header = header
+        self._current_frame_index = 0
+        self._loaded_filepath = filepath
+
     def convert_spc3_to_numpy(self, spc3_filepath, numpy_filepath):
         """Convert SPC3 format file to numpy format
 
+        Written with np.save so that load_acquisition_file() can memory-map it.
+
         @param str spc3_filepath: Path to input .spc3 file
         @param str numpy_filepath: Path to output .npy file
         @return bool: Success?
         """
         try:
-            frames, header = self.read_spc3_file(spc3_filepath)
+            # The frames are mapped rather than read, so np.save streams them
+            # from the .spc3 file in C order without a full in-memory copy
+            frames = self.read_spc3_file_mmap(spc3_filepath)
             np.save(numpy_filepath, frames)
             self.log.info(
                 f"Converted {spc3_filepath} to numpy format: {numpy_filepath}"
@@ -1254,31 +1830,33 @@ class SPC3_Qudi(CameraInterface):
 
         @return int: Number of frames, or 0 if no file loaded
         """
-        if hasattr(self, "_loaded_frames") and self._loaded_frames is not None:
-            # frames shape is (num_counters, num_frames, rows, cols)
-            return self._loaded_frames.shape[1]
+        if self._loaded_frames is not None:
+            # view shape is (num_frames, rows, cols)
+            return self._frames_view.shape[0]
         return 0
 
     def get_loaded_frame(self, frame_index):
         """Get a specific frame from loaded file
 
         @param int frame_index: Frame index (0-based)
-        @return numpy array: Frame data, or None if invalid
+        @return numpy array: C-contiguous (rows, cols) frame data, or None if
+                             invalid
         """
-        if not hasattr(self, "_loaded_frames") or self._loaded_frames is None:
+        if self._loaded_frames is None:
             self.log.warning("No file loaded")
             return None
 
-        num_frames = self._loaded_frames.shape[1]
+        num_frames = self._frames_view.shape[0]
         if frame_index < 0 or frame_index >= num_frames:
             self.log.warning(
                 f"Frame index {frame_index} out of range [0, {num_frames-1}]"
             )
             return None
 
-        # Extract counter 0, frame at index
-        # Shape: (num_counters, num_frames, rows, cols) after BufferToFrames
-        frame = self._loaded_frames[0, frame_index, :, :]  # Returns (rows, cols)
+        # Frame at index of counter 0, shape (rows, cols). A view when already
+        # contiguous (.npy); strided .spc3 frames (rows and cols swapped by
+        # BufferToFrames) are copied, one frame at a time.
+        frame = np.ascontiguousarray(self._frames_view[frame_index])
         self._current_frame_index = frame_index
         return frame
 
@@ -1287,18 +1865,14 @@ class SPC3_Qudi(CameraInterface):
 
         @return int: Current frame index
         """
-        if hasattr(self, "_current_frame_index"):
-            return self._current_frame_index
-        return 0
+        return self._current_frame_index
 
     def get_loaded_filepath(self):
         """Get path of currently loaded file
 
         @return str: Filepath, or None if no file loaded
         """
-        if hasattr(self, "_loaded_filepath"):
-            return self._loaded_filepath
-        return None
+        return self._loaded_filepath
 
     def get_loaded_background(self):
         """Return the background image associated with the currently loaded file.
@@ -1309,9 +1883,7 @@ class SPC3_Qudi(CameraInterface):
         @return numpy.ndarray or None: float32 array of shape (rows, cols),
                                        or None if no sidecar was found.
         """
-        if hasattr(self, "_loaded_background"):
-            return self._loaded_background
-        return None
+        return self._loaded_background
 
     def load_frames_from_memory(self, frames):
         """Load frames directly from memory for viewing
@@ -1320,10 +1892,8 @@ class SPC3_Qudi(CameraInterface):
         @return bool: Success?
         """
         try:
-            self._loaded_frames = frames
-            self._loaded_header = {}  # No header for memory frames
-            self._current_frame_index = 0
-            self._loaded_filepath = "(unsaved snap acquisition)"
+            # No header for memory frames
+            self._set_loaded_frames(frames, {}, "(unsaved snap acquisition)")
 
             num_counters, num_frames, rows, cols = frames.shape
             self.log.info(
@@ -1332,7 +1902,5 @@ class SPC3_Qudi(CameraInterface):
             return True
         except Exception as e:
             self.log.error(f"Failed to load frames from memory: {e}")
-            import traceback
-
             self.log.error(f"Traceback: {traceback.format_exc()}")
             return False
@@ -28,8 +28,25 @@
 import os
 import sys
 import platform
+import ctypes
 import numpy as np
-from ctypes import *
+from ctypes import (
+    POINTER,
+    byref,
+    c_char,
+    c_char_p,
+    c_double,
+    c_int,
+    c_int16,
+    c_short,
+    c_uint8,
+    c_uint16,
+    c_uint32,
+    c_void_p,
+    cast,
+    create_string_buffer,
+    sizeof,
+)
 import matplotlib.pyplot as plt
 
 assert sys.version_info.major >= 3
@@ -117,7 +134,7 @@ class SPC3(object):
             # if sys.version_info.minor < 8:
             #     os.environ["PATH"] = lib_dir + os.pathsep + os.environ["PATH"]
 
-            self.dll = WinDLL(lib_path)
+            self.dll = ctypes.WinDLL(lib_path)
 
         else:
             raise NotImplementedError("Unsupported platform")
@@ -229,42 +246,42 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H points to an empty memory location
             OUT_OF_BOUND Exposure, NFrames and NIntegFrames must be all greater than zero and smaller than 65535
         """
+        # the prototype is configured on first use only; with argtypes set,
+        # ctypes converts the plain ints below in C, no ctypes objects are needed
         f = self.dll.SPC3_Set_Camera_Par
-        f.argtypes = [
-            SPC3_H,
-            c_uint16,
-            c_uint32,
-            c_uint16,
-            c_uint16,
-            c_int,
-            c_int,
-            c_int,
-        ]
-        f.restype = SPC3Return
-
-        Exposure = c_uint16(int(Exposure))
-        NFrames = c_uint32(int(NFrames))
-        NIntegFrames = c_uint16(int(NIntegFrames))
-        NCounters = c_uint16(int(NCounters))
-        Force8bit = c_int(int(Force8bit))
-        Half_array = c_int(int(Half_array))
-        Signed_data = c_int(int(Signed_data))
+        if f.argtypes is None:
+            f.argtypes = [
+                SPC3_H,
+                c_uint16,
+                c_uint32,
+                c_uint16,
+                c_uint16,
+                c_int,
+                c_int,
+                c_int,
+            ]
+            f.restype = SPC3Return
+
+        NFrames = int(NFrames)
+        NCounters = int(NCounters)
+        Half_array = int(Half_array)
+        Signed_data = int(Signed_data)
         #  DllSDKExport HermesReturn HermesSetCameraPar(Hermes_H Hermes, uint16_t Exposure, uint32_t NFrames, uint16_t NIntegFrames, uint16_t NCounters, State Force8bit, State Half_array, State Signed_data);
         ec = f(
             self.c_handle,
-            Exposure,
+            int(Exposure),
             NFrames,
-            NIntegFrames,
+            int(NIntegFrames),
             NCounters,
-            Force8bit,
+            int(Force8bit),
             Half_array,
             Signed_data,
         )
         self._checkError(ec)
 
         # keep record of settings
-        self._snap_num_frames = NFrames.value
-        self._num_counters = NCounters.value
+        self._snap_num_frames = NFrames
+        self._num_counters = NCounters
         self._data_is_signed = bool(Signed_data)
 
         if Half_array:
@@ -389,7 +406,8 @@ class SPC3(object):
         ]
         f.restype = SPC3Return
         #  DllSDKExport HermesReturn HermesSetBackgroundImg(Hermes_H Hermes, uint16_t* Img);
-        data = Img.flatten().astype(np.uint16)
+        # View of Img when it is already C-contiguous uint16, one copy otherwise
+        data = np.ascontiguousarray(Img, dtype=np.uint16).reshape(-1)
         ec = f(self.c_handle, data)
         self._checkError(ec)
         return
@@ -706,14 +724,18 @@ class SPC3(object):
 
         return
 
-    def LiveGetImg(self):
+    def LiveGetImg(self, out=None):
         """LiveGetImg - Get a Live image for each active counter.
 
         Parameters:
-            None
+            out: Optional preallocated 1-d uint16 array of row_size * num_rows * num_counters elements.
+                The SDK writes the image directly into it and the returned frames are views of it.
+                Its unused tail beyond the active pixels is left untouched.
 
         Returns:
-            Live image for each active counter.
+            Live image of counter 1 only, shaped (1, cols, rows) like one counter of BufferToFrames().
+            Index 0 is the frame, not a counter. For other counters, pass out and apply BufferToFrames()
+            to it.
         Error codes:
             NULL_POINTER The provided Hermes_H or Img point to an empty memory location
             INVALID_OP The live-mode has not been started yet
@@ -725,14 +747,20 @@ class SPC3(object):
         ]
         f.restype = SPC3Return
 
-        data = np.zeros(
-            self.row_size * self._num_rows * int(self._num_counters), dtype=np.uint16
-        )
+        num_counters = int(self._num_counters)
+        if out is None:
+            # The SDK overwrites the active pixels; only the unused tail is cleared
+            data = np.empty(
+                self.row_size * self._num_rows * num_counters, dtype=np.uint16
+            )
+            data[self._num_pixels * num_counters :] = 0
+        else:
+            data = out
         #  DllSDKExport HermesReturn HermesLiveGetImg(Hermes_H Hermes, uint16_t* Img);
         ec = f(self.c_handle, data)
         self._checkError(ec)
         frames = self.BufferToFrames(data, self._num_pixels, self._num_counters)
-        return frames[0]  # we always have data of only frame [0] for all counters
+        return frames[0]  # counter 1; live mode has a single frame per counter
 
     def SnapPrepare(self):
         """SnapPrepare - Prepare the camera to the acquisition of a snap.
@@ -832,12 +860,14 @@ class SPC3(object):
             NULL_POINTER The provided Hermes_H or Img point to an empty memory location
             OUT_OF_BOUND Parameters are out of bound.
         """
-        data = np.zeros(self.row_size * self._num_rows, dtype=np.float64)
+        # The SDK writes uint16 pixels (see prototype below) over the active pixels
+        data = np.empty(self.row_size * self._num_rows, dtype=np.uint16)
+        data[self._num_pixels :] = 0
 
         f = self.dll.SPC3_Get_Img_Position
         f.argtypes = [
             SPC3_H,
-            np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags="C_CONTIGUOUS"),
+            np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags="C_CONTIGUOUS"),
             c_uint32,
             c_uint16,
         ]
@@ -1342,12 +1372,13 @@ class SPC3(object):
             c_char_p,
             c_uint32,
             c_uint16,
-            np.ctypeslib.ndpointer(dtype=np.float64, ndim=1, flags="C_CONTIGUOUS"),
+            np.ctypeslib.ndpointer(dtype=np.uint16, ndim=1, flags="C_CONTIGUOUS"),
             c_char_p,
         ]
         f.restype = SPC3Return
 
-        Img = np.zeros(self.row_size * self._num_rows, dtype=np.uint16)
+        Img = np.empty(self.row_size * self._num_rows, dtype=np.uint16)
+        Img[self._num_pixels :] = 0
         header = create_string_buffer(1024)
         #  DllSDKExport HermesReturn HermesReadHermesFileFormatImage(char* filename, uint32_t ImgIdx, uint16_t counter, uint16_t* Img, char header[1024]);
         ec = f(filename.encode("utf-8"), ImgIdx, counter, Img, header)
@@ -1593,6 +1624,11 @@ class SPC3(object):
         """ReadSPC3DataFile - reads .spc acquisition files
         or "raw" data read from spc data files to a more structured data set containing multiple frames
 
+        The pixel data is memory-mapped read-only rather than read, so frames
+        are paged in from the file when they are accessed. The returned frames
+        are a read-only view of the file whenever the pixel count is a multiple
+        of one row (see BufferToFrames); copy them before modifying.
+
         Parameters
             path: path to the .spc3 data file
         Returns:
@@ -1691,8 +1727,19 @@ class SPC3(object):
             dtype = np.uint8
         else:
             raise ValueError("invalid bit width, got {}".format(str(header.bit_x_pix)))
-        inf.seek(0)
-        data = np.fromfile(inf, offset=1024 + 8, count=data_count, dtype=dtype)
+        inf.close()
+        # Map at most the whole frames the file holds
+        itemsize = np.dtype(dtype).itemsize
+        frame_count = max(header.N_pix * header.N_counters, 1)
+        available = (os.path.getsize(path) - (1024 + 8)) // itemsize
+        available = max(available, 0) // frame_count * frame_count
+        data = np.memmap(
+            path,
+            dtype=dtype,
+            mode="r",
+            offset=1024 + 8,
+            shape=(min(data_count, available),),
+        )
 
         num_pixels = header.N_pix
         num_counters = header.N_counters
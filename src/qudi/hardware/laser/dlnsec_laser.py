@@ -28,75 +28,91 @@ SOFTWARE.
 """
 
 import serial
+from serial.tools import list_ports
 import six
-import sys
 import os
 import time
-import glob
 
 # CHANGE (2025-12-25): Added locking + robust parsing helpers for serial replies.
 import threading
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 open_connections = {}
 nconnected = 0
+# Lasers found by the last port scan, keyed by serial number: (port, serno, model)
+_discovered = {}
+# Serializes connect() so that concurrent callers do not scan the ports twice
+_connect_lock = threading.Lock()
+
+# Integer in a raw reply, for replies with stray characters around the number
+_INT_RE = re.compile(rb"-?\d+")
+
+# Command bytes for the operating modes accepted by DLnsec.set_mode
+_MODE_CMD = {"LAS": b"LAS", "INT": b"INT", "EXT": b"EXT", "STOP": b"STOP"}
+# Prescaler values accepted by DLnsec.set_prescaler
+_ALLOWED_PRE = frozenset({1, 8, 64, 256, 1024})
+# Seconds to wait after opening a port during the scan. Opening the port resets
+# the AVR board through DTR, and it only answers once its bootloader is done.
+_PROBE_SETTLE_S = 1.0
+# Seconds to wait for each reply during the scan
+_PROBE_TIMEOUT_S = 1.0
 
 
 def available_serial_ports():
-    portsavail = []
-    if sys.platform.startswith("win"):
-        ports = ["COM%s" % (i + 1) for i in range(256)]
-    elif sys.platform.startswith("linux") or sys.platform.startswith("cygwin"):
-        ports = glob.glob("/dev/tty[A-Za-z]*")
-    else:
-        raise EnvironmentError("platform not supported")
-    for port in ports:
-        try:
-            s = serial.Serial(port)
-            s.close()
-            portsavail.append(port)
-        except (OSError, serial.SerialException):
-            pass
-    return portsavail
+    # Enumerated from the OS device list; no port is opened
+    return [port.device for port in list_ports.comports()]
+
+
+def _probe(port, settle=_PROBE_SETTLE_S, timeout=_PROBE_TIMEOUT_S):
+    """Return (port, serno, model) if a laser answers on port, else None."""
+    try:
+        s = serial.Serial(
+            port=port,
+            baudrate=9600,
+            bytesize=serial.EIGHTBITS,
+            parity=serial.PARITY_NONE,
+            timeout=settle,
+        )
+    except (OSError, serial.SerialException):
+        return None
+    try:
+        # Let the board come out of its reset: returns with the first byte it
+        # sends, at the latest after settle seconds
+        s.read()
+        s.timeout = timeout
+        # Drop whatever is pending instead of waiting out a read timeout
+        s.reset_input_buffer()
+        strn = "HOWDY\n"
+        s.write(strn.encode())
+        answer = s.readline().strip().decode()
+        if not answer.startswith("Ready"):
+            return None
+        s.write(b"*IDN\n")
+        answer = s.readline().strip().decode()
+        if "DLNSEC" in answer.upper():
+            try:
+                model, serno = answer.split("_")
+            except:
+                model = "unknown"
+                serno = "00000"
+        else:
+            model = 0
+            serno = 0
+        return port, serno, model
+    except:
+        return None
+    finally:
+        s.close()
 
 
 def find_laser():
     ports = available_serial_ports()
-    nfound = 0
-    lasers = {}
-    for port in ports:
-        try:
-            s = serial.Serial(
-                port=port,
-                baudrate=9600,
-                bytesize=serial.EIGHTBITS,
-                parity=serial.PARITY_NONE,
-                timeout=1,
-            )
-            s.read()
-            strn = "HOWDY\n"
-            s.write(strn.encode())
-            answer = s.readline().strip().decode()
-            s.read()
-            if answer.startswith("Ready"):
-                s.write(b"*IDN\n")
-                answer = s.readline().strip().decode()
-                s.read()
-                nfound = nfound + 1
-                if "DLNSEC" in answer.upper():
-                    try:
-                        model, serno = answer.split("_")
-                    except:
-                        model = "unknown"
-                        serno = "00000"
-                    lasers[nfound] = (port, serno, model)
-                else:
-                    model = 0
-                    serno = 0
-                    lasers[nfound] = (port, serno, model)
-            s.close()
-        except:
-            pass
+    # Each port is a separate device, so the handshakes run concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        found = [laser for laser in executor.map(_probe, ports) if laser is not None]
+    nfound = len(found)
+    lasers = {n: laser for n, laser in enumerate(found, start=1)}
     print("")
     if nfound > 1:
         print("WARNING: More than one laser connected.")
@@ -105,8 +121,18 @@ def find_laser():
 
 
 class DLnsec:
-    def __init__(self, port=""):
+    # Default seconds to wait for a reply. A few characters at 9600 baud take
+    # ~5 ms, but the firmware can be slow to answer while it is busy.
+    reply_timeout = 1.0
+    # Upper bound on the length of one reply
+    max_reply_size = 64
+    # Seconds a write may block before pyserial raises SerialTimeoutException
+    write_timeout = 1
+
+    def __init__(self, port="", reply_timeout=None):
         self.port = port
+        if reply_timeout is not None:
+            self.reply_timeout = reply_timeout
         if port != "":
             self.open()
         else:
@@ -114,6 +140,7 @@ class DLnsec:
         # CHANGE (2025-12-25): Serialize I/O to prevent interleaved reads/writes
         # when Qudi polling and manual calls happen concurrently.
         self._io_lock = threading.Lock()
+        self._closed = False
         self.pre = None
         self.width = None
         self.laserison = None
@@ -128,37 +155,59 @@ class DLnsec:
             baudrate=9600,
             bytesize=serial.EIGHTBITS,
             parity=serial.PARITY_NONE,
-            timeout=2,
+            timeout=self.reply_timeout,
+            write_timeout=self.write_timeout,
         )
-        self.serial.write_timeout = 1
         self.serial.read_timeout = 1
 
     def close(self):
-        self.serial.close()
-        del self
+        # Release the port; the instance cannot be used afterwards
+        with self._io_lock:
+            try:
+                self.serial.close()
+            finally:
+                self.serial = None
+                self._closed = True
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError(f"DLnsec on {self.port} is closed")
+
+    def _send(self, data):
+        # Caller holds _io_lock. Blocking write, bounded by write_timeout;
+        # non-blocking (write_timeout=0) writes are unsafe with pyserial on
+        # Windows, where pending overlapped writes share one OVERLAPPED struct.
+        self.serial.write(data)
 
     def write(self, cmd):
         # CHANGE (2025-12-25): lock serial writes.
         with self._io_lock:
-            self.serial.write(cmd + b"\n")
+            self._check_open()
+            self._send(cmd + b"\n")
 
     def read(self, cmd):
         # print("reading", cmd)
         # CHANGE (2025-12-25): lock serial read/command and prefer CR-terminated replies.
         # Also clear stale bytes first to reduce concatenated/partial responses.
+        # The flush does not wait, and with the short reply timeout it also
+        # drops late replies to earlier commands.
         with self._io_lock:
+            self._check_open()
             try:
                 self.serial.reset_input_buffer()
             except Exception:
                 pass
 
-            self.serial.write(cmd + b"\n")
+            self._send(cmd + b"\n")
 
-            raw = self.serial.read_until(expected=b"\r")
-            if not raw:
-                raw = self.serial.readline()
+            # One bounded read: at most reply_timeout, no second fallback read.
+            # On timeout the caller gets TimeoutError.
+            raw = self.serial.read_until(expected=b"\r", size=self.max_reply_size)
+        if not raw:
+            raise TimeoutError(f"No reply to {cmd!r} from DLnsec on {self.port}")
 
-        return raw.decode(errors="ignore").strip()
+        # Raw bytes; callers parse them directly (int() accepts bytes)
+        return raw.strip()
 
     def on(self):
         self.write(b"*ON")
@@ -169,8 +218,7 @@ class DLnsec:
         self.laserison = 0
 
     def set_power(self, pwr):
-        strn = "PWR" + "{:0d}".format(pwr)
-        self.write(strn.encode())
+        self.write(b"PWR%d" % pwr)
         answer = self.get_power()
         return answer
 
@@ -187,7 +235,7 @@ class DLnsec:
         try:
             value = int(answer)
         except ValueError:
-            match = re.search(r"-?\d+", str(answer))
+            match = _INT_RE.search(answer)
             if not match:
                 raise
             value = int(match.group(0))
@@ -195,8 +243,11 @@ class DLnsec:
         return value
 
     def set_mode(self, mode):
-        assert mode in ["LAS", "INT", "EXT", "STOP"]
-        self.write(bytes(mode, encoding="utf-8") + b"")
+        try:
+            cmd = _MODE_CMD[mode]
+        except KeyError:
+            raise ValueError(f"Invalid mode {mode!r}") from None
+        self.write(cmd)
         self.modeis = mode
 
     def set_width(self, width):
@@ -209,50 +260,57 @@ class DLnsec:
 
     def set_prescaler(self, pre):
         assert type(pre) == int
-        assert pre in [1, 8, 64, 256, 1024]
+        if pre not in _ALLOWED_PRE:
+            raise ValueError(f"Invalid prescaler {pre!r}")
         self.pre = pre
         self.write(b"PRE %i" % int(pre))
         self.freq = 16e6 / 256 / pre
         self.t_cycle = 1 / self.freq
 
 
+def _is_port_name(name):
+    return name.upper().startswith("COM") or name.startswith("/dev/")
+
+
 def connect(ser=""):
-    """open conneciton to laser or return handle if already open"""
-    if ser == "":
-        if len(open_connections) == 0:  # no open connections
-            all_lasers = find_laser()  # find all available lasers
-            if len(all_lasers) == 0:
-                raise RuntimeError("No lasers found.")
-            next_laser = all_lasers.popitem()  # next available laser
-            port = next_laser[1][0]
-            ser = next_laser[1][1]
-            model = next_laser[1][2]
-            laser = DLnsec(port)
+    """open conneciton to laser or return handle if already open
+
+    ser is a port name (e.g. 'COM4'), a laser serial number, or empty for the
+    next discovered laser that is not open yet. Port names are opened
+    directly; only serial numbers and the empty default scan the ports, and
+    only once (see _discovered).
+    """
+    with _connect_lock:
+        if ser in open_connections:
+            return open_connections[ser]
+        if _is_port_name(ser):
+            laser = DLnsec(ser)
             open_connections[ser] = laser
             return laser
-        else:  # there are open connections
-            if len(all_lasers) > 0:  # there are lasers connected but not yet open
-                next_laser = all_lasers.popitem()  # next available laser
-                port = next_laser[1][0]
-                ser = next_laser[1][1]
-                model = next_laser[1][2]
-                laser = DLnsec(port)
-                open_connections[ser] = laser
-                return laser
-            else:
+
+        if not _discovered:
+            for port, serno, model in find_laser().values():
+                _discovered[str(serno)] = (port, serno, model)
+
+        if ser == "":
+            open_ports = {laser.port for laser in open_connections.values()}
+            candidates = [
+                (serno, port)
+                for serno, (port, _, _) in _discovered.items()
+                if port not in open_ports
+            ]
+            if not candidates:
+                if not _discovered:
+                    raise RuntimeError("No lasers found.")
                 raise RuntimeError("No more un-connected lasers.")
-    else:
-        if ser in open_connections:  # ser ist schon geöffnet
-            return open_connections[ser]
-        else:  # ser ist noch nicht offen
-            all_lasers = find_laser()
-            if ser in all_lasers:  # is ser a valid port?
-                port = all_lasers[ser][1][0]
-                laser = DLnsec(port)
-                open_connections[ser] = laser
-                return laser
-            else:
-                raise RuntimeError("Couldn't find DLnsec on port " + ser)
+            ser, port = candidates[-1]
+        elif ser in _discovered:
+            port = _discovered[ser][0]
+        else:
+            raise RuntimeError("Couldn't find DLnsec with serial number " + ser)
+        laser = DLnsec(port)
+        open_connections[ser] = laser
+        return laser
 
 
 def get_open_connections():
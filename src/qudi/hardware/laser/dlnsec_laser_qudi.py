@@ -22,7 +22,7 @@ If not, see <https://www.gnu.org/licenses/>.
 
 import math
 import time
-import random
+import numpy as np
 
 from qudi.core.configoption import ConfigOption
 from qudi.interface.simple_laser_interface_dlnsec import SimpleLaserInterface
@@ -34,6 +34,17 @@ from qudi.interface.simple_laser_interface_dlnsec import (
 )
 from qudi.hardware.laser.dlnsec_laser import DLnsec
 
+# Generator for the simulated temperature readings
+_RNG = np.random.default_rng()
+
+# DLnsec mode command for each trigger mode; anything else stops the laser
+_TRIGGER_CMD = {
+    TriggerMode.LAS: "LAS",
+    TriggerMode.INT: "INT",
+    TriggerMode.EXT: "EXT",
+    TriggerMode.STOP: "STOP",
+}
+
 
 class DlnsecLaser(SimpleLaserInterface):
     """
@@ -48,10 +59,12 @@ class DlnsecLaser(SimpleLaserInterface):
         module.Class: 'laser.dlnsec_laser_qudi.DlnsecLaser'
         options:
             port: 'COM4'
+            reply_timeout: 1.0  # seconds to wait for a reply from the laser
     """
 
     port_interface = ConfigOption(name="port", default="COM4", missing="warn")
     max_power_mw = ConfigOption(name="max_power_mw", default=110.0, missing="warn")
+    _reply_timeout = ConfigOption(name="reply_timeout", default=1.0)
 
     def __init__(self, **kwargs):
         """ """
@@ -63,11 +76,22 @@ class DlnsecLaser(SimpleLaserInterface):
         self.current_setpoint = 0
         # DLNSEC power is controlled as a percentage of max output power.
         self.power_setpoint = 0.0
+        # On/off commands must be at least _min_gap seconds apart; only the
+        # remainder of that interval is waited for (see _guard)
+        self._min_gap = 1.0
+        self._next_cmd_time = 0.0
+        # Last power read back from the device in percent, with its
+        # time.monotonic() timestamp; reused for _pwr_cache_ttl seconds
+        self._pwr_cache_ttl = 0.2
+        self._pwr_cache = (0.0, -math.inf)
+        # Integer percent last sent to the device, None if not sent yet
+        self._power_sent = None
 
     def on_activate(self):
         """Activate module."""
 
-        self.laser = DLnsec(self.port_interface)
+        self.laser = DLnsec(self.port_interface, reply_timeout=self._reply_timeout)
+        self._power_sent = None
 
     def on_deactivate(self):
         """Deactivate module."""
@@ -87,7 +111,18 @@ class DlnsecLaser(SimpleLaserInterface):
         """
         # The underlying DLnsec driver returns the device power setting in percent (0..100).
         # Convert that to mW based on the configured max power.
-        return (float(self.laser.get_power()) / 100.0) * self.max_power_mw
+        # Polls within _pwr_cache_ttl of the last read share one serial round trip.
+        # If the laser does not answer, the last known value is reported.
+        now = time.monotonic()
+        percent, timestamp = self._pwr_cache
+        if now - timestamp >= self._pwr_cache_ttl:
+            try:
+                percent = float(self.laser.get_power())
+            except TimeoutError as e:
+                self.log.warning(f"{e}; reporting the last known power")
+            else:
+                self._pwr_cache = (percent, now)
+        return (percent / 100.0) * self.max_power_mw
 
     def get_power_setpoint(self):
         """Return optical power setpoint.
@@ -104,8 +139,22 @@ class DlnsecLaser(SimpleLaserInterface):
         power_percent = float(power)
         power_percent = max(0.0, min(100.0, power_percent))
         self.power_setpoint = power_percent
-        # DLnsec expects integer percent (0..100).
-        self.laser.power(int(round(power_percent)))
+        # DLnsec expects integer percent (0..100). Slider bursts that round
+        # to the value already sent do not touch the serial line.
+        power_int = int(round(power_percent))
+        if power_int == self._power_sent:
+            return
+        # The driver reads the power back after setting it, which also
+        # refreshes the cache.
+        try:
+            percent = float(self.laser.power(power_int))
+        except TimeoutError as e:
+            # The command went out, only the read-back is missing
+            self.log.warning(f"{e}; power read-back after setting skipped")
+            self._power_sent = power_int
+            return
+        self._power_sent = power_int
+        self._pwr_cache = (percent, time.monotonic())
 
     def get_current_unit(self):
         """Get unit for laser current.
@@ -189,21 +238,21 @@ class DlnsecLaser(SimpleLaserInterface):
         @param TriggerMode trigger_mode: desired trigger mode enum
         """
         self.triggermode = trigger_mode
-        if trigger_mode == TriggerMode.LAS:
-            self.laser.set_mode("LAS")
-        elif trigger_mode == TriggerMode.INT:
-            self.laser.set_mode("INT")
-        elif trigger_mode == TriggerMode.EXT:
-            self.laser.set_mode("EXT")
-        else:
-            self.laser.set_mode("STOP")
+        self.laser.set_mode(_TRIGGER_CMD.get(trigger_mode, "STOP"))
+
+    def _guard(self):
+        """Wait until _min_gap has passed since the last on/off command."""
+        wait = self._next_cmd_time - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._next_cmd_time = time.monotonic() + self._min_gap
 
     def on(self):
         """Turn on laser.
 
         @return LaserState: actual laser state
         """
-        time.sleep(1)
+        self._guard()
         self.laser.on()
         # self.laser.set_mode("LAS")
         self.lstate = LaserState.ON
@@ -214,7 +263,7 @@ class DlnsecLaser(SimpleLaserInterface):
 
         @return LaserState: actual laser state
         """
-        time.sleep(1)
+        self._guard()
         self.laser.off()
         self.lstate = LaserState.OFF
         return self.lstate
@@ -231,7 +280,7 @@ class DlnsecLaser(SimpleLaserInterface):
 
         @param LaserState state: desired laser state enum
         """
-        time.sleep(1)
+        # on()/off() wait for the command interval themselves
         self.lstate = state
         if state == LaserState.ON:
             self.on()
@@ -261,7 +310,8 @@ class DlnsecLaser(SimpleLaserInterface):
 
         @return dict: dict of temperature names and value in degrees Celsius
         """
-        return {"psu": 32.2 * random.gauss(1, 0.1), "head": 42.0 * random.gauss(1, 0.2)}
+        psu_k, head_k = _RNG.normal(loc=1.0, scale=(0.1, 0.2))
+        return {"psu": 32.2 * psu_k, "head": 42.0 * head_k}
 
     def get_extra_info(self):
         """Multiple lines of dignostic information
@@ -20,10 +20,11 @@ You should have received a copy of the GNU Lesser General Public License along w
 If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
+import numbers
 import datetime
+import threading
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 from PySide2 import QtCore
 from qudi.core.connector import Connector
 from qudi.core.configoption import ConfigOption
@@ -31,6 +32,11 @@ from qudi.util.mutex import RecursiveMutex
 from qudi.core.module import LogicBase
 
 
+def _is_number(value):
+    """Return True if *value* is a real number and not a bool success flag."""
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
 class CameraLogic(LogicBase):
     """Logic class for controlling a camera.
 
@@ -60,20 +66,62 @@ class CameraLogic(LogicBase):
     )
 
     # signals
+    # Live and continuous frames are emitted from a two-slot frame pool: the
+    # array stays intact for one more tick and is then overwritten.
+    # Receivers that keep a frame beyond that must copy it (see last_frame).
+    # Qt queues a reference to the array, not its bytes, and the frame keeps
+    # its full bit depth so the GUI colour bar shows real counts / cps.
     sigFrameChanged = QtCore.Signal(object)
     sigAcquisitionFinished = QtCore.Signal()
+    # Emitted from the camera's grab thread when a live frame is ready
+    _sigFrameReady = QtCore.Signal()
+    # Emitted from the drain thread when draining the camera memory failed
+    _sigContDrainFailed = QtCore.Signal()
+
+    # Preview refresh period during continuous acquisition. The data itself is
+    # drained by _cont_drain_loop; the preview only shows the last live frame.
+    _CONT_PREVIEW_INTERVAL_MS = 50
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__timer = None
+        # Serializes state changes. Getters only read values the hardware
+        # caches and do not take it.
         self._thread_lock = RecursiveMutex()
         self._exposure = 100
         self._gain = 1
         self._last_frame = None
+        # Double-buffered live frames, reused while shape and dtype are unchanged
+        self._frame_pool = [None, None]
+        self._pool_idx = 0
+        # Live video is driven by the camera's frame-ready callback, if any
+        self._frame_callback_active = False
+        self._frame_pending = False
+        # Timer-driven video step settings, fixed for a run by _start_video
+        self._video_interval_ms = 0
+        self._video_retrigger = False
+        # Continuous acquisition is drained to disk by a dedicated thread
+        self._cont_stop_event = threading.Event()
+        self._cont_thread = None
+        self.total_bytes = 0
+        # Optional camera features, probed once in on_activate
+        self._caps = {}
+        self._cam = None
 
     def on_activate(self):
         """Initialisation performed during activation of the module."""
-        camera = self._camera()
+        # Resolved once; the connector lookup is not repeated on every call
+        camera = self._cam = self._camera()
+        self._caps = {
+            "bg_capture": callable(getattr(camera, "capture_background_image", None)),
+            "bg_sub": callable(getattr(camera, "enable_background_subtraction", None)),
+            "bg_apply": callable(getattr(camera, "apply_background_subtraction", None)),
+            "snap_frames": hasattr(camera, "_NFrames"),
+            "hw_integration": callable(
+                getattr(camera, "set_hardware_integration", None)
+            ),
+            "load_file": callable(getattr(camera, "load_acquisition_file", None)),
+        }
         self._exposure = camera.get_exposure()
         self._gain = camera.get_gain()
 
@@ -83,16 +131,31 @@ class CameraLogic(LogicBase):
         self.__timer_continuous = QtCore.QTimer()
         self.__timer_continuous.setSingleShot(True)
         self.__timer_continuous.timeout.connect(self.__acquire_continuous_frame)
+        self._sigFrameReady.connect(
+            self.__acquire_video_frame, QtCore.Qt.QueuedConnection
+        )
+        self._sigContDrainFailed.connect(
+            self._stop_continuous_acquisition, QtCore.Qt.QueuedConnection
+        )
 
     def on_deactivate(self):
         """Perform required deactivation."""
         self.__timer.stop()
         self.__timer.timeout.disconnect()
         self.__timer = None
+        self._sigFrameReady.disconnect()
+        self._sigContDrainFailed.disconnect()
+        self._cam = None
 
     @property
     def last_frame(self):
-        return self._last_frame
+        """Snapshot of the most recent frame, safe to keep.
+
+        @return numpy.ndarray: copy of the last frame, or None
+        """
+        # Copied here, on the rare save path, instead of on every frame
+        frame = self._last_frame
+        return None if frame is None else frame.copy()
 
     def set_exposure(self, time):
         """Set exposure time of camera in SECONDS
@@ -101,9 +164,12 @@ class CameraLogic(LogicBase):
         """
         with self._thread_lock:
             if self.module_state() == "idle":
-                camera = self._camera()
-                camera.set_exposure(time)
-                self._exposure = camera.get_exposure()
+                # The camera returns the exposure it actually applied. Some
+                # implementations return a success flag instead; read it back.
+                exposure = self._cam.set_exposure(time)
+                if not _is_number(exposure):
+                    exposure = self._cam.get_exposure()
+                self._exposure = exposure
             else:
                 self.log.error(
                     "Unable to set exposure time. Acquisition still in progress."
@@ -114,17 +180,15 @@ class CameraLogic(LogicBase):
 
         @return float: Exposure time in seconds
         """
-        with self._thread_lock:
-            self._exposure = self._camera().get_exposure()
-            return self._exposure
+        self._exposure = self._cam.get_exposure()
+        return self._exposure
 
     def get_display_units(self):
         """Get the display units setting
 
         @return str: 'counts' or 'cps'
         """
-        with self._thread_lock:
-            return self._camera().get_display_units()
+        return self._cam.get_display_units()
 
     def set_display_units(self, units):
         """Set the display units
@@ -134,7 +198,7 @@ class CameraLogic(LogicBase):
         """
         with self._thread_lock:
             if self.module_state() == "idle":
-                return self._camera().set_display_units(units)
+                return self._cam.set_display_units(units)
             else:
                 self.log.warning("Cannot change display units during acquisition")
                 return False
@@ -147,8 +211,8 @@ class CameraLogic(LogicBase):
         """
         with self._thread_lock:
             if self.module_state() == "idle":
-                camera = self._camera()
-                if hasattr(camera, "_NFrames"):
+                camera = self._cam
+                if self._caps["snap_frames"]:
                     camera._NFrames = max(1, min(num_frames, 65534))
                     # Apply the change to camera hardware
                     try:
@@ -170,32 +234,37 @@ class CameraLogic(LogicBase):
     def set_gain(self, gain):
         with self._thread_lock:
             if self.module_state() == "idle":
-                camera = self._camera()
-                camera.set_gain(gain)
-                self._gain = camera.get_gain()
+                gain = self._cam.set_gain(gain)
+                if not _is_number(gain):
+                    gain = self._cam.get_gain()
+                self._gain = gain
             else:
                 self.log.error("Unable to set gain. Acquisition still in progress.")
 
     def get_gain(self):
-        with self._thread_lock:
-            self._gain = self._camera().get_gain()
-            return self._gain
+        self._gain = self._cam.get_gain()
+        return self._gain
 
     def capture_frame(self):
         """ """
         with self._thread_lock:
-            if self.module_state() == "idle":
-                self.module_state.lock()
-                camera = self._camera()
-                camera.start_single_acquisition()
-                self._last_frame = camera.get_acquired_data()
-                self.module_state.unlock()
-                self.sigFrameChanged.emit(self._last_frame)
-                self.sigAcquisitionFinished.emit()
-            else:
+            if self.module_state() != "idle":
                 self.log.error(
                     "Unable to capture single frame. Acquisition still in progress."
                 )
+                return
+            self.module_state.lock()
+            camera = self._cam
+        # The locked module state keeps other acquisitions out; the mutex is
+        # only held for that bookkeeping, not across the acquisition itself.
+        try:
+            camera.start_single_acquisition()
+            self._last_frame = camera.get_acquired_data()
+        finally:
+            with self._thread_lock:
+                self.module_state.unlock()
+        self.sigFrameChanged.emit(self._last_frame)
+        self.sigAcquisitionFinished.emit()
 
     def toggle_video(self, start):
         if start:
@@ -209,12 +278,23 @@ class CameraLogic(LogicBase):
             if self.module_state() == "idle":
                 self.module_state.lock()
                 exposure = max(self._exposure, self._minimum_exposure_time)
-                camera = self._camera()
-                if camera.support_live_acquisition():
+                camera = self._cam
+                # Exposure and mode cannot change while the module is locked,
+                # so the video step uses these instead of re-deriving them
+                self._video_interval_ms = int(1000 * exposure)
+                self._video_retrigger = not camera.support_live_acquisition()
+                if not self._video_retrigger:
+                    register = getattr(camera, "register_frame_ready_callback", None)
+                    if register is not None:
+                        # Frames are pulled when the camera reports one, no timer
+                        self._frame_pending = False
+                        register(self.__on_frame_ready)
+                        self._frame_callback_active = True
                     camera.start_live_acquisition()
                 else:
                     camera.start_single_acquisition()
-                self.__timer.start(1000 * exposure)
+                if not self._frame_callback_active:
+                    self.__timer.start(self._video_interval_ms)
             else:
                 self.log.error(
                     "Unable to start video acquisition. Acquisition still in progress."
@@ -225,7 +305,11 @@ class CameraLogic(LogicBase):
         with self._thread_lock:
             if self.module_state() == "locked":
                 self.__timer.stop()
-                self._camera().stop_acquisition()
+                camera = self._cam
+                if self._frame_callback_active:
+                    camera.register_frame_ready_callback(None)
+                    self._frame_callback_active = False
+                camera.stop_acquisition()
                 self.module_state.unlock()
                 self.sigAcquisitionFinished.emit()
 
@@ -239,7 +323,7 @@ class CameraLogic(LogicBase):
                 self.log.error("Cannot snap: module not idle")
                 return None
 
-            camera = self._camera()
+            camera = self._cam
             if camera is None:
                 self.log.error("No camera hardware connected")
                 return None
@@ -254,7 +338,7 @@ class CameraLogic(LogicBase):
         @return bool: Success?
         """
         with self._thread_lock:
-            camera = self._camera()
+            camera = self._cam
             if camera is None:
                 self.log.error("No camera hardware connected")
                 return False
@@ -263,8 +347,10 @@ class CameraLogic(LogicBase):
 
     def toggle_continuous_acquisition(self, start, settings):
         if start:
+            # The SDK opens the file itself (ContAcqToFileStart), so the path is
+            # built once here and passed through; there is no fd to hand over.
             self._start_continuous_acquisition(
-                settings["directory"] + "/" + settings["filename_prefix"]
+                os.path.join(settings["directory"], settings["filename_prefix"])
             )
         else:
             self._stop_continuous_acquisition()
@@ -274,10 +360,18 @@ class CameraLogic(LogicBase):
             if self.module_state() == "idle":
                 self.module_state.lock()
                 exposure = max(self._exposure, self._minimum_exposure_time)
-                camera = self._camera()
+                camera = self._cam
                 if camera.support_live_acquisition():
                     camera.continuous_acquisition(filename)
                     self.total_bytes = 0
+                    self._cont_stop_event.clear()
+                    self._cont_thread = threading.Thread(
+                        target=self._cont_drain_loop,
+                        args=(camera,),
+                        name="camera_cont_drain",
+                        daemon=True,
+                    )
+                    self._cont_thread.start()
                 else:
                     camera.start_single_acquisition()
                 self.__timer_continuous.start(1000 * exposure)
@@ -290,7 +384,12 @@ class CameraLogic(LogicBase):
         with self._thread_lock:
             if self.module_state() == "locked":
                 self.__timer_continuous.stop()
-                self._camera().stop_continuous_acquisition()
+                # Let the drain thread finish its transfer before the file closes
+                self._cont_stop_event.set()
+                if self._cont_thread is not None:
+                    self._cont_thread.join()
+                    self._cont_thread = None
+                self._cam.stop_continuous_acquisition()
                 self.module_state.unlock()
                 self.sigAcquisitionFinished.emit()
 
@@ -298,15 +397,15 @@ class CameraLogic(LogicBase):
         """Capture background image for background subtraction"""
         with self._thread_lock:
             if self.module_state() == "idle":
-                camera = self._camera()
+                if not self._caps["bg_capture"]:
+                    self.log.error("capture_background_image method not implemented")
+                    return False
+                camera = self._cam
                 try:
                     result = camera.capture_background_image()
                     if not result:
                         self.log.warning("Failed to capture background image")
                     return result
-                except AttributeError:
-                    self.log.error("capture_background_image method not implemented")
-                    return False
                 except Exception as e:
                     self.log.error(f"Error capturing background image: {e}")
                     return False
@@ -322,15 +421,15 @@ class CameraLogic(LogicBase):
         Can be toggled during live acquisition since it's software-based.
         """
         with self._thread_lock:
-            camera = self._camera()
+            if not self._caps["bg_sub"]:
+                self.log.error("enable_background_subtraction method not implemented")
+                return False
+            camera = self._cam
             try:
                 result = camera.enable_background_subtraction()
                 if not result:
                     self.log.warning("Failed to enable background subtraction")
                 return result
-            except AttributeError:
-                self.log.error("enable_background_subtraction method not implemented")
-                return False
             except Exception as e:
                 self.log.error(f"Error enabling background subtraction: {e}")
                 return False
@@ -341,15 +440,15 @@ class CameraLogic(LogicBase):
         Can be toggled during live acquisition since it's software-based.
         """
         with self._thread_lock:
-            camera = self._camera()
+            if not self._caps["bg_sub"]:
+                self.log.error("disable_background_subtraction method not implemented")
+                return False
+            camera = self._cam
             try:
                 result = camera.disable_background_subtraction()
                 if not result:
                     self.log.warning("Failed to disable background subtraction")
                 return result
-            except AttributeError:
-                self.log.error("disable_background_subtraction method not implemented")
-                return False
             except Exception as e:
                 self.log.error(f"Error disabling background subtraction: {e}")
                 return False
@@ -362,9 +461,8 @@ class CameraLogic(LogicBase):
         @param numpy.ndarray frame: Raw pixel data
         @return numpy.ndarray: Subtracted frame, or original if disabled / no background
         """
-        camera = self._camera()
-        if hasattr(camera, "apply_background_subtraction"):
-            return camera.apply_background_subtraction(frame)
+        if self._caps["bg_apply"]:
+            return self._cam.apply_background_subtraction(frame)
         return frame
 
     def toggle_background_subtraction(self, start):
@@ -372,12 +470,7 @@ class CameraLogic(LogicBase):
 
         Software-based subtraction is applied to each frame without requiring video restart.
         """
-        camera = self._camera()
-        # Check if background subtraction methods are available
-        if not (
-            hasattr(camera, "enable_background_subtraction")
-            and callable(getattr(camera, "enable_background_subtraction", None))
-        ):
+        if not self._caps["bg_sub"]:
             self.log.warning("Background subtraction not available for this camera")
             return
 
@@ -386,37 +479,96 @@ class CameraLogic(LogicBase):
         else:
             self.disable_background_subtraction()
 
+    def _pool_frame(self, frame):
+        """Copy a live frame into the next slot of the frame pool.
+
+        The camera overwrites its own output buffer on every fetch; the pool
+        keeps the frame the GUI is still drawing intact while the next one is
+        fetched, without allocating a new array per frame.
+
+        @param numpy.ndarray frame: frame returned by the camera
+        @return numpy.ndarray: pooled copy of the frame
+        """
+        buf = self._frame_pool[self._pool_idx]
+        if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+            buf = self._frame_pool[self._pool_idx] = np.empty_like(frame)
+        np.copyto(buf, frame)
+        self._pool_idx ^= 1
+        return buf
+
+    def __on_frame_ready(self):
+        """Frame-ready callback, runs in the camera's grab thread."""
+        # Coalesce: one queued fetch at a time, however fast frames arrive
+        if not self._frame_pending:
+            self._frame_pending = True
+            self._sigFrameReady.emit()
+
     def __acquire_video_frame(self):
         """Execute step in the data recording loop: save one of each control and process values"""
         with self._thread_lock:
-            camera = self._camera()
-            self._last_frame = camera.get_acquired_data()
-            self.sigFrameChanged.emit(self._last_frame)
-            if self.module_state() == "locked":
-                exposure = max(self._exposure, self._minimum_exposure_time)
-                self.__timer.start(1000 * exposure)
-                if not camera.support_live_acquisition():
+            self._frame_pending = False
+            # A frame-ready signal queued before _stop_video() arrives after the
+            # camera is idle; fetching then would replace the last frame with a
+            # blank one.
+            if self.module_state() != "locked":
+                return
+            camera = self._cam
+        # Fetch and emit outside the mutex so setters are not serialized
+        # against frame delivery to the GUI.
+        self._last_frame = self._pool_frame(camera.get_acquired_data())
+        self.sigFrameChanged.emit(self._last_frame)
+        with self._thread_lock:
+            if self.module_state() == "locked" and not self._frame_callback_active:
+                self.__timer.start(self._video_interval_ms)
+                if self._video_retrigger:
                     camera.start_single_acquisition()  # the hardware has to check it's not busy
 
     def __acquire_continuous_frame(self):
         """Execute step in the data recording loop: save one of each control and process values"""
+        # Emit the last cached live frame (with background subtraction applied)
+        # so the GUI preview stays responsive during continuous acquisition
+        frame = self._pool_frame(self._cam.get_acquired_data())
+        self._last_frame = frame
+        self.sigFrameChanged.emit(frame)
         with self._thread_lock:
-            camera = self._camera()
-            self.total_bytes = self.total_bytes + camera.get_continuous_memory()
-            # Emit the last cached live frame (with background subtraction applied)
-            # so the GUI preview stays responsive during continuous acquisition
-            frame = camera.get_acquired_data()
-            self._last_frame = frame
-            self.sigFrameChanged.emit(frame)
             if self.module_state() == "locked":
-                self.__timer_continuous.start(
-                    1
-                )  # wait 1 ms before clearing camera memory
+                self.__timer_continuous.start(self._CONT_PREVIEW_INTERVAL_MS)
+
+    def _cont_drain_loop(self, camera):
+        """Drain the camera memory to disk until _cont_stop_event is set.
+
+        Runs in its own thread: the SDK writes each transfer to the file inside
+        get_continuous_memory(), so the Qt event loop never blocks on disk I/O.
+        The SDK requires the memory to be drained as fast as possible, a full
+        camera memory loses data. If draining fails, the acquisition is
+        stopped from the Qt thread (see _sigContDrainFailed).
+        """
+        while not self._cont_stop_event.is_set():
+            try:
+                self.total_bytes += camera.get_continuous_memory()
+            except Exception as e:
+                self.log.error(
+                    f"Continuous acquisition drain failed, stopping acquisition: {e}"
+                )
+                self._sigContDrainFailed.emit()
+                return
+            # 1 ms wait between transfers, as fast as the SDK asks for
+            self._cont_stop_event.wait(0.001)
 
     def create_tag(self, time_stamp):
         return f"{time_stamp}_captured_frame"
 
     def draw_2d_image(self, data, cbar_range=None):
+        # Imported here: pyplot is slow to import and only needed for saving
+        import matplotlib.pyplot as plt
+
+        if cbar_range is None:
+            if np.issubdtype(data.dtype, np.integer):
+                # Integer counts cannot be NaN; skip the NaN-aware scans
+                cbar_range = (data.min(), data.max())
+            else:
+                cbar_range = (np.nanmin(data), np.nanmax(data))
+
         # Create image plot
         fig, ax = plt.subplots()
         cfimage = ax.imshow(
@@ -424,10 +576,10 @@ class CameraLogic(LogicBase):
             cmap="inferno",  # FIXME: reference the right place in qudi
             origin="lower",
             interpolation="none",
+            vmin=cbar_range[0],
+            vmax=cbar_range[1],
         )
 
-        if cbar_range is None:
-            cbar_range = (np.nanmin(data), np.nanmax(data))
         cbar = plt.colorbar(cfimage, shrink=0.8)
         cbar.ax.tick_params(which="both", length=0)
         return fig
@@ -444,7 +596,10 @@ class CameraLogic(LogicBase):
         """
         with self._thread_lock:
             if self.module_state() == "idle":
-                camera = self._camera()
+                if not self._caps["hw_integration"]:
+                    self.log.error("set_hardware_integration method not implemented")
+                    return
+                camera = self._cam
                 try:
                     result = camera.set_hardware_integration(integration_seconds)
                     if result:
@@ -455,8 +610,6 @@ class CameraLogic(LogicBase):
                         self.log.warning(
                             "Failed to set hardware integration (may be in Normal mode)"
                         )
-                except AttributeError:
-                    self.log.error("set_hardware_integration method not implemented")
                 except Exception as e:
                     self.log.error(f"Error setting hardware integration: {e}")
             else:
@@ -474,7 +627,7 @@ class CameraLogic(LogicBase):
         """
         with self._thread_lock:
             if self.module_state() == "idle":
-                camera = self._camera()
+                camera = self._cam
                 try:
                     camera.set_binning(binning)
                     # Update exposure time from hardware
@@ -492,51 +645,47 @@ class CameraLogic(LogicBase):
 
         @return int: Current binning value
         """
-        with self._thread_lock:
-            camera = self._camera()
-            try:
-                return camera.get_binning()
-            except Exception as e:
-                self.log.error(f"Error getting binning: {e}")
-                return 1
+        camera = self._cam
+        try:
+            return camera.get_binning()
+        except Exception as e:
+            self.log.error(f"Error getting binning: {e}")
+            return 1
 
     def get_default_save_directory(self):
         """Get the default save directory from hardware config.
 
         @return str: Default save directory path, or empty string if not configured.
         """
-        with self._thread_lock:
-            camera = self._camera()
-            try:
-                return camera.get_default_save_directory()
-            except Exception:
-                return ""
+        camera = self._cam
+        try:
+            return camera.get_default_save_directory()
+        except Exception:
+            return ""
 
     def get_trigger_mode(self):
         """Get the current trigger mode.
 
         @return str: 'no_trigger', 'single_trigger', or 'multiple_trigger'
         """
-        with self._thread_lock:
-            camera = self._camera()
-            try:
-                return camera.get_trigger_mode()
-            except Exception as e:
-                self.log.error(f"Error getting trigger mode: {e}")
-                return "no_trigger"
+        camera = self._cam
+        try:
+            return camera.get_trigger_mode()
+        except Exception as e:
+            self.log.error(f"Error getting trigger mode: {e}")
+            return "no_trigger"
 
     def get_trigger_frames_per_pulse(self):
         """Get the number of frames per trigger pulse.
 
         @return int: Frames per pulse (1-100)
         """
-        with self._thread_lock:
-            camera = self._camera()
-            try:
-                return camera.get_trigger_frames_per_pulse()
-            except Exception as e:
-                self.log.error(f"Error getting trigger frames per pulse: {e}")
-                return 1
+        camera = self._cam
+        try:
+            return camera.get_trigger_frames_per_pulse()
+        except Exception as e:
+            self.log.error(f"Error getting trigger frames per pulse: {e}")
+            return 1
 
     def set_trigger_mode(self, mode, frames_per_pulse=1):
         """Set the trigger mode and apply it to hardware.
@@ -550,7 +699,7 @@ class CameraLogic(LogicBase):
                     "Cannot change trigger mode while acquisition is running."
                 )
                 return
-            camera = self._camera()
+            camera = self._cam
             try:
                 camera.set_trigger_mode(mode, frames_per_pulse)
             except Exception as e:
@@ -565,7 +714,10 @@ class CameraLogic(LogicBase):
         @return bool: True if load successful, False otherwise
         """
         with self._thread_lock:
-            camera = self._camera()
+            if not self._caps["load_file"]:
+                self.log.error("load_acquisition_file method not implemented")
+                return False
+            camera = self._cam
             try:
                 result = camera.load_acquisition_file(filepath)
                 if not result:
@@ -580,13 +732,12 @@ class CameraLogic(LogicBase):
 
         @return int: Number of frames, or 0 if no file loaded
         """
-        with self._thread_lock:
-            camera = self._camera()
-            try:
-                return camera.get_loaded_frame_count()
-            except Exception as e:
-                self.log.error(f"Error getting frame count: {e}")
-                return 0
+        camera = self._cam
+        try:
+            return camera.get_loaded_frame_count()
+        except Exception as e:
+            self.log.error(f"Error getting frame count: {e}")
+            return 0
 
     def get_loaded_frame(self, frame_index):
         """Get a specific frame from the loaded continuous acquisition file
@@ -595,7 +746,7 @@ class CameraLogic(LogicBase):
         @return numpy.ndarray: Frame data (rows, cols), or None if error
         """
         with self._thread_lock:
-            camera = self._camera()
+            camera = self._cam
             try:
                 return camera.get_loaded_frame(frame_index)
             except Exception as e:
@@ -607,26 +758,24 @@ class CameraLogic(LogicBase):
 
         @return int: Current frame index, or -1 if no file loaded
         """
-        with self._thread_lock:
-            camera = self._camera()
-            try:
-                return camera.get_current_frame_index()
-            except Exception as e:
-                self.log.error(f"Error getting current frame index: {e}")
-                return -1
+        camera = self._cam
+        try:
+            return camera.get_current_frame_index()
+        except Exception as e:
+            self.log.error(f"Error getting current frame index: {e}")
+            return -1
 
     def get_loaded_filepath(self):
         """Get the path of the currently loaded file
 
         @return str: File path, or None if no file loaded
         """
-        with self._thread_lock:
-            camera = self._camera()
-            try:
-                return camera.get_loaded_filepath()
-            except Exception as e:
-                self.log.error(f"Error getting loaded filepath: {e}")
-                return None
+        camera = self._cam
+        try:
+            return camera.get_loaded_filepath()
+        except Exception as e:
+            self.log.error(f"Error getting loaded filepath: {e}")
+            return None
 
     def get_loaded_background(self):
         """Return the background image associated with the currently loaded file.
@@ -636,13 +785,12 @@ class CameraLogic(LogicBase):
 
         @return numpy.ndarray or None: float32 (rows, cols), or None if absent
         """
-        with self._thread_lock:
-            camera = self._camera()
-            try:
-                return camera.get_loaded_background()
-            except Exception as e:
-                self.log.error(f"Error getting loaded background: {e}")
-                return None
+        camera = self._cam
+        try:
+            return camera.get_loaded_background()
+        except Exception as e:
+            self.log.error(f"Error getting loaded background: {e}")
+            return None
 
     def load_frames_from_memory(self, frames):
         """Load frames directly from memory for viewing
@@ -651,7 +799,7 @@ class CameraLogic(LogicBase):
         @return bool: Success?
         """
         with self._thread_lock:
-            camera = self._camera()
+            camera = self._cam
             try:
                 return camera.load_frames_from_memory(frames)
             except Exception as e:
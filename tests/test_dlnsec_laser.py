@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the DLnsec serial driver (dlnsec_laser.py) without a laser.
+
+Copyright (c) 2021, the qudi developers. See the AUTHORS.md file at the top-level directory of this
+distribution and on <https://github.com/Ulm-IQO/qudi-iqo-modules/>
+
+This file is part of qudi.
+
+Qudi is free software: you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation,
+either version 3 of the License, or (at your option) any later version.
+
+Qudi is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with qudi.
+If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from qudi.hardware.laser import dlnsec_laser
+
+
+class FakeLaser:
+    """Stand-in for DLnsec that only records the port it was opened on."""
+
+    def __init__(self, port):
+        self.port = port
+
+
+@pytest.fixture
+def scan(monkeypatch):
+    """Two lasers on the bus; returns the list of performed port scans."""
+    scans = []
+
+    def find_laser():
+        scans.append(True)
+        return {1: ("COM3", "11111", "DLNSEC"), 2: ("COM5", "22222", "DLNSEC")}
+
+    monkeypatch.setattr(dlnsec_laser, "DLnsec", FakeLaser)
+    monkeypatch.setattr(dlnsec_laser, "find_laser", find_laser)
+    monkeypatch.setattr(dlnsec_laser, "open_connections", {})
+    monkeypatch.setattr(dlnsec_laser, "_discovered", {})
+    return scans
+
+
+@pytest.mark.parametrize("port", ["COM4", "com12", "/dev/ttyUSB0"])
+def test_connect_port_name_opens_directly(scan, port):
+    laser = dlnsec_laser.connect(port)
+    assert laser.port == port
+    assert not scan
+    # An open port is returned again instead of being reopened
+    assert dlnsec_laser.connect(port) is laser
+
+
+def test_connect_serial_number_resolves_port(scan):
+    assert dlnsec_laser.connect("22222").port == "COM5"
+    assert dlnsec_laser.connect("11111").port == "COM3"
+    # The ports are scanned only once
+    assert len(scan) == 1
+
+
+def test_connect_default_picks_unopened_laser(scan):
+    first = dlnsec_laser.connect()
+    second = dlnsec_laser.connect()
+    assert {first.port, second.port} == {"COM3", "COM5"}
+    with pytest.raises(RuntimeError, match="No more un-connected lasers"):
+        dlnsec_laser.connect()
+    assert len(scan) == 1
+
+
+def test_connect_default_skips_port_opened_by_name(scan):
+    dlnsec_laser.connect("COM5")
+    assert dlnsec_laser.connect().port == "COM3"
+
+
+def test_connect_unknown_serial_number(scan):
+    with pytest.raises(RuntimeError, match="33333"):
+        dlnsec_laser.connect("33333")
+
+
+def test_connect_without_lasers(scan, monkeypatch):
+    monkeypatch.setattr(dlnsec_laser, "find_laser", lambda: {})
+    with pytest.raises(RuntimeError, match="No lasers found"):
+        dlnsec_laser.connect()
+
+
+class FakeSerial:
+    """Serial port replying with a fixed byte string to every command."""
+
+    reply = b""
+
+    def __init__(self, **kwargs):
+        self.timeout = kwargs.get("timeout")
+        self.written = []
+
+    def reset_input_buffer(self):
+        pass
+
+    def write(self, data):
+        self.written.append(data)
+
+    def read_until(self, expected=b"\n", size=None):
+        return self.reply[:size]
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_laser(monkeypatch):
+    def make(reply):
+        monkeypatch.setattr(FakeSerial, "reply", reply)
+        return dlnsec_laser.DLnsec("COM9")
+
+    monkeypatch.setattr(dlnsec_laser.serial, "Serial", FakeSerial)
+    return make
+
+
+@pytest.mark.parametrize(
+    "reply, power",
+    [(b"57\r", 57), (b" 100 \r", 100), (b"0\r", 0), (b"PWR 42\r", 42), (b"\n33\r", 33)],
+)
+def test_get_power_parses_reply(make_laser, reply, power):
+    laser = make_laser(reply)
+    assert laser.get_power() == power
+    assert laser.powerset == power
+    assert laser.serial.written == [b"PWR?\n"]
+
+
+def test_get_power_rejects_reply_without_number(make_laser):
+    with pytest.raises(ValueError):
+        make_laser(b"ERR\r").get_power()
+
+
+def test_get_power_times_out_without_reply(make_laser):
+    with pytest.raises(TimeoutError):
+        make_laser(b"").get_power()
+
+
+def test_reply_timeout_is_configurable(make_laser, monkeypatch):
+    monkeypatch.setattr(dlnsec_laser.serial, "Serial", FakeSerial)
+    laser = dlnsec_laser.DLnsec("COM9", reply_timeout=2.5)
+    assert laser.serial.timeout == 2.5
+    assert make_laser(b"1\r").serial.timeout == dlnsec_laser.DLnsec.reply_timeout
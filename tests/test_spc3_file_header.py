@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the .spc3 data file header decoding and reading in the SPC3 SDK wrapper (spc.py).
+
+The files are synthetic: the header fields are written at the byte offsets documented in
+SPC3.SaveImgDisk(), independently of the struct layout used for decoding.
+
+Copyright (c) 2021, the qudi developers. See the AUTHORS.md file at the top-level directory of this
+distribution and on <https://github.com/Ulm-IQO/qudi-iqo-modules/>
+
+This file is part of qudi.
+
+Qudi is free software: you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation,
+either version 3 of the License, or (at your option) any later version.
+
+Qudi is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with qudi.
+If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import struct
+
+import numpy as np
+import pytest
+
+from qudi.hardware.camera.SPC3.spc import SPC3, _decode_spc3_header
+
+SIGNATURE = bytes.fromhex('4d5044ff03000001')
+HEADER_SIZE = 8 + 1024
+
+# (metadata offset, struct format, raw value) as documented in SPC3.SaveImgDisk()
+FIELDS = {
+    'camera_id': (0, '10s', b'SPC3-0042'),
+    'SN': (10, '32s', b'1234567890A'),
+    'FW_VER': (42, '<H', 123),
+    'custom_ver': (44, 'B', 2),
+    'date_time': (45, '20s', b'2024-01-02 03:04:05'),
+    'N_rows': (100, 'B', 2),
+    'N_cols': (101, 'B', 32),
+    'bit_x_pix': (102, 'B', 16),
+    'N_counters': (103, 'B', 1),
+    'HwIntTime': (104, '<H', 50),
+    'SummedFrames': (106, '<H', 7),
+    'DeadTimeCorrectionON': (108, 'B', 1),
+    'GateDuty_C1': (109, 'B', 40),
+    'HoldOff': (110, '<H', 20),
+    'N_frames': (114, '<I', 3),
+    'N_pix': (126, '<H', 64),
+    'FLIM_ON': (200, 'B', 1),
+    'FLIM_steps': (203, '<H', 9),
+    'FLIM_frameLen': (205, '<I', 1000),
+    'MultiGate_start_pos': (221, '<h', -250),
+    'CoarseGate_C2_ON': (237, 'B', 1),
+    'CoarseGate_C2_stopPos': (240, '<H', 77),
+    'PDE_step': (305, '<H', 5),
+}
+
+
+def make_header(**overrides):
+    buf = bytearray(HEADER_SIZE)
+    buf[:8] = SIGNATURE
+    for name, (offset, fmt, value) in FIELDS.items():
+        struct.pack_into(fmt, buf, 8 + offset, overrides.get(name, value))
+    return bytes(buf)
+
+
+def write_spc3(path, data, **overrides):
+    with open(path, 'wb') as f:
+        f.write(make_header(**overrides))
+        f.write(np.asarray(data, dtype='<u2').tobytes())
+    return path
+
+
+def test_decode_header_fields():
+    header = _decode_spc3_header(make_header())
+    assert header.camera_id == 'SPC3-0042'
+    assert header.SN == '1234567890A'
+    assert header.FW_VER == pytest.approx(1.23)
+    assert header.custom_ver == 'C'
+    assert header.date_time == '2024-01-02 03:04:05'
+    assert (header.N_rows, header.N_cols, header.bit_x_pix) == (2, 32, 16)
+    assert (header.N_counters, header.N_frames, header.N_pix) == (1, 3, 64)
+    assert header.HwIntTime == pytest.approx(500e-9)
+    assert header.SummedFrames == 7
+    assert header.DeadTimeCorrectionON is True
+    assert header.GateDuty_C1 == 40
+    assert header.HoldOff == pytest.approx(20e-9)
+    assert header.BKGsubON is False
+    assert header.FLIM_ON is True
+    assert header.FLIM_steps == 9
+    assert header.FLIM_frameLen == pytest.approx(10e-6)
+    assert header.MultiGate_start_pos == -250
+    assert header.CoarseGate_C2_ON is True
+    assert header.CoarseGate_C2_stopPos == pytest.approx(770e-9)
+    assert header.PDE_step == pytest.approx(5e-9)
+
+
+def test_decode_header_from_larger_buffer():
+    # Only the header at the start of the buffer is decoded, pixel data may follow
+    header = _decode_spc3_header(make_header() + bytes(128))
+    assert header.N_pix == 64
+
+
+@pytest.mark.parametrize('memmap', [False, True])
+def test_read_spc3_data_file(tmp_path, memmap):
+    data = np.arange(3 * 64)
+    path = write_spc3(tmp_path / 'acq.spc3', data)
+    frames, header = SPC3.ReadSPC3DataFile(str(path), memmap=memmap)
+    assert header.N_frames == 3
+    # (counters, frames, cols, rows), pixel rows of 32 are swapped to columns
+    assert frames.shape == (1, 3, 32, 2)
+    np.testing.assert_array_equal(frames[0, 1], data[64:128].reshape(2, 32).T)
+
+
+def test_read_spc3_data_file_clamps_to_frames_present(tmp_path):
+    # An interrupted acquisition leaves fewer frames than the header announces
+    path = write_spc3(tmp_path / 'short.spc3', np.arange(2 * 64))
+    frames, header = SPC3.ReadSPC3DataFile(str(path))
+    assert header.N_frames == 3
+    assert frames.shape == (1, 2, 32, 2)
+
+
+@pytest.mark.parametrize('size', [0, 100, HEADER_SIZE - 1])
+def test_read_spc3_data_file_too_short(tmp_path, size):
+    path = tmp_path / 'broken.spc3'
+    path.write_bytes(make_header()[:size])
+    with pytest.raises(ValueError, match='too short'):
+        SPC3.ReadSPC3DataFile(str(path))
+
+
+def test_read_spc3_data_file_invalid_bit_width(tmp_path):
+    path = write_spc3(tmp_path / 'bits.spc3', np.arange(64), bit_x_pix=12)
+    with pytest.raises(ValueError, match='bit width'):
+        SPC3.ReadSPC3DataFile(str(path))
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+Hardware-free tests of the legacy SPC3 camera module (spc3_qudi_old).
+
+The module instance is created without activation; only the attributes used by the tested
+methods are set up, so neither the SDK nor a camera is needed.
+
+Copyright (c) 2021, the qudi developers. See the AUTHORS.md file at the top-level directory of this
+distribution and on <https://github.com/Ulm-IQO/qudi-iqo-modules/>
+
+This file is part of qudi.
+
+Qudi is free software: you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation,
+either version 3 of the License, or (at your option) any later version.
+
+Qudi is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with qudi.
+If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from qudi.hardware.camera.SPC3.spc3_qudi_old import SPC3_Qudi
+
+FRAME_SHAPE = (4, 3)
+
+
+class RacingRing(list):
+    """Live ring whose slot reads let the producer publish *advances* frames meanwhile."""
+
+    def __init__(self, camera, slots, advances):
+        super().__init__(slots)
+        self._camera = camera
+        self._advances = list(advances)
+
+    def __getitem__(self, index):
+        if self._advances:
+            self._camera._frames_captured += self._advances.pop(0)
+        return super().__getitem__(index)
+
+
+@pytest.fixture
+def camera():
+    cam = SPC3_Qudi.__new__(SPC3_Qudi)
+    cam._spc3_lock = threading.RLock()
+    cam._frames_captured = 10
+    cam._ring_idx = 1
+    return cam
+
+
+def make_slots():
+    return [np.full(FRAME_SHAPE, i, dtype=np.uint16) for i in range(3)]
+
+
+def test_copy_latest_live_frame_without_race(camera):
+    camera._ring = make_slots()
+    out = np.empty(FRAME_SHAPE, dtype=np.uint16)
+    assert camera._copy_latest_live_frame(out) == 10
+    assert np.all(out == 1)
+
+
+def test_copy_latest_live_frame_accepts_producer_on_other_slot(camera):
+    # One new frame goes to another slot, the published one stays intact
+    camera._ring = RacingRing(camera, make_slots(), advances=[1])
+    out = np.empty(FRAME_SHAPE, dtype=np.uint16)
+    assert camera._copy_latest_live_frame(out) == 10
+    assert np.all(out == 1)
+
+
+def test_copy_latest_live_frame_retries_overwritten_slot(camera):
+    # Two new frames in a three-slot ring may have overwritten the copied slot
+    camera._ring = RacingRing(camera, make_slots(), advances=[2, 0])
+    out = np.empty(FRAME_SHAPE, dtype=np.uint16)
+    assert camera._copy_latest_live_frame(out) == 12
+
+
+def test_copy_latest_live_frame_falls_back_to_lock(camera):
+    camera._ring = RacingRing(camera, make_slots(), advances=[2, 2, 2, 0])
+    out = np.empty(FRAME_SHAPE, dtype=np.uint16)
+    assert camera._copy_latest_live_frame(out, attempts=3) == 16
+    assert np.all(out == 1)
+
+
+class FlakyApply:
+    """Stand-in for _apply_camera_settings that fails the first *failures* calls."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("SDK rejected the settings")
+
+
+@pytest.fixture
+def settings_camera():
+    cam = SPC3_Qudi.__new__(SPC3_Qudi)
+    cam._state_lock = threading.RLock()
+    cam._spc3_lock = threading.RLock()
+    cam._commit_timer = None
+    cam._settings_dirty = False
+    cam._batch_depth = 0
+    cam._destroyed = False
+    # The tests commit synchronously; the debounce timer must not fire meanwhile
+    cam._settings_debounce_s = 60
+    yield cam
+    if cam._commit_timer is not None:
+        cam._commit_timer.cancel()
+
+
+def test_commit_without_changes_does_not_touch_hardware(settings_camera):
+    settings_camera._apply_camera_settings = apply = FlakyApply()
+    settings_camera._commit_settings()
+    assert apply.calls == 0
+
+
+def test_failed_commit_keeps_changes_pending(settings_camera):
+    settings_camera._apply_camera_settings = apply = FlakyApply(failures=1)
+    assert settings_camera._mark_settings_dirty()
+    with pytest.raises(RuntimeError):
+        settings_camera._commit_settings()
+    assert settings_camera._settings_dirty
+    assert isinstance(settings_camera._commit_error, RuntimeError)
+    # The next setter reports the failed commit but still records its change
+    assert not settings_camera._mark_settings_dirty()
+    assert settings_camera._settings_dirty
+    # The retry pushes the pending changes and clears the error
+    settings_camera._commit_settings()
+    assert apply.calls == 2
+    assert not settings_camera._settings_dirty
+    assert settings_camera._commit_error is None
+    assert settings_camera._mark_settings_dirty()
+
+
+def test_batch_update_commits_once(settings_camera):
+    settings_camera._apply_camera_settings = apply = FlakyApply()
+    with settings_camera.batch_update():
+        settings_camera._mark_settings_dirty()
+        with settings_camera.batch_update():
+            settings_camera._mark_settings_dirty()
+        assert settings_camera._commit_timer is None
+        assert apply.calls == 0
+    assert apply.calls == 1
+    assert not settings_camera._settings_dirty
+
+
+def test_batch_update_raises_failed_commit(settings_camera):
+    settings_camera._apply_camera_settings = FlakyApply(failures=1)
+    with pytest.raises(RuntimeError):
+        with settings_camera.batch_update():
+            settings_camera._mark_settings_dirty()
+    assert settings_camera._settings_dirty
+    assert settings_camera._commit_error is not None